@@ -1,76 +1,67 @@
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
 import time
+_import_started = time.perf_counter()  # Import time is logged by start_run()
 import random
-import pdfplumber
 import re
-import requests
-import pytesseract
-from PIL import Image
-import io
 import threading
 import os
-from dotenv import load_dotenv
-from groq import Groq
+import logging
+from autobot import DATA_DIR, data_path
+from autobot.context import CONTEXT
+from autobot.llm_backends import question_type
+from autobot.llm_client import LLMUnavailable
+from autobot.waits import (reset_wait_timings, start_param, wait_for_cards_stable, wait_for_selector,
+                           wait_for_start_change, wait_for_url_change, wait_summary, wait_until)
+from autobot.job_cards import CardHarvester, card_link, read_job_details
+from autobot.session import is_login_url
+from autobot.form_snapshot import take_snapshot, fields_of_kind, field_locator
+from autobot.batch_answers import parse_batch_response
+from autobot import metrics
+from autobot.metrics import span, timed
+from autobot.events import log, setup_logging
 
-# Load environment variables
-load_dotenv()
+# Importing this module has no side effects: settings, the CV and the shared
+# stores live in CONTEXT (autobot/context.py) and are built on first use.
 
-# ===== Configuration Loading =====
-CONFIG_PATH = os.path.join(os.path.dirname(__file__), 'backend', 'config.json')
+def start_run():
+    """Set up logging and metrics, then build the shared objects before the browser starts.
 
-if os.path.exists(CONFIG_PATH):
-    print(f"Loading configuration from {CONFIG_PATH}")
-    with open(CONFIG_PATH, 'r') as f:
-        import json
-        config_data = json.load(f)
-        
-    EMAIL = config_data.get("linkedin_email", "")
-    PASSWORD = config_data.get("linkedin_password", "")
-    CV_PATH = config_data.get("cv_path", "")
-    GROQ_API_KEY = config_data.get("groq_api_key", "")
-    
-    USER_PREFERENCES = {
-        "salary_expectation": config_data.get("salary_expectation", 0),
-        "location": config_data.get("location", ""),
-        "commuting": config_data.get("commuting", ""),
-        "veteran_status": config_data.get("veteran_status", "No"),
-        "disability": config_data.get("disability", "No"),
-        "ethnicity": config_data.get("ethnicity", ""),
-        "gender": config_data.get("gender", ""),
-        "address": config_data.get("address", ""),
-        "zip_code": config_data.get("zip_code", ""),
-        "middle_name": config_data.get("middle_name", ""),
-        "phone": config_data.get("phone", "")
-    }
-else:
-    print("No config.json found. Reading from environment variables and defaults.")
-    EMAIL = os.getenv("LINKEDIN_EMAIL", "")
-    PASSWORD = os.getenv("LINKEDIN_PASSWORD", "")
-    CV_PATH = os.getenv("CV_PATH", "")
-    GROQ_API_KEY = os.getenv("GROQ_API_KEY", "")
-    
-    USER_PREFERENCES = {
-        "salary_expectation": int(os.getenv("SALARY_EXPECTATION", 0)),
-        "location": os.getenv("LOCATION", ""),
-        "commuting": os.getenv("COMMUTING", ""),
-        "veteran_status": os.getenv("VETERAN_STATUS", "No"),
-        "disability": os.getenv("DISABILITY", "No"),
-        "ethnicity": os.getenv("ETHNICITY", ""),
-        "gender": os.getenv("GENDER", ""),
-        "address": os.getenv("ADDRESS", ""),
-        "zip_code": os.getenv("ZIP_CODE", ""),
-        "middle_name": os.getenv("MIDDLE_NAME", ""),
-        "phone": os.getenv("PHONE", "")
-    }
-
-# Initialize Groq client
-groq_client = Groq(api_key=GROQ_API_KEY)
+    Safe to call more than once; returns the seconds spent building CONTEXT.
+    """
+    # Structured logs go to data/logs/autobot.jsonl and, unless disabled, the console
+    # (as JSON lines when the backend supervises the run)
+    setup_logging(
+        os.path.join(DATA_DIR, "logs"),
+        console=os.getenv("AUTOBOT_LOG_CONSOLE", "1") != "0",
+        json_console=os.getenv("AUTOBOT_EVENTS") == "stdout",
+        console_level=os.getenv("AUTOBOT_LOG_LEVEL", "INFO").upper(),
+    )
+
+    # One trace file per run; data/metrics.prom is what the backend serves at /metrics.
+    # A warm worker calls this before every run, so timings start from zero each time.
+    settings = CONTEXT.settings
+    run_suffix = f"-{CONTEXT.run_id}" if CONTEXT.run_id else ""
+    trace_path = data_path("traces", time.strftime("run-%Y%m%d-%H%M%S") + f"{run_suffix}.jsonl")
+    if settings.metrics_enabled and not metrics.RECORDER.enabled:
+        metrics.configure(True, trace_path=trace_path, metrics_path=data_path(metrics.METRICS_FILENAME))
+    elif settings.metrics_enabled:
+        metrics.RECORDER.reset(trace_path)
+    elif metrics.RECORDER.enabled:
+        metrics.RECORDER.flush()
+        metrics.configure(False)
+    reset_wait_timings()
+
+    with span("context_init"):
+        context_seconds = CONTEXT.warm()
+    log.event("startup", f"⏱️ Startup: import {IMPORT_SECONDS * 1000:.0f} ms, "
+                         f"context {context_seconds * 1000:.0f} ms",
+              import_ms=round(IMPORT_SECONDS * 1000, 1), context_ms=round(context_seconds * 1000, 1))
+    return context_seconds
 
 # =================================================
 
 def human_delay(min_seconds=1, max_seconds=3):
-    """Simulate human-like delay with randomization."""
-    delay = random.uniform(min_seconds, max_seconds)
+    """Simulate human-like delay with randomization (scaled by the pacing_scale setting)."""
+    delay = random.uniform(min_seconds, max_seconds) * CONTEXT.settings.pacing_scale
     time.sleep(delay)
     return delay
 
@@ -80,71 +71,48 @@ def typing_delay(text_length):
     chars_per_second = random.uniform(3, 5)
     delay = text_length / chars_per_second
     # Add some randomness (pauses while thinking)
-    delay *= random.uniform(1.0, 1.5)
+    delay *= random.uniform(1.0, 1.5) * CONTEXT.settings.pacing_scale
     time.sleep(delay)
     return delay
 
 def fill_like_human(field, text):
     """Fill a field with human-like typing simulation."""
     field.click()  # Click to focus
-    time.sleep(random.uniform(0.2, 0.5))  # Slight pause after clicking
+    human_delay(0.2, 0.5)  # Slight pause after clicking
     
     # Clear existing content slowly if any
     current = field.input_value()
     if current:
         field.fill("")
-        time.sleep(random.uniform(0.3, 0.7))
+        human_delay(0.3, 0.7)
     
     # Type character by character with variable speed
     for i, char in enumerate(text):
         field.fill(text[:i+1])
         # Random delay between keystrokes (0.05 to 0.25 seconds)
-        time.sleep(random.uniform(0.05, 0.25))
+        human_delay(0.05, 0.25)
         
         # Occasional longer pauses (simulating thinking)
         if random.random() < 0.15:  # 15% chance
-            time.sleep(random.uniform(0.5, 1.5))
+            human_delay(0.5, 1.5)
     
     # Short pause after finishing typing
-    time.sleep(random.uniform(0.3, 0.8))
-
-# Extract text from CV PDF
-def extract_cv_text(pdf_path):
-    """Extract text from the CV PDF."""
-    try:
-        with pdfplumber.open(pdf_path) as pdf:
-            cv_text = ""
-            for page in pdf.pages:
-                cv_text += page.extract_text() or ""
-        return cv_text
-    except Exception as e:
-        print(f"Error extracting CV text: {e}")
-        return ""
-
-CV_TEXT = extract_cv_text(CV_PATH)
-if not CV_TEXT:
-    raise ValueError("CV text extraction failed. Please check the PDF path and content.")
+    human_delay(0.3, 0.8)
 
-# Local LLM client function
-def call_local_llm(prompt, system_prompt="You are a helpful assistant for job applications."):
-    """Call the Groq API."""
-    try:
-        chat_completion = groq_client.chat.completions.create(
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": prompt}
-            ],
-            model="llama-3.3-70b-versatile",  # or "mixtral-8x7b-32768" or "llama-3.1-70b-versatile"
-            temperature=0.1,
-            max_tokens=100,
-        )
-        return chat_completion.choices[0].message.content.strip()
-    except Exception as e:
-        print(f"Error calling Groq API: {e}")
-        return None
+# LLM call, routed to the backend configured for the question type
+@timed("llm_call")
+def call_local_llm(prompt):
+    """Send a compiled prompt to its backend; raises LLMUnavailable when it gives no answer after retries."""
+    return CONTEXT.llm_router.complete(
+        prompt.qtype,
+        prompt.messages,
+        max_tokens=prompt.max_tokens,
+        stop=prompt.stop,
+        response_format=prompt.response_format,
+    )
 
-# OCR function to read text from screenshots
-def ocr_screenshot(page, element=None):
+@timed("ocr")
+def ocr_screenshot(page, element=None, mode=None):
     """Take screenshot and extract text using OCR."""
     try:
         if element:
@@ -152,213 +120,301 @@ def ocr_screenshot(page, element=None):
         else:
             screenshot_bytes = page.screenshot()
         
-        image = Image.open(io.BytesIO(screenshot_bytes))
-        text = pytesseract.image_to_string(image)
-        return text.strip()
+        mode = mode or ("label" if element else "page")
+        start = time.perf_counter()
+        text = ocr_image_bytes(screenshot_bytes, mode)
+        log.event("ocr_call", level=logging.DEBUG, mode=mode, ms=round((time.perf_counter() - start) * 1000, 1),
+                  chars=len(text))
+        return text
     except Exception as e:
-        print(f"Error performing OCR: {e}")
+        log.error(f"Error performing OCR: {e}")
         return ""
 
-# Track processed jobs
-processed_jobs = set()
-applied_jobs = set()
-
-def is_specific_question(question, keywords):
-    """Check if the question contains any of the keywords."""
-    return any(keyword.lower() in question.lower() for keyword in keywords)
-
-def get_specific_response(question):
-    """Return hardcoded response for specific questions."""
-    question_lower = question.lower()
-    if is_specific_question(question, ["veteran", "military"]):
-        return USER_PREFERENCES["veteran_status"]
-    elif is_specific_question(question, ["disability", "disabled"]):
-        return USER_PREFERENCES["disability"]
-    elif is_specific_question(question, ["ethnicity", "race"]):
-        return USER_PREFERENCES["ethnicity"]
-    elif is_specific_question(question, ["gender"]):
-        return USER_PREFERENCES["gender"]
-    elif is_specific_question(question, ["location", "commute", "relocate", "address"]):
-        return USER_PREFERENCES["address"]
-    elif is_specific_question(question, ["phone", "mobile", "contact number"]):
-        return USER_PREFERENCES["phone"]
-    elif is_specific_question(question, ["zip", "postal"]):
-        return USER_PREFERENCES["zip_code"]
-    return None
+def ocr_image_bytes(screenshot_bytes, mode="label"):
+    """Extract text from PNG bytes via the cached OCR engine."""
+    return CONTEXT.ocr_engine.text(screenshot_bytes, mode)
 
-def get_llm_response(question, previous_response=None, error_message=None):
-    """Get a response from local LLM for text fields."""
-    specific_response = get_specific_response(question)
-    if specific_response:
-        print(f"Using hardcoded response for '{question}': {specific_response}")
-        return specific_response
+def get_specific_response(question, kind="text"):
+    """Return the rule-based (hardcoded / profile) response for a question, if any."""
+    rule, answer = CONTEXT.question_rules.resolve(question, kind, CONTEXT.settings.preferences)
+    return answer
 
-    question_lower = question.lower()
-    numerical_keywords = ["year", "years", "experience", "how many", "number of"]
-    is_numerical = any(keyword in question_lower for keyword in numerical_keywords)
-
-    if is_numerical:
-        experience_pattern = r"(\d+)\s*(?:year|years)\s*(?:of\s*experience|in\s*\w+)"
-        matches = re.findall(experience_pattern, CV_TEXT.lower())
-        if matches:
-            years = max(int(match) for match in matches)
-            print(f"Found {years} years of experience in CV for '{question}'")
-            return str(years)
+def get_local_answer(question):
+    """Answer a text question from preferences or the CV without calling the LLM."""
+    rule, answer = CONTEXT.question_rules.resolve(question, "text", CONTEXT.settings.preferences)
+    if answer:
+        log.debug(f"Using hardcoded response for '{question}': {answer}")
+        return answer
+
+    if rule and rule.get("type") == "numeric":
+        if CONTEXT.cv_years_of_experience is not None:
+            log.debug(f"Found {CONTEXT.cv_years_of_experience} years of experience in CV for '{question}'")
+            return str(CONTEXT.cv_years_of_experience)
         else:
-            print(f"No experience found in CV for '{question}'. Defaulting to 4.")
+            log.warning(f"No experience found in CV for '{question}'. Defaulting to 4.")
             return "4"
+    return None
 
-    prompt = (
-        f"Based on this CV: '{CV_TEXT[:1000]}...', and user preferences: "
-        f"salary: ${USER_PREFERENCES['salary_expectation']}, location: {USER_PREFERENCES['location']}, "
-    )
-    
+def get_local_checkbox_decision(question):
+    """True/False when a rule decides the checkbox (e.g. consent), None otherwise."""
+    rule, answer = CONTEXT.question_rules.resolve(question, "checkbox", CONTEXT.settings.preferences)
+    if answer is None:
+        return None
+    return answer.strip().lower().startswith("y")
+
+def get_llm_response(question, previous_response=None, error_message=None):
+    """Get a response from local LLM for text fields."""
+    local_answer = get_local_answer(question)
+    if local_answer:
+        return local_answer
+
+    qtype = question_type(question, rules=CONTEXT.question_rules)
     if error_message and previous_response:
-        prompt += (
-            f"Previous answer '{previous_response}' caused error: '{error_message}'. "
-            f"Provide a corrected answer. "
-        )
-    
-    prompt += (
-        f"Question: '{question}'. "
-        f"Provide ONLY the answer (number for experience, Yes/No for yes/no questions, "
-        f"short text for others). No explanation."
-    )
-    
-    response = call_local_llm(prompt)
-    print(f"LLM response for '{question}': {response}")
-    return response if response else ("4" if is_numerical else "Not specified")
+        # The cached answer (if any) was rejected by the form
+        CONTEXT.answer_cache.invalidate(CONTEXT.answer_cache.make_key(question, "text"))
+        response = call_local_llm(CONTEXT.prompts.compile(qtype, question, previous=previous_response, error=error_message))
+    else:
+        response = CONTEXT.answer_cache.get_or_compute(
+            question, "text", lambda: call_local_llm(CONTEXT.prompts.compile(qtype, question)))
+    log.debug(f"LLM response for '{question}': {response}")
+    return response if response else "Not specified"
+
+def classify_binary(question, qtype, options=("Yes", "No")):
+    """The option the local classifier picks for a checkbox / yes-no question, or None if unsure."""
+    decision = CONTEXT.binary_classifier.predict(question, qtype)
+    if decision is None:
+        return None
+    wanted = "yes" if decision else "no"
+    return next((o for o in options if o.strip().lower() == wanted), None)
+
+def learn_binary(question, qtype, answer):
+    """Train the local classifier on a Yes/No answer from the LLM."""
+    if answer and answer.strip().lower() in ("yes", "no"):
+        CONTEXT.binary_classifier.learn(question, qtype, answer.strip().lower() == "yes")
 
 def get_llm_selection(question, options, previous_response=None, error_message=None):
     """Get the best option from LLM for dropdowns, radio buttons, etc."""
-    specific_response = get_specific_response(question)
+    specific_response = get_specific_response(question, "select")
     if specific_response and specific_response in options:
-        print(f"Using hardcoded selection for '{question}': {specific_response}")
+        log.debug(f"Using hardcoded selection for '{question}': {specific_response}")
         return specific_response
 
-    prompt = (
-        f"Based on CV and preferences, select the BEST option for: '{question}'\n"
-        f"Options: {', '.join(options)}\n"
-    )
+    qtype = question_type(question, "select", options, rules=CONTEXT.question_rules)
+    
+    def select():
+        if qtype == "yes_no" and not error_message:
+            local = classify_binary(question, "yes_no", options)
+            if local:
+                log.debug(f"Classifier selected: {local}")
+                return local
+
+        # Compiled only when it is sent, so cache hits cost no CV retrieval or prompt counts
+        response = call_local_llm(CONTEXT.prompts.compile(qtype, question, options,
+                                                          previous=previous_response, error=error_message))
+        
+        if response and response in options:
+            log.debug(f"LLM selected: {response}")
+            if qtype == "yes_no":
+                learn_binary(question, "yes_no", response)
+            return response
+        
+        # Fuzzy match
+        for option in options:
+            if response and response.lower() in option.lower():
+                log.debug(f"LLM fuzzy matched: {option}")
+                return option
+        return None
     
     if error_message and previous_response:
-        prompt += f"Previous '{previous_response}' caused error: '{error_message}'. Choose different option.\n"
+        CONTEXT.answer_cache.invalidate(CONTEXT.answer_cache.make_key(question, "select", options))
+        selected = select()
+    else:
+        selected = CONTEXT.answer_cache.get_or_compute(question, "select", select, options)
     
-    prompt += "Return ONLY the exact option text, nothing else."
+    if selected in options:
+        return selected
     
-    response = call_local_llm(prompt)
+    log.warning(f"LLM selection failed, using first option: {options[0]}")
+    return options[0]
+
+def get_checkbox_decision(question):
+    """Whether a checkbox should be ticked: local classifier, else the LLM (cached as Yes/No)."""
+    def decide():
+        local = classify_binary(question, "checkbox")
+        if local:
+            return local
+        response = call_local_llm(CONTEXT.prompts.compile("checkbox", question))
+        if not response:
+            return None
+        answer = "Yes" if response.lower().startswith("y") else "No"
+        learn_binary(question, "checkbox", answer)
+        return answer
+
+    return CONTEXT.answer_cache.get_or_compute(question, "checkbox", decide) == "Yes"
+
+def resolve_question(page, modal, field, default="Unknown question"):
+    """Question text for a snapshot field, falling back to OCR when no label resolved."""
+    if field["label"]:
+        return field["label"]
+    ocr_text = ocr_screenshot(page, field_locator(modal, field["id"]))
+    return ocr_text or default
+
+def needs_answer(info):
+    """True if a snapshot field is visible, enabled, still unanswered and not replayed."""
+    if not info["visible"] or not info["enabled"] or info.get("replayed"):
+        return False
+    if info["kind"] in ("radio", "checkbox"):
+        return not info["checked"]
+    if info["kind"] == "select":
+        return not info["value"] or info["value"].lower() in ["select an option", "none"]
+    return not info["value"].strip()
+
+def prefetch_step_answers(page, modal, snapshot):
+    """Answer every unresolved question on a step with one batched LLM call.
+
+    Resolved labels are written back into the snapshot and batch answers go
+    into the answer cache, so the per-field handlers pick them up as cache hits.
+    Anything the batch does not answer falls back to the usual per-field call.
+    """
+    for info in snapshot:
+        if needs_answer(info):
+            default = "Unknown checkbox" if info["kind"] == "checkbox" else "Unknown question"
+            info["label"] = resolve_question(page, modal, info, default)
+    prefetch_answers(snapshot)
+
+def prefetch_answers(snapshot):
+    """Batch step of prefetch_step_answers; expects labels to be resolved already."""
+    pending = []
+    for info in snapshot:
+        if not needs_answer(info):
+            continue
+        kind = info["kind"]
+        if kind == "text":
+            if get_local_answer(info["label"]):
+                continue
+            key = CONTEXT.answer_cache.make_key(info["label"], "text")
+            options = None
+        elif kind in ("select", "radio"):
+            if kind == "radio":
+                options = [opt["label"] for opt in info["options"]]
+            else:
+                options = [text for text in info["options"] if text and text.lower() != "select an option"]
+            if not options:
+                continue
+            specific_response = get_specific_response(info["label"], "select")
+            if specific_response and specific_response in options:
+                continue
+            kind = "select"
+            key = CONTEXT.answer_cache.make_key(info["label"], kind, options)
+        elif kind == "checkbox":
+            if get_local_checkbox_decision(info["label"]) is not None:
+                continue
+            key = CONTEXT.answer_cache.make_key(info["label"], kind)
+            options = None
+        else:
+            continue
+
+        if CONTEXT.answer_cache.contains(key):
+            continue
+        qtype = question_type(info["label"], kind, options, rules=CONTEXT.question_rules)
+        if qtype in ("checkbox", "yes_no"):
+            local = classify_binary(info["label"], qtype, options or ("Yes", "No"))
+            if local:
+                CONTEXT.answer_cache.put(key, info["label"], kind, local)
+                continue
+        pending.append({"id": info["id"], "kind": kind, "question": info["label"],
+                        "options": options, "key": key, "qtype": qtype})
+
+    if len(pending) < 2:
+        return  # A single question gains nothing from batching
+
+    log.debug(f"📦 Batching {len(pending)} questions into one LLM call")
+    try:
+        response = call_local_llm(CONTEXT.prompts.compile_batch(pending))
+    except LLMUnavailable as e:
+        # E.g. a 400 for JSON mode; the per-field calls may still get answers
+        log.warning(f"⚠️ Batch call failed, falling back to per-field calls: {e}")
+        return
+    answers = parse_batch_response(response, pending)
+    for q in pending:
+        if q["id"] in answers:
+            CONTEXT.answer_cache.put(q["key"], q["question"], q["kind"], answers[q["id"]])
+            if q["qtype"] in ("checkbox", "yes_no"):
+                learn_binary(q["question"], q["qtype"], answers[q["id"]])
+    missing = len(pending) - len(answers)
+    if missing:
+        log.warning(f"⚠️ Batch left {missing} questions unanswered, falling back to per-field calls")
+
+ERROR_SELECTOR = ".artdeco-inline-feedback__message"
+
+def type_answer(modal, field, question, answer, max_retries=3):
+    """Type an answer, correcting it with the LLM while the form shows a validation error."""
+    # ✅ HUMAN-LIKE TYPING instead of instant fill
+    fill_like_human(field, answer)
     
-    if response and response in options:
-        print(f"LLM selected: {response}")
-        return response
+    # ✅ LONGER, RANDOM delay after filling
+    human_delay(1.5, 3.5)
     
-    # Fuzzy match
-    for option in options:
-        if response and response.lower() in option.lower():
-            print(f"LLM fuzzy matched: {option}")
-            return option
+    # Check for errors
+    error_msgs = modal.locator(ERROR_SELECTOR).all()
+    retry_count = 0
     
-    print(f"LLM selection failed, using first option: {options[0]}")
-    return options[0]
+    while error_msgs and retry_count < max_retries:
+        error_text = error_msgs[0].inner_text()
+        log.warning(f"Error detected: {error_text}")
+        
+        # ✅ Pause before correcting (human would read error first)
+        human_delay(2, 4)
+        
+        corrected = get_llm_response(question, answer, error_text)
+        fill_like_human(field, corrected)
+        
+        human_delay(1.5, 3)
+        
+        error_msgs = modal.locator(ERROR_SELECTOR).all()
+        retry_count += 1
+        answer = corrected
+    return answer
 
-def fill_text_fields(page, modal):
+@timed("field.text")
+def fill_text_fields(page, modal, snapshot=None):
     """Fill text fields using LLM and OCR with human-like timing."""
     try:
-        text_inputs = modal.locator("input[type='text'], textarea").all()
+        if snapshot is None:
+            snapshot = take_snapshot(modal)
         
-        for field in text_inputs:
-            if not field.is_visible() or not field.is_enabled():
-                continue
-            
-            current_value = field.input_value()
-            if current_value.strip():
+        for info in fields_of_kind(snapshot, "text"):
+            if not needs_answer(info):
                 continue
             
-            # Try to find label
-            question = "Unknown question"
-            try:
-                label = field.locator("xpath=./preceding::label[1]").first
-                if label.is_visible():
-                    question = label.inner_text().strip()
-                else:
-                    ocr_text = ocr_screenshot(page, field)
-                    if ocr_text:
-                        question = ocr_text
-            except:
-                ocr_text = ocr_screenshot(page, field)
-                if ocr_text:
-                    question = ocr_text
-            
-            print(f"Filling field for: '{question}'")
-            answer = get_llm_response(question)
-            
-            # ✅ HUMAN-LIKE TYPING instead of instant fill
-            fill_like_human(field, answer)
-            
-            # ✅ LONGER, RANDOM delay after filling
-            human_delay(1.5, 3.5)
-            
-            # Check for errors
-            error_msgs = modal.locator(".artdeco-inline-feedback__message").all()
-            retry_count = 0
-            max_retries = 3
-            
-            while error_msgs and retry_count < max_retries:
-                error_text = error_msgs[0].inner_text()
-                print(f"Error detected: {error_text}")
-                
-                # ✅ Pause before correcting (human would read error first)
-                human_delay(2, 4)
-                
-                corrected = get_llm_response(question, answer, error_text)
-                fill_like_human(field, corrected)
-                
-                human_delay(1.5, 3)
-                
-                error_msgs = modal.locator(".artdeco-inline-feedback__message").all()
-                retry_count += 1
-                answer = corrected
+            field = field_locator(modal, info["id"])
+            question = resolve_question(page, modal, info)
             
-            print(f"Filled '{question}' with '{answer}'")
+            log.debug(f"Filling field for: '{question}'")
+            answer = type_answer(modal, field, question, get_llm_response(question))
+            log.event("field_filled", f"Filled '{question}' with '{answer}'", kind="text",
+                      question=question, answer=answer)
     
+    except LLMUnavailable:
+        raise
     except Exception as e:
-        print(f"Error filling text fields: {e}")
+        log.error(f"Error filling text fields: {e}")
 
-def handle_dropdowns(page, modal):
+@timed("field.select")
+def handle_dropdowns(page, modal, snapshot=None):
     """Handle dropdown selections with human-like timing."""
     try:
-        dropdowns = modal.locator("select").all()
+        if snapshot is None:
+            snapshot = take_snapshot(modal)
         
-        for dropdown in dropdowns:
-            if not dropdown.is_visible() or not dropdown.is_enabled():
+        for info in fields_of_kind(snapshot, "select"):
+            if not needs_answer(info):
                 continue
             
-            current = dropdown.input_value()
-            if current and current.lower() not in ["", "select an option", "none"]:
-                continue
-            
-            # Get question...
-            question = "Unknown question"
-            try:
-                label = dropdown.locator("xpath=./preceding::label[1]").first
-                if label.is_visible():
-                    question = label.inner_text().strip()
-                else:
-                    ocr_text = ocr_screenshot(page, dropdown)
-                    if ocr_text:
-                        question = ocr_text
-            except:
-                ocr_text = ocr_screenshot(page, dropdown)
-                if ocr_text:
-                    question = ocr_text
+            dropdown = field_locator(modal, info["id"])
+            question = resolve_question(page, modal, info)
             
-            # Get options...
-            options = []
-            option_elements = dropdown.locator("option").all()
-            for opt in option_elements:
-                text = opt.inner_text().strip()
-                if text and text.lower() != "select an option":
-                    options.append(text)
+            options = [text for text in info["options"] if text and text.lower() != "select an option"]
             
             if not options:
                 continue
@@ -372,55 +428,52 @@ def handle_dropdowns(page, modal):
             
             selected = get_llm_selection(question, options)
             dropdown.select_option(label=selected)
-            print(f"Selected '{selected}' for '{question}'")
+            log.event("field_filled", f"Selected '{selected}' for '{question}'", kind="select",
+                      question=question, answer=selected)
             
             # ✅ LONGER delay after selection
             human_delay(1.5, 3)
     
+    except LLMUnavailable:
+        raise
     except Exception as e:
-        print(f"Error handling dropdowns: {e}")
+        log.error(f"Error handling dropdowns: {e}")
 
-def handle_radio_buttons(page, modal):
+def click_radio_option(modal, info, selected_option):
+    """Click the option of a radio group whose label matches selected_option."""
+    for opt in info["options"]:
+        if opt["label"].strip().lower() == selected_option.strip().lower():
+            try:
+                label = field_locator(modal, opt["label_id"])
+                label.scroll_into_view_if_needed()
+                # ✅ Small delay before clicking
+                human_delay(0.3, 0.8)
+                label.click(force=True)
+                log.debug(f"Clicked label for '{opt['label']}'")
+            except:
+                try:
+                    radio = field_locator(modal, opt["input"])
+                    radio.scroll_into_view_if_needed()
+                    human_delay(0.3, 0.8)
+                    radio.click(force=True)
+                    log.debug(f"Clicked radio input for '{opt['label']}'")
+                except Exception as e:
+                    log.warning(f"Failed to click option '{opt['label']}': {e}")
+            break
+
+@timed("field.radio")
+def handle_radio_buttons(page, modal, snapshot=None):
     """Handle radio buttons with human-like timing."""
     try:
-        radios = modal.locator("input[type='radio']").all()
-        radio_groups = {}
-
-        for radio in radios:
-            name = radio.get_attribute("name")
-            if name:
-                radio_groups.setdefault(name, []).append(radio)
+        if snapshot is None:
+            snapshot = take_snapshot(modal)
 
-        for name, group in radio_groups.items():
-            if any(r.is_checked() for r in group):
+        for info in fields_of_kind(snapshot, "radio"):
+            if info["checked"] or info.get("replayed"):
                 continue
 
-            # Get question and options...
-            question = "Unknown question"
-            try:
-                legend = group[0].locator("xpath=./preceding::legend[1]").first
-                if legend.is_visible():
-                    question = legend.inner_text().strip()
-                else:
-                    ocr_text = ocr_screenshot(page, group[0])
-                    if ocr_text:
-                        question = ocr_text
-            except:
-                ocr_text = ocr_screenshot(page, group[0])
-                if ocr_text:
-                    question = ocr_text
-
-            options = []
-            labels = []
-
-            for radio in group:
-                try:
-                    label = radio.locator("xpath=following-sibling::label[1]").first
-                    if label.is_visible():
-                        options.append(label.inner_text().strip())
-                        labels.append(label)
-                except:
-                    pass
+            question = resolve_question(page, modal, info)
+            options = [opt["label"] for opt in info["options"]]
 
             if not options:
                 continue
@@ -429,259 +482,279 @@ def handle_radio_buttons(page, modal):
             human_delay(1.5, 3)
 
             selected_option = get_llm_selection(question, options)
-            print(f"Choosing '{selected_option}' for '{question}'")
-
-            for i, opt in enumerate(options):
-                if opt.strip().lower() == selected_option.strip().lower():
-                    try:
-                        labels[i].scroll_into_view_if_needed()
-                        # ✅ Small delay before clicking
-                        time.sleep(random.uniform(0.3, 0.8))
-                        labels[i].click(force=True)
-                        print(f"Clicked label for '{opt}'")
-                    except:
-                        try:
-                            group[i].scroll_into_view_if_needed()
-                            time.sleep(random.uniform(0.3, 0.8))
-                            group[i].click(force=True)
-                            print(f"Clicked radio input for '{opt}'")
-                        except Exception as e:
-                            print(f"Failed to click option '{opt}': {e}")
-                    break
+            log.event("field_filled", f"Choosing '{selected_option}' for '{question}'", kind="radio",
+                      question=question, answer=selected_option)
+
+            click_radio_option(modal, info, selected_option)
 
             # ✅ LONGER delay after clicking
             human_delay(1.5, 3)
 
+    except LLMUnavailable:
+        raise
     except Exception as e:
-        print(f"Error handling radio buttons: {e}")
+        log.error(f"Error handling radio buttons: {e}")
 
 
-def handle_checkboxes(page, modal):
+@timed("field.checkbox")
+def handle_checkboxes(page, modal, snapshot=None):
     """Handle checkboxes with human-like timing."""
     try:
-        checkboxes = modal.locator("input[type='checkbox']").all()
-        print(f"Found {len(checkboxes)} checkboxes")
-
-        for checkbox in checkboxes:
-            if not checkbox.is_visible() or not checkbox.is_enabled():
-                continue
+        if snapshot is None:
+            snapshot = take_snapshot(modal)
+        checkboxes = fields_of_kind(snapshot, "checkbox")
+        log.debug(f"Found {len(checkboxes)} checkboxes")
 
-            checked = checkbox.is_checked()
-            if checked:
+        for info in checkboxes:
+            if not needs_answer(info):
                 continue
 
-            # Get label...
-            question = "Unknown checkbox"
-            label_text = ""
+            checkbox = field_locator(modal, info["id"])
+            question = resolve_question(page, modal, info, "Unknown checkbox")
+            label_text = question if question != "Unknown checkbox" else ""
 
-            try:
-                label = checkbox.locator("xpath=following-sibling::label[1]").first
-                if label.is_visible():
-                    label_text = label.inner_text().strip()
-                    question = label_text
-                else:
-                    ocr_text = ocr_screenshot(page, checkbox)
-                    if ocr_text:
-                        label_text = ocr_text
-                        question = ocr_text
-            except Exception:
-                ocr_text = ocr_screenshot(page, checkbox)
-                if ocr_text:
-                    label_text = ocr_text
-                    question = ocr_text
-
-            print(f"Processing checkbox: '{question}'")
+            log.debug(f"Processing checkbox: '{question}'")
 
             # ✅ Pause to "read" the checkbox label
             human_delay(1, 2)
 
             # Decide whether to check it...
-            should_check = False
-            if any(keyword in question.lower() for keyword in ["consent", "agree", "accept", "yes", "confirm"]):
-                should_check = True
-            else:
-                prompt = (
-                    f"Given this question or label: '{question}', "
-                    f"should the applicant check this box during a job application? "
-                    f"Answer 'yes' or 'no' only."
-                )
-                response = call_local_llm(prompt)
-                should_check = response and response.lower().startswith("y")
+            should_check = get_local_checkbox_decision(question)
+            if should_check is None:
+                should_check = get_checkbox_decision(question)
 
             if should_check:
                 try:
                     checkbox.scroll_into_view_if_needed()
                     # ✅ Small delay before clicking
-                    time.sleep(random.uniform(0.3, 0.8))
+                    human_delay(0.3, 0.8)
                     checkbox.click(force=True)
-                    print(f"✅ Checked box for '{label_text}'")
+                    log.event("field_filled", f"✅ Checked box for '{label_text}'", kind="checkbox",
+                              question=label_text, answer=True)
                     # ✅ LONGER delay after checking
                     human_delay(1.5, 3)
                 except Exception as e:
-                    print(f"❌ Failed to click checkbox '{label_text}': {e}")
+                    log.error(f"❌ Failed to click checkbox '{label_text}': {e}")
             else:
-                print(f"Skipping checkbox '{label_text}'")
+                log.debug(f"Skipping checkbox '{label_text}'")
 
+    except LLMUnavailable:
+        raise
     except Exception as e:
-        print(f"Error handling checkboxes: {e}")
+        log.error(f"Error handling checkboxes: {e}")
 
 
-def is_job_already_applied(job_element):
-    """Check if job has already been applied to."""
-    try:
-        text = job_element.inner_text().lower()
-        return "applied" in text and ("day" in text or "week" in text)
-    except:
-        return False
+@timed("form_replay")
+def replay_step(modal, snapshot, fingerprint):
+    """Fill a step from the form memory when its form was seen in a submitted application.
+
+    Replayed fields are marked in the snapshot, so the regular handlers only
+    get the fields the stored answers do not cover.
+    """
+    actions = CONTEXT.form_memory.plan(fingerprint, snapshot)
+    if not actions:
+        return
+    log.info(f"♻️ Replaying {len(actions)} answers from a previously submitted form")
+    for info, answer in actions:
+        kind = info["kind"]
+        question = info["label"] or "Unknown question"
+        try:
+            field = field_locator(modal, info["id"])
+            human_delay(0.5, 1.5)
+            if kind == "text":
+                answer = type_answer(modal, field, question, answer)
+            elif kind == "select":
+                field.select_option(answer)
+            elif kind == "radio":
+                click_radio_option(modal, info, answer)
+            else:
+                field.scroll_into_view_if_needed()
+                field.click(force=True)
+            log.event("field_filled", f"Replayed '{answer}' for '{question}'", kind=kind,
+                      question=question, answer=answer, source="replay")
+        except LLMUnavailable:
+            raise
+        except Exception as e:
+            log.warning(f"⚠️ Could not replay '{question}': {e}")
+            info["replayed"] = False
+
+    # Stored answers that no longer validate are not replayed again
+    if modal.locator(ERROR_SELECTOR).count():
+        log.warning("⚠️ Replayed form shows validation errors, forgetting it")
+        CONTEXT.form_memory.forget(fingerprint)
+
+
+PAGINATION_SELECTOR = (".artdeco-pagination, .jobs-search-results-list__pagination, "
+                       "[data-test-pagination], .jobs-search-pagination")
+
+PAGINATION_SELECTORS = [
+    ".artdeco-pagination",
+    ".jobs-search-results-list__pagination",
+    "[data-test-pagination]",
+    "nav[aria-label*='pagination' i]",
+    ".jobs-search-pagination"
+]
+
+NEXT_BUTTON_SELECTORS = [
+    "button[aria-label*='Next' i]",
+    "button[aria-label*='next page' i]",
+    "button:has-text('Next')",
+    "li.artdeco-pagination__indicator--number.active + li button",
+    "button.artdeco-pagination__button--next",
+    "[data-test-pagination-next]"
+]
+
+def is_next_button_text(text):
+    """True for the text of a "Next" pagination button."""
+    text = (text or "").lower()
+    return "next" in text and "previous" not in text
+
+def next_page_url(current_url):
+    """Search URL of the following results page (LinkedIn pages by start=0, 25, 50 ...)."""
+    if re.search(r'[?&]start=\d+', current_url):
+        return re.sub(r'([?&]start=)\d+', rf'\g<1>{start_param(current_url) + 25}', current_url, count=1)
+    separator = "&" if "?" in current_url else "?"
+    return f"{current_url}{separator}start=25"
 
 def find_next_button_with_ocr(page):
     """Use OCR to find and click the Next button in pagination."""
     try:
-        print("🔍 Searching for pagination buttons using OCR...")
+        log.debug("🔍 Searching for pagination buttons using OCR...")
         
         # Take screenshot of bottom of page where pagination usually is
         page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-        time.sleep(2)
+        wait_for_selector(page, PAGINATION_SELECTOR, timeout=5, name="pagination attached")
         
         # Get pagination area
-        pagination_selectors = [
-            ".artdeco-pagination",
-            ".jobs-search-results-list__pagination",
-            "[data-test-pagination]",
-            "nav[aria-label*='pagination' i]",
-            ".jobs-search-pagination"
-        ]
-        
         pagination_element = None
-        for selector in pagination_selectors:
+        for selector in PAGINATION_SELECTORS:
             try:
                 pagination_element = page.locator(selector).first
                 if pagination_element.is_visible():
-                    print(f"✅ Found pagination element: {selector}")
+                    log.debug(f"✅ Found pagination element: {selector}")
                     break
             except:
                 continue
         
         if not pagination_element:
             # Fallback: screenshot bottom portion of page
-            print("📸 Taking screenshot of page bottom for OCR...")
+            log.debug("📸 Taking screenshot of page bottom for OCR...")
             screenshot_bytes = page.screenshot()
+            import io
+            from PIL import Image
+
             image = Image.open(io.BytesIO(screenshot_bytes))
             
             # Crop bottom 20% of image where pagination usually is
             width, height = image.size
             cropped = image.crop((0, int(height * 0.8), width, height))
-            ocr_text = pytesseract.image_to_string(cropped)
-            print(f"OCR detected text: {ocr_text}")
+            ocr_text = CONTEXT.ocr_engine.text_image(cropped, "block")
+            log.debug(f"OCR detected text: {ocr_text}")
         else:
             # OCR the pagination element
-            ocr_text = ocr_screenshot(page, pagination_element)
-            print(f"OCR pagination text: {ocr_text}")
+            ocr_text = ocr_screenshot(page, pagination_element, mode="block")
+            log.debug(f"OCR pagination text: {ocr_text}")
         
         # Try multiple button selectors
-        next_button_selectors = [
-            "button[aria-label*='Next' i]",
-            "button[aria-label*='next page' i]",
-            "button:has-text('Next')",
-            "li.artdeco-pagination__indicator--number.active + li button",
-            "button.artdeco-pagination__button--next",
-            "[data-test-pagination-next]"
-        ]
-        
-        for selector in next_button_selectors:
+        for selector in NEXT_BUTTON_SELECTORS:
             try:
                 next_btn = page.locator(selector).first
                 if next_btn.is_visible() and next_btn.is_enabled():
                     # Check if button is not disabled
                     is_disabled = next_btn.get_attribute("disabled")
                     if is_disabled:
-                        print(f"⚠️ Button found but disabled: {selector}")
+                        log.warning(f"⚠️ Button found but disabled: {selector}")
                         continue
                     
                     next_btn.scroll_into_view_if_needed()
                     next_btn.click()
-                    print(f"✅ Clicked Next button using selector: {selector}")
+                    log.info(f"✅ Clicked Next button using selector: {selector}")
                     return True
             except Exception as e:
-                print(f"❌ Failed with selector {selector}: {e}")
+                log.debug(f"❌ Failed with selector {selector}: {e}")
                 continue
         
         # Fallback: Use OCR coordinates to click
         if "next" in ocr_text.lower():
-            print("⚠️ Next button detected in OCR but couldn't click with selectors")
+            log.warning("⚠️ Next button detected in OCR but couldn't click with selectors")
             # Try clicking any visible button elements
             all_buttons = page.locator("button").all()
             for btn in all_buttons:
                 try:
                     if btn.is_visible():
                         btn_text = btn.inner_text().lower()
-                        if "next" in btn_text and "previous" not in btn_text:
+                        if is_next_button_text(btn_text):
                             btn.scroll_into_view_if_needed()
                             btn.click()
-                            print(f"✅ Clicked button with text: {btn_text}")
+                            log.info(f"✅ Clicked button with text: {btn_text}")
                             return True
                 except:
                     continue
         
-        print("❌ No Next button found")
+        log.error("❌ No Next button found")
         return False
         
     except Exception as e:
-        print(f"❌ Error finding next button: {e}")
+        log.error(f"❌ Error finding next button: {e}")
         return False
 
+@timed("next_page")
 def go_to_next_page(page):
     """Navigate to next page of results with multiple fallback methods."""
     try:
-        print("\n🔄 Attempting to navigate to next page...")
+        log.info("\n🔄 Attempting to navigate to next page...")
         
         # Store current URL to verify navigation
         current_url = page.url
         current_page_num = extract_page_number(current_url)
-        print(f"Current page: {current_page_num}, URL: {current_url}")
+        log.debug(f"Current page: {current_page_num}, URL: {current_url}")
         
         # Method 1: Standard Next button
         success = find_next_button_with_ocr(page)
         
         if success:
-            time.sleep(5)
+            wait_for_url_change(page, current_url, timeout=10, name="next page url")
             new_url = page.url
             new_page_num = extract_page_number(new_url)
             
             if new_url != current_url or new_page_num > current_page_num:
-                print(f"✅ Successfully navigated to page {new_page_num}")
+                log.info(f"✅ Successfully navigated to page {new_page_num}")
                 return True
             else:
-                print("⚠️ Button clicked but page didn't change")
+                log.warning("⚠️ Button clicked but page didn't change")
         
         # Method 2: Try URL parameter manipulation
-        print("🔧 Trying URL manipulation...")
-        if "&start=" in current_url:
-            # LinkedIn uses &start=25, &start=50, etc.
-            match = re.search(r'&start=(\d+)', current_url)
-            if match:
-                current_start = int(match.group(1))
-                next_start = current_start + 25
-                new_url = re.sub(r'&start=\d+', f'&start={next_start}', current_url)
-                page.goto(new_url)
-                print(f"✅ Navigated via URL to start={next_start}")
-                time.sleep(5)
-                return True
-        else:
-            # Add start parameter
-            separator = "&" if "?" in current_url else "?"
-            new_url = f"{current_url}{separator}start=25"
-            page.goto(new_url)
-            print(f"✅ Added start parameter to URL")
-            time.sleep(5)
-            return True
-        
-        return False
+        log.info("🔧 Trying URL manipulation...")
+        new_url = next_page_url(current_url)
+        page.goto(new_url)
+        log.info(f"✅ Navigated via URL to start={start_param(new_url)}")
+        wait_for_start_change(page, current_url, timeout=10)
+        return True
         
     except Exception as e:
-        print(f"❌ Error navigating to next page: {e}")
+        log.error(f"❌ Error navigating to next page: {e}")
         return False
 
+def check_relevance(job_id, card, details):
+    """Score the open job against the CV and record the score.
+
+    Returns False (after recording the skip) when it falls below
+    the relevance_threshold setting; a description that could not be read is
+    not held against the job.
+    """
+    if details is None:
+        log.debug(f"Could not read the description of job {job_id}; not scoring it")
+        return True
+    score = CONTEXT.relevance.score(f"{details['title'] or card['title']}\n{details['description']}")
+    CONTEXT.job_ledger.set_relevance(job_id, round(score, 4))
+    if score >= CONTEXT.settings.relevance_threshold:
+        log.info(f"🎯 Relevance {score:.2f}", job_id=job_id, relevance=round(score, 4))
+        return True
+    CONTEXT.job_ledger.record(job_id, "skipped", error="low relevance")
+    log.event("job_done", f"⏭️ Skipping {job_id} (relevance {score:.2f} < {CONTEXT.settings.relevance_threshold:.2f})",
+              job_id=job_id, status="skipped", relevance=round(score, 4))
+    return False
+
 def extract_page_number(url):
     """Extract page number from URL."""
     match = re.search(r'&start=(\d+)', url)
@@ -690,97 +763,173 @@ def extract_page_number(url):
         return (start_value // 25) + 1
     return 1
 
-def run_automation():
-    """Main function that runs in a separate thread."""
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context()
+def open_job_search(page, context, restored):
+    """Open the job search signed in, logging in only if the restored session is not valid.
+
+    A restored session is checked by the search page itself: LinkedIn sends an
+    expired session to a login / authwall page instead.
+    """
+    settings = CONTEXT.settings
+    if restored:
+        with span("session_check"):
+            page.goto(settings.search_url)
+        if not is_login_url(page.url):
+            log.event("session", "🍪 Reusing the saved LinkedIn session", reused=True)
+            return
+        log.info("🍪 Saved session has expired, logging in again")
+        CONTEXT.session.forget()
+
+    log.info("Logging in to LinkedIn...")
+    with span("login"):
+        page.goto(f"{settings.linkedin_base_url}/login")
+        page.fill("#username", settings.email)
+        page.fill("#password", settings.password)
+        page.click("button[type='submit']")
+        wait_until(lambda: not is_login_url(page.url), timeout=30, name="login redirect")
+    log.event("session", "Logged in successfully", reused=False)
+    save_session(context.storage_state)
+    page.goto(settings.search_url)
+
+def save_session(storage_state):
+    """Save the browser context's cookies for the next run; a failure only costs the next run a login."""
+    try:
+        CONTEXT.session.save(storage_state())
+    except Exception as e:
+        log.warning(f"⚠️ Could not save the browser session: {e}")
+
+def log_final_stats():
+    """Final statistics of a run, printed by both engines."""
+    log.info(f"\n{'='*60}\n📊 FINAL STATISTICS\n{'='*60}")
+    CONTEXT.progress.update(force=True, job_id=None, step=None)
+    log.info(f"✅ Successfully applied to: {CONTEXT.job_ledger.session_counts['applied']} jobs")
+    log.info(f"📋 Total jobs processed: {CONTEXT.job_ledger.session_counts['seen']} jobs")
+    log.info(f"🗂️ Ledger (all runs): {CONTEXT.job_ledger.counts()}")
+    cache_stats = CONTEXT.answer_cache.stats()
+    log.info(f"🗃️ Answer cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses "
+             f"({cache_stats['hit_rate']:.0%} hit rate, {cache_stats['size']} entries)")
+    for line in CONTEXT.llm_router.summary():
+        log.info(f"🤖 LLM {line}")
+    for line in CONTEXT.prompts.summary():
+        log.info(f"📝 Prompt {line}")
+    classifier_stats = CONTEXT.binary_classifier.stats()
+    log.info(f"🧠 Classifier: {classifier_stats['answered']} answered locally, "
+             f"{classifier_stats['deferred']} sent to the LLM, {classifier_stats['learned']} learned "
+             f"({classifier_stats['size']} decisions logged)")
+    replay_stats = CONTEXT.form_memory.stats()
+    log.info(f"♻️ Form replay: {replay_stats['hits']} steps replayed, {replay_stats['misses']} new "
+             f"({replay_stats['replayed_fields']} fields, {replay_stats['size']} forms stored)")
+    ocr_stats = CONTEXT.ocr_engine.stats()
+    log.info(f"🔤 OCR cache: {ocr_stats['hits']} hits, {ocr_stats['misses']} misses")
+    for line in wait_summary():
+        log.info(f"⏱️ {line}")
+    if metrics.RECORDER.enabled:
+        for line in metrics.RECORDER.summary():
+            log.info(f"📈 {line}")
+        metrics.RECORDER.flush()
+    log.info(f"{'='*60}")
+
+def run_automation(browser=None):
+    """Main function that runs in a separate thread.
+
+    `browser` is a Chromium that is already running (the warm worker's). The
+    run gets a fresh browser context in it and leaves the browser open.
+    """
+    from contextlib import nullcontext
+    from playwright.sync_api import sync_playwright
+
+    start_run()
+    owns_browser = browser is None
+    with sync_playwright() if owns_browser else nullcontext() as p:
+        if owns_browser:
+            browser = p.chromium.launch(headless=CONTEXT.settings.headless)
+        saved_session = CONTEXT.session.state()
+        context = browser.new_context(storage_state=saved_session)
         page = context.new_page()
+        signed_in = False
         
         try:
-            # Login
-            print("Logging in to LinkedIn...")
-            page.goto("https://www.linkedin.com/login")
-            page.fill("#username", EMAIL)
-            page.fill("#password", PASSWORD)
-            page.click("button[type='submit']")
-            time.sleep(5)
-            print("Logged in successfully")
-            
-            # Navigate to job search
-            search_url = "https://www.linkedin.com/jobs/search/?keywords=machine%20learning%20intern&location=Silicon%20Valley%2C%20California&f_AL=true&f_TPR=r604800"
-            page.goto(search_url)
-            time.sleep(5)
+            # Saved session if it is still valid, else log in
+            open_job_search(page, context, restored=saved_session is not None)
+            signed_in = True
+            wait_for_cards_stable(page, timeout=15, name="search results")
             
             job_counter = 0
             page_number = 1
-            max_pages = 10
+            max_pages = CONTEXT.settings.max_pages
             
             while page_number <= max_pages:
-                print(f"\n{'='*60}")
-                print(f"📄 PROCESSING PAGE {page_number}")
-                print(f"{'='*60}")
+                log.info(f"\n{'='*60}\n📄 PROCESSING PAGE {page_number}\n{'='*60}", page=page_number)
+                CONTEXT.progress.update(force=True, page=page_number, job_id=None, step=None)
                 
                 no_new_jobs = 0
                 max_no_new_attempts = 3
+                # Reports only cards added since the previous scan (one evaluate per scan)
+                harvester = CardHarvester()
                 
                 while no_new_jobs < max_no_new_attempts:
-                    # Scroll to load jobs
-                    page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                    time.sleep(3)
-                    
-                    job_listings = page.locator(".job-card-container").all()
-                    
-                    if not job_listings:
-                        print("⚠️ No job listings found, scrolling and retrying...")
+                    with span("card_scan", page=page_number):
+                        # Scroll to load jobs
                         page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                        time.sleep(5)
-                        job_listings = page.locator(".job-card-container").all()
-                        if not job_listings:
-                            print("❌ Still no jobs found, breaking...")
-                            break
+                        wait_for_cards_stable(page, timeout=5, name="lazy-loaded cards")
+                        
+                        new_cards = harvester.harvest(page)
+                        
+                        if not harvester.total:
+                            log.warning("⚠️ No job listings found, scrolling and retrying...")
+                            page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+                            wait_for_cards_stable(page, timeout=10, name="lazy-loaded cards")
+                            new_cards = harvester.harvest(page)
                     
-                    print(f"📋 Found {len(job_listings)} job cards on page")
+                    if not harvester.total:
+                        log.error("❌ Still no jobs found, breaking...")
+                        break
+                    
+                    log.info(f"📋 Found {len(new_cards)} new job cards on page ({harvester.total} so far)")
                     found_new = False
                     
-                    for job in job_listings:
+                    for card in new_cards:
+                        job_id = card["job_id"]
                         try:
-                            job_link = job.locator("a").first
-                            href = job_link.get_attribute("href")
-                            if not href:
+                            if job_id is None:
                                 continue
                             
-                            job_id = href.split("?")[0]
-                            
-                            if job_id in processed_jobs:
+                            if CONTEXT.job_ledger.done(job_id):
                                 continue
                             
-                            processed_jobs.add(job_id)
+                            CONTEXT.job_ledger.record(job_id, "seen")
                             found_new = True
                             
-                            if is_job_already_applied(job):
-                                print(f"⏭️ Skipping {job_id} (already applied)")
+                            if card["applied"]:
+                                log.info(f"⏭️ Skipping {job_id} (already applied)")
+                                CONTEXT.job_ledger.record(job_id, "skipped", error="already applied")
                                 continue
                             
                             job_counter += 1
-                            print(f"\n{'='*50}")
-                            print(f"💼 Applying to job {job_counter} ({job_id})...")
-                            print(f"{'='*50}")
+                            log.event("job_started", f"\n{'='*50}\n💼 Applying to job {job_counter} ({job_id})...\n{'='*50}",
+                                      job_id=job_id, number=job_counter)
+                            CONTEXT.progress.update(force=True, job_id=job_id, step=0)
                             
                             # Click job
+                            job_link = card_link(page, card)
                             job_link.scroll_into_view_if_needed()
                             job_link.click()
-                            time.sleep(2)
+                            # The detail pane follows the selected card via currentJobId
+                            wait_until(lambda: str(job_id) in page.url, timeout=5, name="job detail pane")
+                            
+                            # Skip postings unrelated to the CV before opening the modal
+                            if not check_relevance(job_id, card, read_job_details(page, card)):
+                                continue
                             
                             # Click Easy Apply
                             try:
                                 easy_apply = page.locator(".jobs-apply-button").first
                                 easy_apply.click(timeout=15000)
-                                print("✅ Clicked Easy Apply")
+                                log.info("✅ Clicked Easy Apply")
                                 # ✅ LONGER wait for modal to appear naturally
                                 human_delay(3, 5)
                             except:
-                                print("❌ Easy Apply not found")
+                                log.error("❌ Easy Apply not found")
+                                CONTEXT.job_ledger.record(job_id, "skipped", error="no easy apply button")
                                 continue
                             
                             # Wait for modal
@@ -789,104 +938,138 @@ def run_automation():
                             
                             max_steps = 10
                             step_count = 0
+                            submitted = False
+                            llm_error = None
+                            CONTEXT.form_memory.discard()
                             
                             while step_count < max_steps:
-                                print(f"🔍 Step {step_count + 1}...")
-                                
-                                # ✅ Pause before starting each step (human would scan the form)
-                                human_delay(2, 4)
+                                with span("modal_step", job_id=job_id, step=step_count + 1):
+                                    log.info(f"🔍 Step {step_count + 1}...")
+                                    CONTEXT.progress.update(step=step_count + 1)
                                 
-                                # Fill phone
-                                try:
-                                    phone = modal.locator("input[id*='phone']").first
-                                    if phone.is_visible():
-                                        fill_like_human(phone, USER_PREFERENCES["phone"])
-                                        human_delay(1, 2)
-                                except:
-                                    pass
+                                    # ✅ Pause before starting each step (human would scan the form)
+                                    human_delay(2, 4)
                                 
-                                # Fill zip
-                                try:
-                                    zip_field = modal.locator("input[id*='zip']").first
-                                    if zip_field.is_visible():
-                                        fill_like_human(zip_field, USER_PREFERENCES["zip_code"])
-                                        human_delay(1, 2)
-                                except:
-                                    pass
+                                    # Fill phone
+                                    try:
+                                        phone = modal.locator("input[id*='phone']").first
+                                        if phone.is_visible():
+                                            fill_like_human(phone, CONTEXT.settings.preferences["phone"])
+                                            human_delay(1, 2)
+                                    except:
+                                        pass
                                 
-                                fill_text_fields(page, modal)
-                                handle_dropdowns(page, modal)
-                                handle_radio_buttons(page, modal)
-                                handle_checkboxes(page, modal)
+                                    # Fill zip
+                                    try:
+                                        zip_field = modal.locator("input[id*='zip']").first
+                                        if zip_field.is_visible():
+                                            fill_like_human(zip_field, CONTEXT.settings.preferences["zip_code"])
+                                            human_delay(1, 2)
+                                    except:
+                                        pass
                                 
-                                # Try clicking buttons
-                                clicked = False
-                                for btn_text in ["submit", "apply", "review", "next"]:
+                                    # One DOM round trip describes every field on this step
+                                    snapshot = take_snapshot(modal)
+                                    fingerprint = CONTEXT.form_memory.fingerprint(snapshot)
                                     try:
-                                        button = modal.locator(f"button:has-text('{btn_text}')").first
-                                        if button.is_visible() and button.is_enabled():
-                                            # ✅ Scroll to button smoothly
-                                            button.scroll_into_view_if_needed()
-                                            # ✅ Pause before clicking (human would review)
-                                            human_delay(2, 4)
-                                            button.click()
-                                            print(f"✅ Clicked {btn_text}")
-                                            clicked = True
+                                        replay_step(modal, snapshot, fingerprint)
+                                        prefetch_step_answers(page, modal, snapshot)
+                                        fill_text_fields(page, modal, snapshot)
+                                        handle_dropdowns(page, modal, snapshot)
+                                        handle_radio_buttons(page, modal, snapshot)
+                                        handle_checkboxes(page, modal, snapshot)
+                                    except LLMUnavailable as e:
+                                        # Better an unsent application than one with guessed answers
+                                        llm_error = str(e)
+                                        log.error(f"❌ LLM unavailable, abandoning this application: {e}")
+                                        break
+                                    # Answers as submitted, kept if the application goes through
+                                    CONTEXT.form_memory.stage(fingerprint, take_snapshot(modal))
+                                
+                                    # Try clicking buttons
+                                    clicked = False
+                                    for btn_text in ["submit", "apply", "review", "next"]:
+                                        try:
+                                            button = modal.locator(f"button:has-text('{btn_text}')").first
+                                            if button.is_visible() and button.is_enabled():
+                                                # ✅ Scroll to button smoothly
+                                                button.scroll_into_view_if_needed()
+                                                # ✅ Pause before clicking (human would review)
+                                                human_delay(2, 4)
+                                                button.click()
+                                                log.event("step_done", f"✅ Clicked {btn_text}", job_id=job_id,
+                                                          step=step_count + 1, button=btn_text)
+                                                clicked = True
                                             
-                                            if btn_text in ["submit", "apply"]:
-                                                # ✅ LONGER wait after submitting
-                                                human_delay(4, 7)
-                                                try:
-                                                    done = page.locator("button:has-text('Done')").first
-                                                    done.click(timeout=10000)
-                                                    print("✅ Clicked Done")
-                                                except:
-                                                    pass
-                                            break
-                                    except:
-                                        continue
+                                                if btn_text in ["submit", "apply"]:
+                                                    submitted = True
+                                                    # ✅ LONGER wait after submitting
+                                                    human_delay(4, 7)
+                                                    try:
+                                                        done = page.locator("button:has-text('Done')").first
+                                                        done.click(timeout=10000)
+                                                        log.info("✅ Clicked Done")
+                                                    except:
+                                                        pass
+                                                break
+                                        except:
+                                            continue
                                 
                                 if not clicked:
-                                    print("⚠️ No buttons to click")
+                                    log.warning("⚠️ No buttons to click")
                                     break
                                 
                                 # ✅ LONGER delay between steps
                                 human_delay(3, 6)
                                 step_count += 1
                             
-                            applied_jobs.add(job_id)
-                            print(f"✅ Successfully applied to job {job_id}")
+                            if submitted:
+                                CONTEXT.form_memory.commit()
+                                CONTEXT.job_ledger.record(job_id, "applied", steps=step_count)
+                                log.event("job_done", f"✅ Successfully applied to job {job_id}", job_id=job_id,
+                                          status="applied", steps=step_count)
+                            else:
+                                CONTEXT.form_memory.discard()
+                                CONTEXT.job_ledger.record(job_id, "failed", steps=step_count,
+                                                  error=f"llm unavailable: {llm_error}"[:500] if llm_error
+                                                  else "application not submitted")
+                                log.event("job_done", f"⚠️ Could not submit application for job {job_id}",
+                                          logging.WARNING, job_id=job_id, status="failed", steps=step_count)
                             
                             # Close modal
                             try:
                                 page.keyboard.press("Escape")
-                                time.sleep(2)
+                                wait_for_selector(page, ".artdeco-modal", timeout=5, state="hidden",
+                                                  name="modal closed")
                             except:
                                 pass
 
                             # Add random delay to avoid detection
                             # ✅ MUCH LONGER random delay
-                            delay = random.uniform(15, 45)  # 15-45 seconds instead of 5-15
-                            print(f"⏳ Waiting {delay:.2f} seconds before next application...")
+                            settings = CONTEXT.settings
+                            delay = random.uniform(*settings.application_delay_range) * settings.pacing_scale
+                            log.info(f"⏳ Waiting {delay:.2f} seconds before next application...")
                             time.sleep(delay)
                         
                         except Exception as e:
-                            print(f"❌ Error with job: {e}")
+                            log.error(f"❌ Error with job: {e}")
+                            if job_id is not None:
+                                CONTEXT.job_ledger.record(job_id, "failed", error=str(e)[:500])
                             continue
                     
                     if not found_new:
                         no_new_jobs += 1
-                        print(f"⚠️ No new jobs found ({no_new_jobs}/{max_no_new_attempts})")
+                        log.warning(f"⚠️ No new jobs found ({no_new_jobs}/{max_no_new_attempts})")
                     else:
                         no_new_jobs = 0
                     
                     # Scroll again
                     page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                    time.sleep(3)
+                    wait_for_cards_stable(page, timeout=5, name="lazy-loaded cards")
                 
-                print(f"\n✅ Completed processing page {page_number}")
-                print(f"📊 Total jobs applied: {len(applied_jobs)}")
-                print(f"📊 Total jobs processed: {len(processed_jobs)}")
+                log.info(f"\n✅ Completed processing page {page_number}")
+                log.info(f"📊 Total jobs applied: {CONTEXT.job_ledger.session_counts['applied']}")
+                log.info(f"📊 Total jobs processed: {CONTEXT.job_ledger.session_counts['seen']}")
                 
                 # Navigate to next page
                 if page_number < max_pages:
@@ -894,45 +1077,51 @@ def run_automation():
                         page_number += 1
                         
                         # Wait for new page to load
-                        time.sleep(8)
-                        
-                        # Verify page loaded
-                        try:
-                            page.wait_for_selector(".job-card-container", timeout=15000)
-                            print(f"✅ Successfully loaded page {page_number}")
-                        except:
-                            print("⚠️ Timeout waiting for job cards, but continuing...")
+                        if wait_for_cards_stable(page, timeout=15, name="next page cards"):
+                            log.info(f"✅ Successfully loaded page {page_number}")
+                        else:
+                            log.warning("⚠️ Timeout waiting for job cards, but continuing...")
                         
                         # Trigger lazy loading
                         page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                        time.sleep(4)
+                        wait_for_cards_stable(page, timeout=5, name="lazy-loaded cards")
                         
                     else:
-                        print("❌ Could not navigate to next page. Ending automation.")
+                        log.error("❌ Could not navigate to next page. Ending automation.")
                         break
                 else:
-                    print("✅ Reached maximum page limit")
+                    log.info("✅ Reached maximum page limit")
                     break
 
         except KeyboardInterrupt:
-            print("\n⚠️ Stopped by user")
+            log.warning("\n⚠️ Stopped by user")
         except Exception as e:
-            print(f"❌ Fatal error: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception(f"❌ Fatal error: {e}")
         finally:
-            print(f"\n{'='*60}")
-            print(f"📊 FINAL STATISTICS")
-            print(f"{'='*60}")
-            print(f"✅ Successfully applied to: {len(applied_jobs)} jobs")
-            print(f"📋 Total jobs processed: {len(processed_jobs)} jobs")
-            print(f"{'='*60}")
-            browser.close()
+            log_final_stats()
+            if signed_in:
+                save_session(context.storage_state)
+            if owns_browser:
+                browser.close()
+            else:
+                context.close()
+
+def run_automation_async():
+    """Run the asyncio engine (async Playwright, overlapped LLM/OCR work)."""
+    import asyncio
+    import sys
+    from autobot.async_engine import run_automation_async as run_engine
+    start_run()
+    asyncio.run(run_engine(sys.modules[__name__]))
+
+ENGINES = {"sync": run_automation, "async": run_automation_async}
+
+IMPORT_SECONDS = time.perf_counter() - _import_started
 
 # For Jupyter notebook - run in separate thread
-def start_automation():
+def start_automation(engine="sync"):
     """Start automation in a separate thread to avoid event loop conflicts."""
-    thread = threading.Thread(target=run_automation)
+    thread = threading.Thread(target=ENGINES[engine])
     thread.start()
     return thread
 
@@ -942,4 +1131,16 @@ def start_automation():
 
 if __name__ == "__main__":
     # For standalone script
-    run_automation()
\ No newline at end of file
+    import argparse
+    parser = argparse.ArgumentParser(description="LinkedIn Easy Apply automation")
+    parser.add_argument("--engine", choices=sorted(ENGINES), default=os.getenv("AUTOBOT_ENGINE", "sync"),
+                        help="sync (default) or async pipeline")
+    parser.add_argument("--worker", action="store_true",
+                        help="stay up with everything preloaded and take runs from stdin (see autobot/worker.py)")
+    args = parser.parse_args()
+    if args.worker:
+        import sys
+        from autobot.worker import serve
+        serve(sys.modules[__name__])
+    else:
+        ENGINES[args.engine]()
\ No newline at end of file
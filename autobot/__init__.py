@@ -0,0 +1,14 @@
+"""Support modules for the AutoBot automation script (app-groq.py)."""
+import os
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Runtime state (caches, ledgers, traces) lives here and is git-ignored.
+DATA_DIR = os.getenv("AUTOBOT_DATA_DIR", os.path.join(PROJECT_ROOT, 'data'))
+
+
+def data_path(*parts):
+    """Return a path inside DATA_DIR, creating the parent directory."""
+    path = os.path.join(DATA_DIR, *parts)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return path
@@ -0,0 +1,200 @@
+"""On-disk cache of LLM answers to application form questions.
+
+Answers are keyed by the normalized question text, the field kind, the
+sorted option set (for dropdowns / radio groups) and a fingerprint of the
+CV and user preferences, so a changed profile never reuses stale answers.
+"""
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+
+
+def normalize_question(question):
+    """Lowercase, drop punctuation / required markers and collapse whitespace."""
+    text = re.sub(r"[^a-z0-9]+", " ", (question or "").lower()).strip()
+    # LinkedIn often renders the label twice ("Question Question")
+    words = text.split()
+    half = len(words) // 2
+    if half and len(words) % 2 == 0 and words[:half] == words[half:]:
+        words = words[:half]
+    return " ".join(words)
+
+
+def profile_fingerprint(cv_text, preferences):
+    """Short hash identifying the CV text and preference set."""
+    digest = hashlib.sha256()
+    digest.update((cv_text or "").encode("utf-8"))
+    digest.update(json.dumps(preferences, sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+class _InFlight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class AnswerCache:
+    """SQLite-backed answer cache with LRU/TTL eviction and in-flight dedup."""
+
+    def __init__(self, path, fingerprint="", max_entries=5000, ttl_seconds=30 * 24 * 3600):
+        self.path = path
+        self.fingerprint = fingerprint
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.deduped = 0
+        self._lock = threading.Lock()
+        self._inflight = {}
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS answers ("
+            " key TEXT PRIMARY KEY,"
+            " question TEXT,"
+            " kind TEXT,"
+            " answer TEXT NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " last_used REAL NOT NULL,"
+            " hits INTEGER NOT NULL DEFAULT 0)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS answers_last_used ON answers(last_used)")
+        self._conn.commit()
+
+    def make_key(self, question, kind, options=None):
+        """Build the cache key for a question of the given field kind."""
+        parts = [
+            normalize_question(question),
+            kind,
+            "|".join(sorted(normalize_question(o) for o in (options or []))),
+            self.fingerprint,
+        ]
+        return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        """Return the cached answer for key, or None on a miss / expired entry."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT answer, created_at FROM answers WHERE key = ?", (key,)
+            ).fetchone()
+            if row and self.ttl_seconds and now - row[1] > self.ttl_seconds:
+                self._conn.execute("DELETE FROM answers WHERE key = ?", (key,))
+                self._conn.commit()
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE answers SET last_used = ?, hits = hits + 1 WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            self.hits += 1
+            return row[0]
+
+    def contains(self, key):
+        """True if a live entry exists; does not touch counters or LRU order."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT created_at FROM answers WHERE key = ?", (key,)
+            ).fetchone()
+        return bool(row) and not (self.ttl_seconds and time.time() - row[0] > self.ttl_seconds)
+
+    def put(self, key, question, kind, answer):
+        """Store an answer and evict the least recently used entries over the limit."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO answers (key, question, kind, answer, created_at, last_used, hits)"
+                " VALUES (?, ?, ?, ?, ?, ?, 0)",
+                (key, question, kind, answer, now, now),
+            )
+            count = self._conn.execute("SELECT COUNT(*) FROM answers").fetchone()[0]
+            if count > self.max_entries:
+                self._conn.execute(
+                    "DELETE FROM answers WHERE key IN"
+                    " (SELECT key FROM answers ORDER BY last_used ASC LIMIT ?)",
+                    (count - self.max_entries,),
+                )
+            self._conn.commit()
+
+    def yes_no_answers(self):
+        """(question, kind, answered yes) for every cached checkbox decision and Yes/No selection."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT question, kind, answer FROM answers"
+                " WHERE kind = 'checkbox' OR (kind = 'select' AND answer IN ('Yes', 'No'))"
+            ).fetchall()
+        return [(question, kind, answer == "Yes") for question, kind, answer in rows]
+
+    def invalidate(self, key):
+        """Drop an entry, e.g. when the cached answer failed validation."""
+        with self._lock:
+            self._conn.execute("DELETE FROM answers WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def get_or_compute(self, question, kind, compute, options=None):
+        """Return a cached answer or call compute() once per key.
+
+        Concurrent callers asking the same question wait for the request that
+        is already in flight instead of issuing their own. An empty result from
+        compute() (None or "") is returned but never cached, so one failed or
+        blank reply is not served until the TTL runs out; an exception is
+        raised to the waiting callers too.
+        """
+        key = self.make_key(question, kind, options)
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        with self._lock:
+            pending = self._inflight.get(key)
+            owner = pending is None
+            if owner:
+                pending = self._inflight[key] = _InFlight()
+            else:
+                self.deduped += 1
+
+        if not owner:
+            pending.done.wait()
+            if pending.error is not None:
+                raise pending.error
+            return pending.result
+
+        try:
+            pending.result = compute()
+            if pending.result:
+                self.put(key, question, kind, pending.result)
+            return pending.result
+        except Exception as e:
+            pending.error = e
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            pending.done.set()
+
+    def stats(self):
+        """Hit/miss counters and current size."""
+        with self._lock:
+            size = self._conn.execute("SELECT COUNT(*) FROM answers").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "deduped": self.deduped,
+            "size": size,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+        }
+
+    def reset_stats(self):
+        """Zero the counters, e.g. at the start of another run in the same process."""
+        self.hits = self.misses = self.deduped = 0
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
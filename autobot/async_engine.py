@@ -0,0 +1,547 @@
+"""Asyncio engine for the Easy Apply pipeline.
+
+Same flow as `run_automation` in app-groq.py, but driven by the async
+Playwright API. Blocking work is moved off the event loop so it overlaps
+with browser I/O: every answer on a step is requested up front (LLM calls in
+worker threads) and consumed in DOM order while the previous field is being
+typed, and OCR runs in the OCR engine's worker pool. The human-like pauses keep their ranges
+and honour the pacing_scale setting exactly like the sync engine.
+
+`bot` is the app-groq module (or any object exposing the same helpers:
+get_llm_response, get_llm_selection, get_checkbox_decision, prefetch_answers,
+needs_answer, CONTEXT, extract_page_number, next_page_url, log_final_stats ...).
+Statistics and the pagination selectors and URL fallback come from there too,
+so both engines report and navigate the same way.
+"""
+import asyncio
+import logging
+import random
+import time
+
+from autobot.events import log
+from autobot.form_snapshot import SNAPSHOT_JS, field_locator
+from autobot.job_cards import CardHarvester, card_link, read_job_details_async
+from autobot.llm_client import LLMUnavailable
+from autobot.metrics import span, timed
+from autobot.session import is_login_url
+from autobot.waits import start_param, wait_for_cards_stable_async, wait_for_selector_async, wait_until_async
+
+ERROR_SELECTOR = ".artdeco-inline-feedback__message"
+
+
+async def human_delay(bot, min_seconds=1, max_seconds=3):
+    """Async counterpart of human_delay (scaled by the pacing_scale setting)."""
+    delay = random.uniform(min_seconds, max_seconds) * bot.CONTEXT.settings.pacing_scale
+    await asyncio.sleep(delay)
+    return delay
+
+
+async def fill_like_human(bot, field, text):
+    """Async counterpart of fill_like_human."""
+    await field.click()
+    await human_delay(bot, 0.2, 0.5)
+
+    if await field.input_value():
+        await field.fill("")
+        await human_delay(bot, 0.3, 0.7)
+
+    for i in range(len(text)):
+        await field.fill(text[:i + 1])
+        await human_delay(bot, 0.05, 0.25)
+        if random.random() < 0.15:
+            await human_delay(bot, 0.5, 1.5)
+
+    await human_delay(bot, 0.3, 0.8)
+
+
+@timed("ocr")
+async def ocr_element(bot, element):
+    """Screenshot an element and OCR it in the OCR engine's worker pool."""
+    try:
+        png = await element.screenshot()
+        start = time.perf_counter()
+        text = await asyncio.wrap_future(bot.CONTEXT.ocr_engine.submit(png, "label"))
+        log.event("ocr_call", level=logging.DEBUG, mode="label", ms=round((time.perf_counter() - start) * 1000, 1),
+                  chars=len(text))
+        return text
+    except Exception as e:
+        log.error(f"Error performing OCR: {e}")
+        return ""
+
+
+async def resolve_labels(bot, modal, snapshot):
+    """Fill in missing labels, OCR-ing all label-less fields concurrently."""
+    targets = [info for info in snapshot if bot.needs_answer(info) and not info["label"]]
+    texts = await asyncio.gather(
+        *(ocr_element(bot, field_locator(modal, info["id"])) for info in targets)
+    )
+    for info, text in zip(targets, texts):
+        default = "Unknown checkbox" if info["kind"] == "checkbox" else "Unknown question"
+        info["label"] = text or default
+
+
+def select_options(info):
+    if info["kind"] == "radio":
+        return [opt["label"] for opt in info["options"]]
+    return [text for text in info["options"] if text and text.lower() != "select an option"]
+
+
+async def answer_field(bot, info):
+    """Resolve the answer for one field in a worker thread."""
+    question = info["label"]
+    if info["kind"] == "text":
+        return await asyncio.to_thread(bot.get_llm_response, question)
+    if info["kind"] in ("select", "radio"):
+        options = select_options(info)
+        if not options:
+            return None
+        return await asyncio.to_thread(bot.get_llm_selection, question, options)
+    decision = bot.get_local_checkbox_decision(question)
+    if decision is not None:
+        return decision
+    return await asyncio.to_thread(bot.get_checkbox_decision, question)
+
+
+@timed("field.text")
+async def apply_text(bot, modal, info, answer):
+    field = field_locator(modal, info["id"])
+    question = info["label"]
+    log.debug(f"Filling field for: '{question}'")
+    await fill_like_human(bot, field, answer)
+    await human_delay(bot, 1.5, 3.5)
+
+    error_msgs = await modal.locator(ERROR_SELECTOR).all()
+    retry_count = 0
+    while error_msgs and retry_count < 3:
+        error_text = await error_msgs[0].inner_text()
+        log.warning(f"Error detected: {error_text}")
+        await human_delay(bot, 2, 4)
+        answer = await asyncio.to_thread(bot.get_llm_response, question, answer, error_text)
+        await fill_like_human(bot, field, answer)
+        await human_delay(bot, 1.5, 3)
+        error_msgs = await modal.locator(ERROR_SELECTOR).all()
+        retry_count += 1
+    log.event("field_filled", f"Filled '{question}' with '{answer}'", kind="text",
+              question=question, answer=answer)
+
+
+@timed("field.select")
+async def apply_select(bot, modal, info, selected):
+    dropdown = field_locator(modal, info["id"])
+    await human_delay(bot, 1, 2.5)
+    await dropdown.click()
+    await human_delay(bot, 0.5, 1.5)
+    await dropdown.select_option(label=selected)
+    log.event("field_filled", f"Selected '{selected}' for '{info['label']}'", kind="select",
+              question=info["label"], answer=selected)
+    await human_delay(bot, 1.5, 3)
+
+
+@timed("field.radio")
+async def apply_radio(bot, modal, info, selected):
+    await human_delay(bot, 1.5, 3)
+    log.event("field_filled", f"Choosing '{selected}' for '{info['label']}'", kind="radio",
+              question=info["label"], answer=selected)
+    for opt in info["options"]:
+        if opt["label"].strip().lower() != selected.strip().lower():
+            continue
+        for handle in (opt["label_id"], opt["input"]):
+            try:
+                target = field_locator(modal, handle)
+                await target.scroll_into_view_if_needed()
+                await human_delay(bot, 0.3, 0.8)
+                await target.click(force=True)
+                log.debug(f"Clicked option '{opt['label']}'")
+                break
+            except Exception as e:
+                log.warning(f"Failed to click option '{opt['label']}': {e}")
+        break
+    await human_delay(bot, 1.5, 3)
+
+
+@timed("field.checkbox")
+async def apply_checkbox(bot, modal, info, should_check):
+    label_text = info["label"]
+    log.debug(f"Processing checkbox: '{label_text}'")
+    await human_delay(bot, 1, 2)
+    if not should_check:
+        log.debug(f"Skipping checkbox '{label_text}'")
+        return
+    try:
+        checkbox = field_locator(modal, info["id"])
+        await checkbox.scroll_into_view_if_needed()
+        await human_delay(bot, 0.3, 0.8)
+        await checkbox.click(force=True)
+        log.event("field_filled", f"✅ Checked box for '{label_text}'", kind="checkbox",
+                  question=label_text, answer=True)
+        await human_delay(bot, 1.5, 3)
+    except Exception as e:
+        log.error(f"❌ Failed to click checkbox '{label_text}': {e}")
+
+
+APPLIERS = {
+    "text": apply_text,
+    "select": apply_select,
+    "radio": apply_radio,
+    "checkbox": apply_checkbox,
+}
+
+
+@timed("form_replay")
+async def replay_step(bot, modal, snapshot, fingerprint):
+    """Async counterpart of replay_step: fill fields from a previously submitted form."""
+    actions = bot.CONTEXT.form_memory.plan(fingerprint, snapshot)
+    if not actions:
+        return
+    log.info(f"♻️ Replaying {len(actions)} answers from a previously submitted form")
+    for info, answer in actions:
+        try:
+            if info["kind"] == "select":
+                await human_delay(bot, 0.5, 1.5)
+                await field_locator(modal, info["id"]).select_option(answer)
+                log.event("field_filled", f"Replayed '{answer}' for '{info['label']}'", kind="select",
+                          question=info["label"], answer=answer, source="replay")
+            else:
+                await APPLIERS[info["kind"]](bot, modal, info, answer)
+        except LLMUnavailable:
+            raise
+        except Exception as e:
+            log.warning(f"⚠️ Could not replay '{info['label']}': {e}")
+            info["replayed"] = False
+
+    if await modal.locator(ERROR_SELECTOR).count():
+        log.warning("⚠️ Replayed form shows validation errors, forgetting it")
+        bot.CONTEXT.form_memory.forget(fingerprint)
+
+
+async def process_step(bot, modal):
+    """Fill every field of the current modal step; returns the step's form fingerprint."""
+    snapshot = await modal.evaluate(SNAPSHOT_JS)
+    fingerprint = bot.CONTEXT.form_memory.fingerprint(snapshot)
+    await replay_step(bot, modal, snapshot, fingerprint)
+    await resolve_labels(bot, modal, snapshot)
+    await asyncio.to_thread(bot.prefetch_answers, snapshot)
+
+    # Request every answer now; each is awaited only when its field is reached
+    fields = [info for info in snapshot if bot.needs_answer(info)]
+    tasks = {info["id"]: asyncio.ensure_future(answer_field(bot, info)) for info in fields}
+    try:
+        for kind in ("text", "select", "radio", "checkbox"):
+            for info in fields:
+                if info["kind"] != kind:
+                    continue
+                try:
+                    answer = await tasks[info["id"]]
+                    if answer is None:
+                        continue
+                    await APPLIERS[kind](bot, modal, info, answer)
+                except LLMUnavailable:
+                    raise
+                except Exception as e:
+                    log.error(f"Error handling {kind} field '{info['label']}': {e}")
+    finally:
+        for task in tasks.values():
+            task.cancel()
+    return fingerprint
+
+
+async def fill_profile_fields(bot, modal):
+    for selector, value in (("input[id*='phone']", bot.CONTEXT.settings.preferences["phone"]),
+                            ("input[id*='zip']", bot.CONTEXT.settings.preferences["zip_code"])):
+        try:
+            field = modal.locator(selector).first
+            if await field.is_visible():
+                await fill_like_human(bot, field, value)
+                await human_delay(bot, 1, 2)
+        except Exception:
+            pass
+
+
+async def click_step_button(bot, page, modal):
+    """Click submit/apply/review/next; returns the button text, or None if nothing was clickable."""
+    for btn_text in ["submit", "apply", "review", "next"]:
+        try:
+            button = modal.locator(f"button:has-text('{btn_text}')").first
+            if await button.is_visible() and await button.is_enabled():
+                await button.scroll_into_view_if_needed()
+                await human_delay(bot, 2, 4)
+                await button.click()
+                if btn_text in ["submit", "apply"]:
+                    await human_delay(bot, 4, 7)
+                    try:
+                        await page.locator("button:has-text('Done')").first.click(timeout=10000)
+                        log.info("✅ Clicked Done")
+                    except Exception:
+                        pass
+                return btn_text
+        except Exception:
+            continue
+    return None
+
+
+async def apply_to_job(bot, page, card):
+    job_id = card["job_id"]
+    job_link = card_link(page, card)
+    await job_link.scroll_into_view_if_needed()
+    await job_link.click()
+    await wait_until_async(lambda: str(job_id) in page.url, timeout=5, name="job detail pane")
+
+    if not bot.check_relevance(job_id, card, await read_job_details_async(page, card)):
+        return False
+
+    try:
+        await page.locator(".jobs-apply-button").first.click(timeout=15000)
+        log.info("✅ Clicked Easy Apply")
+        await human_delay(bot, 3, 5)
+    except Exception:
+        log.error("❌ Easy Apply not found")
+        bot.CONTEXT.job_ledger.record(job_id, "skipped", error="no easy apply button")
+        return False
+
+    modal = page.locator(".artdeco-modal").first
+    await modal.wait_for(timeout=10000)
+
+    step_count = 0
+    submitted = False
+    llm_error = None
+    bot.CONTEXT.form_memory.discard()
+    while step_count < 10:
+        log.info(f"🔍 Step {step_count + 1}...")
+        bot.CONTEXT.progress.update(step=step_count + 1)
+        with span("modal_step", job_id=job_id, step=step_count + 1):
+            await human_delay(bot, 2, 4)
+            await fill_profile_fields(bot, modal)
+            try:
+                fingerprint = await process_step(bot, modal)
+            except LLMUnavailable as e:
+                llm_error = str(e)
+                log.error(f"❌ LLM unavailable, abandoning this application: {e}")
+                break
+            bot.CONTEXT.form_memory.stage(fingerprint, await modal.evaluate(SNAPSHOT_JS))
+            clicked = await click_step_button(bot, page, modal)
+        if not clicked:
+            log.warning("⚠️ No buttons to click")
+            break
+        log.event("step_done", f"✅ Clicked {clicked}", job_id=job_id, step=step_count + 1, button=clicked)
+        submitted = submitted or clicked in ("submit", "apply")
+        await human_delay(bot, 3, 6)
+        step_count += 1
+
+    if submitted:
+        bot.CONTEXT.form_memory.commit()
+        bot.CONTEXT.job_ledger.record(job_id, "applied", steps=step_count)
+        log.event("job_done", f"✅ Successfully applied to job {job_id}", job_id=job_id, status="applied",
+                  steps=step_count)
+    else:
+        bot.CONTEXT.form_memory.discard()
+        bot.CONTEXT.job_ledger.record(job_id, "failed", steps=step_count,
+                              error=f"llm unavailable: {llm_error}"[:500] if llm_error else "application not submitted")
+        log.event("job_done", f"⚠️ Could not submit application for job {job_id}", logging.WARNING,
+                  job_id=job_id, status="failed", steps=step_count)
+    try:
+        await page.keyboard.press("Escape")
+        await wait_for_selector_async(page, ".artdeco-modal", timeout=5, state="hidden", name="modal closed")
+    except Exception:
+        pass
+    return True
+
+
+async def find_next_button(bot, page):
+    """Async counterpart of find_next_button_with_ocr: selectors first, then OCR of the pagination."""
+    await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+    await wait_for_selector_async(page, bot.PAGINATION_SELECTOR, timeout=5, name="pagination attached")
+
+    for selector in bot.NEXT_BUTTON_SELECTORS:
+        try:
+            next_btn = page.locator(selector).first
+            if (await next_btn.is_visible() and await next_btn.is_enabled()
+                    and not await next_btn.get_attribute("disabled")):
+                await next_btn.scroll_into_view_if_needed()
+                await next_btn.click()
+                log.info(f"✅ Clicked Next button using selector: {selector}")
+                return True
+        except Exception as e:
+            log.debug(f"❌ Failed with selector {selector}: {e}")
+
+    # Fallback: a "Next" the OCR can read but no selector matched
+    for selector in bot.PAGINATION_SELECTORS:
+        pagination = page.locator(selector).first
+        try:
+            if not await pagination.is_visible():
+                continue
+            png = await pagination.screenshot()
+            ocr_text = await asyncio.wrap_future(bot.CONTEXT.ocr_engine.submit(png, "block"))
+        except Exception as e:
+            log.debug(f"OCR of pagination {selector} failed: {e}")
+            continue
+        if "next" not in ocr_text.lower():
+            break
+        log.warning("⚠️ Next button detected in OCR but couldn't click with selectors")
+        for btn in await page.locator("button").all():
+            try:
+                if await btn.is_visible() and bot.is_next_button_text(await btn.inner_text()):
+                    await btn.scroll_into_view_if_needed()
+                    await btn.click()
+                    log.info("✅ Clicked button with text: next")
+                    return True
+            except Exception:
+                continue
+        break
+
+    log.error("❌ No Next button found")
+    return False
+
+
+@timed("next_page")
+async def go_to_next_page(bot, page):
+    """Async counterpart of go_to_next_page (Next button, then URL fallback)."""
+    current_url = page.url
+    current_page_num = bot.extract_page_number(current_url)
+    log.info(f"\n🔄 Attempting to navigate to next page (current: {current_page_num})...")
+    try:
+        if await find_next_button(bot, page):
+            await wait_until_async(lambda: page.url != current_url, timeout=10, name="next page url")
+            if page.url != current_url or bot.extract_page_number(page.url) > current_page_num:
+                log.info(f"✅ Successfully navigated to page {bot.extract_page_number(page.url)}")
+                return True
+            log.warning("⚠️ Button clicked but page didn't change")
+
+        log.info("🔧 Trying URL manipulation...")
+        new_url = bot.next_page_url(current_url)
+        await page.goto(new_url)
+        log.info(f"✅ Navigated via URL to start={start_param(new_url)}")
+        await wait_until_async(lambda: start_param(page.url) != start_param(current_url), timeout=10,
+                               name="start= change")
+        return True
+    except Exception as e:
+        log.error(f"❌ Error navigating to next page: {e}")
+        return False
+
+
+async def process_page(bot, page, job_counter):
+    no_new_jobs = 0
+    harvester = CardHarvester()
+    while no_new_jobs < 3:
+        with span("card_scan"):
+            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+            await wait_for_cards_stable_async(page, timeout=5, name="lazy-loaded cards")
+
+            new_cards = await harvester.harvest_async(page)
+            if not harvester.total:
+                log.warning("⚠️ No job listings found, scrolling and retrying...")
+                await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+                await wait_for_cards_stable_async(page, timeout=10, name="lazy-loaded cards")
+                new_cards = await harvester.harvest_async(page)
+        if not harvester.total:
+            log.error("❌ Still no jobs found, breaking...")
+            break
+
+        log.info(f"📋 Found {len(new_cards)} new job cards on page ({harvester.total} so far)")
+        found_new = False
+        for card in new_cards:
+            job_id = card["job_id"]
+            try:
+                if job_id is None or bot.CONTEXT.job_ledger.done(job_id):
+                    continue
+                bot.CONTEXT.job_ledger.record(job_id, "seen")
+                found_new = True
+
+                if card["applied"]:
+                    log.info(f"⏭️ Skipping {job_id} (already applied)")
+                    bot.CONTEXT.job_ledger.record(job_id, "skipped", error="already applied")
+                    continue
+
+                job_counter += 1
+                log.event("job_started", f"\n{'='*50}\n💼 Applying to job {job_counter} ({job_id})...\n{'='*50}",
+                          job_id=job_id, number=job_counter)
+                bot.CONTEXT.progress.update(force=True, job_id=job_id, step=0)
+                if not await apply_to_job(bot, page, card):
+                    continue
+
+                delay = await human_delay(bot, *bot.CONTEXT.settings.application_delay_range)
+                log.info(f"⏳ Waited {delay:.2f} seconds before next application")
+            except Exception as e:
+                log.error(f"❌ Error with job: {e}")
+                if job_id is not None:
+                    bot.CONTEXT.job_ledger.record(job_id, "failed", error=str(e)[:500])
+
+        no_new_jobs = 0 if found_new else no_new_jobs + 1
+        if not found_new:
+            log.warning(f"⚠️ No new jobs found ({no_new_jobs}/3)")
+    return job_counter
+
+
+async def save_session(bot, context):
+    try:
+        bot.CONTEXT.session.save(await context.storage_state())
+    except Exception as e:
+        log.warning(f"⚠️ Could not save the browser session: {e}")
+
+
+async def open_job_search(bot, page, context, restored):
+    """Async counterpart of open_job_search."""
+    settings = bot.CONTEXT.settings
+    if restored:
+        with span("session_check"):
+            await page.goto(settings.search_url)
+        if not is_login_url(page.url):
+            log.event("session", "🍪 Reusing the saved LinkedIn session", reused=True)
+            return
+        log.info("🍪 Saved session has expired, logging in again")
+        bot.CONTEXT.session.forget()
+
+    log.info("Logging in to LinkedIn...")
+    with span("login"):
+        await page.goto(f"{settings.linkedin_base_url}/login")
+        await page.fill("#username", settings.email)
+        await page.fill("#password", settings.password)
+        await page.click("button[type='submit']")
+        await wait_until_async(lambda: not is_login_url(page.url), timeout=30, name="login redirect")
+    log.event("session", "Logged in successfully", reused=False)
+    await save_session(bot, context)
+    await page.goto(settings.search_url)
+
+
+async def run_automation_async(bot, max_pages=None):
+    """Async counterpart of run_automation."""
+    max_pages = max_pages or bot.CONTEXT.settings.max_pages
+    from playwright.async_api import async_playwright
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=bot.CONTEXT.settings.headless)
+        saved_session = bot.CONTEXT.session.state()
+        context = await browser.new_context(storage_state=saved_session)
+        page = await context.new_page()
+        signed_in = False
+        try:
+            await open_job_search(bot, page, context, restored=saved_session is not None)
+            signed_in = True
+            await wait_for_cards_stable_async(page, timeout=15, name="search results")
+
+            job_counter = 0
+            for page_number in range(1, max_pages + 1):
+                log.info(f"\n{'='*60}\n📄 PROCESSING PAGE {page_number}\n{'='*60}", page=page_number)
+                bot.CONTEXT.progress.update(force=True, page=page_number, job_id=None, step=None)
+                job_counter = await process_page(bot, page, job_counter)
+                log.info(f"\n✅ Completed processing page {page_number}")
+                log.info(f"📊 Total jobs applied: {bot.CONTEXT.job_ledger.session_counts['applied']}")
+                if page_number == max_pages:
+                    log.info("✅ Reached maximum page limit")
+                    break
+                if not await go_to_next_page(bot, page):
+                    log.error("❌ Could not navigate to next page. Ending automation.")
+                    break
+                if not await wait_for_cards_stable_async(page, timeout=15, name="next page cards"):
+                    log.warning("⚠️ Timeout waiting for job cards, but continuing...")
+        except KeyboardInterrupt:
+            log.warning("\n⚠️ Stopped by user")
+        except asyncio.CancelledError:
+            log.warning("\n⚠️ Stopped by user")
+            raise  # after the cleanup below, so the caller sees the cancellation
+        except Exception as e:
+            log.exception(f"❌ Fatal error: {e}")
+        finally:
+            bot.log_final_stats()
+            if signed_in:
+                await save_session(bot, context)
+            await browser.close()
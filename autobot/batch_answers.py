@@ -0,0 +1,92 @@
+"""One structured-output LLM request for all unanswered questions on a step.
+
+Each question is a dict with `id`, `kind` ("text" | "select" | "checkbox")
+and `question`, plus `options` for selects / radio groups. The model is asked
+for a single JSON object mapping every id to its answer; `parse_batch_response`
+validates that object against the questions and drops anything unusable so the
+caller can fall back to per-field calls for those ids only.
+"""
+import json
+import re
+
+
+def batch_schema(questions):
+    """JSON schema describing the expected answer object."""
+    properties = {}
+    for q in questions:
+        if q["kind"] == "select":
+            properties[q["id"]] = {"type": "string", "enum": list(q["options"])}
+        elif q["kind"] == "checkbox":
+            properties[q["id"]] = {"type": "string", "enum": ["Yes", "No"]}
+        else:
+            properties[q["id"]] = {"type": "string"}
+    return {
+        "type": "object",
+        "properties": properties,
+        "required": [q["id"] for q in questions],
+        "additionalProperties": False,
+    }
+
+
+def build_batch_prompt(questions, context):
+    """Prompt asking for every answer at once; context is the CV/preference preamble."""
+    lines = []
+    for q in questions:
+        if q["kind"] == "select":
+            hint = "one of: " + " | ".join(q["options"])
+        elif q["kind"] == "checkbox":
+            hint = "Yes or No - should the applicant check this box?"
+        else:
+            hint = "number for experience, Yes/No for yes/no questions, short text for others"
+        lines.append(f'- "{q["id"]}": {q["question"]} ({hint})')
+    return (
+        f"{context}\n"
+        f"Answer each job application question below.\n"
+        + "\n".join(lines)
+        + "\nRespond with ONLY a JSON object matching this schema, no explanation:\n"
+        + json.dumps(batch_schema(questions))
+    )
+
+
+def _match_option(answer, options):
+    if answer in options:
+        return answer
+    lowered = answer.lower()
+    for option in options:
+        if option.lower() == lowered:
+            return option
+    for option in options:
+        if lowered and lowered in option.lower():
+            return option
+    return None
+
+
+def parse_batch_response(response, questions):
+    """Return {id: answer} for the valid answers in the model's JSON reply."""
+    if not response:
+        return {}
+    match = re.search(r"\{.*\}", response, re.DOTALL)
+    if not match:
+        return {}
+    try:
+        data = json.loads(match.group(0))
+    except ValueError:
+        return {}
+    if not isinstance(data, dict):
+        return {}
+
+    answers = {}
+    for q in questions:
+        value = data.get(q["id"])
+        if value is None or isinstance(value, (dict, list)):
+            continue
+        value = str(value).strip()
+        if not value:
+            continue
+        if q["kind"] == "select":
+            value = _match_option(value, q["options"])
+        elif q["kind"] == "checkbox":
+            value = "Yes" if value.lower().startswith("y") else "No"
+        if value is not None:
+            answers[q["id"]] = value
+    return answers
@@ -0,0 +1,164 @@
+"""Local classifier for checkbox and yes/no questions.
+
+Logistic regression over hashed word unigrams and bigrams of the normalized
+question, in NumPy. Every checkbox or yes/no decision the LLM makes is logged
+to SQLite and used for one SGD step straight away. On first use, the model
+is fitted by replaying the log for a few epochs. When the log is empty,
+it can be seeded from the answer cache.
+
+`predict` answers only when the model is confident. That means the
+probability is past the threshold, at least `min_examples` decisions are
+logged and both answers occur, and enough of the question's n-grams were
+seen in training. A question made of new words is never decided by the
+bias alone. Everything else goes to the LLM, whose answer is logged in turn.
+"""
+import math
+import random
+import sqlite3
+import threading
+import time
+import zlib
+
+import numpy as np
+
+from autobot.answer_cache import normalize_question
+
+BINARY_TYPES = ("checkbox", "yes_no")
+
+
+def hashed_features(question, qtype, dims):
+    """Sorted unique feature columns: the question type, word unigrams and bigrams."""
+    words = normalize_question(question).split()
+    grams = [f"__{qtype}"] + words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+    return np.unique(np.fromiter((zlib.crc32(g.encode("utf-8")) % dims for g in grams),
+                                 dtype=np.int64, count=len(grams)))
+
+
+class BinaryClassifier:
+    """Hashed n-gram logistic regression, trained online from logged decisions."""
+
+    def __init__(self, path, threshold=0.9, dims=2 ** 18, min_examples=20, min_coverage=0.6,
+                 learning_rate=0.5, l2=1e-5, epochs=8, max_examples=5000):
+        self.path = path
+        self.threshold = threshold
+        self.dims = dims
+        self.min_examples = min_examples
+        self.min_coverage = min_coverage
+        self.learning_rate = learning_rate
+        self.l2 = l2
+        self.epochs = epochs
+        self.max_examples = max_examples
+        self.answered = 0
+        self.deferred = 0
+        self.learned = 0
+        self._weights = None
+        self._seen = None
+        self._bias = 0.0
+        self._labels = [0, 0]
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS decisions ("
+            " question TEXT NOT NULL,"
+            " qtype TEXT NOT NULL,"
+            " label INTEGER NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " PRIMARY KEY (question, qtype))"
+        )
+        self._conn.commit()
+
+    def size(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM decisions").fetchone()[0]
+
+    def seed(self, decisions):
+        """Log (question, qtype, label) decisions without training; used when the log is empty."""
+        now = time.time()
+        rows = [(normalize_question(q), qtype, int(bool(label)), now)
+                for q, qtype, label in decisions if qtype in BINARY_TYPES and normalize_question(q)]
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO decisions VALUES (?, ?, ?, ?)", rows)
+            self._conn.commit()
+            self._weights = None
+        return len(rows)
+
+    def _step(self, columns, label):
+        value = 1.0 / math.sqrt(len(columns))
+        z = float(self._weights[columns].sum()) * value + self._bias
+        gradient = 1.0 / (1.0 + math.exp(-z)) - label if z > -30 else -label
+        self._weights[columns] -= self.learning_rate * (gradient * value + self.l2 * self._weights[columns])
+        self._bias -= self.learning_rate * gradient
+        self._seen[columns] = True
+
+    def _ensure_trained(self):
+        """Fit the model on the decision log, once per process (caller holds the lock)."""
+        if self._weights is not None:
+            return
+        rows = self._conn.execute(
+            "SELECT question, qtype, label FROM decisions ORDER BY created_at DESC LIMIT ?",
+            (self.max_examples,),
+        ).fetchall()
+        self._weights = np.zeros(self.dims, dtype=np.float32)
+        self._seen = np.zeros(self.dims, dtype=bool)
+        self._bias = 0.0
+        self._labels = [0, 0]
+        examples = [(hashed_features(q, qtype, self.dims), label) for q, qtype, label in rows]
+        for _, label in examples:
+            self._labels[label] += 1
+        shuffle = random.Random(0).shuffle
+        for _ in range(self.epochs):
+            shuffle(examples)
+            for columns, label in examples:
+                self._step(columns, label)
+
+    def probability(self, question, qtype):
+        """(P(yes), share of the question's n-grams seen in training)."""
+        columns = hashed_features(question, qtype, self.dims)
+        with self._lock:
+            self._ensure_trained()
+            z = float(self._weights[columns].sum()) / math.sqrt(len(columns)) + self._bias
+            coverage = float(self._seen[columns].mean())
+        return 1.0 / (1.0 + math.exp(-max(z, -30.0))), coverage
+
+    def predict(self, question, qtype):
+        """True/False when the model is confident, None when the LLM should decide."""
+        if self.threshold >= 1 or qtype not in BINARY_TYPES or not normalize_question(question):
+            return None
+        p, coverage = self.probability(question, qtype)
+        confident = (
+            min(self._labels) > 0
+            and sum(self._labels) >= self.min_examples
+            and coverage >= self.min_coverage
+            and max(p, 1.0 - p) >= self.threshold
+        )
+        if not confident:
+            self.deferred += 1
+            return None
+        self.answered += 1
+        return p >= 0.5
+
+    def learn(self, question, qtype, label):
+        """Log a decision made elsewhere (the LLM) and take one SGD step on it."""
+        question = normalize_question(question)
+        if qtype not in BINARY_TYPES or not question:
+            return
+        label = int(bool(label))
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO decisions VALUES (?, ?, ?, ?)",
+                               (question, qtype, label, time.time()))
+            self._conn.commit()
+            if self._weights is not None:
+                self._labels[label] += 1
+                self._step(hashed_features(question, qtype, self.dims), label)
+            self.learned += 1
+
+    def stats(self):
+        return {"answered": self.answered, "deferred": self.deferred, "learned": self.learned,
+                "size": self.size()}
+
+    def reset_stats(self):
+        self.answered = self.deferred = self.learned = 0
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,367 @@
+"""Run settings and the shared objects built from them, created on first use.
+
+Importing app-groq.py used to read config.json, parse the CV, open every
+SQLite store and build the LLM clients. Now it does none of that:
+
+    Settings    backend/config.json (AUTOBOT_CONFIG) or environment
+                variables, plus the environment-only overrides (target site,
+                headless, page limit, LLM endpoint); cheap to build
+    AppContext  the CV artifacts, retrieval index, prompt compiler, LLM
+                router, caches, ledger and progress file, each built on
+                first access
+
+`CONTEXT` stands in for the process-wide AppContext and creates it (with
+Settings from the default config) the first time an attribute is read.
+`set_context` installs another one, e.g. with settings built from a dict:
+
+    set_context(AppContext(Settings(config={"cv_path": "cv.pdf", ...})))
+
+`AppContext.warm()` builds everything at once and returns the seconds it
+took. The engines call it before launching the browser, so a missing CV
+still fails fast. A long-lived process (autobot/worker.py) calls `new_run`
+before each run. When the config changes, it swaps in `reconfigure(settings)`,
+which keeps every member whose inputs did not change.
+"""
+import json
+import os
+import re
+import threading
+import time
+from functools import cached_property
+
+from autobot import PROJECT_ROOT, DATA_DIR, data_path
+from autobot.events import log
+
+DEFAULT_CONFIG_PATH = os.path.join(PROJECT_ROOT, "backend", "config.json")
+DEFAULT_SEARCH_PATH = ("/jobs/search/?keywords=machine%20learning%20intern"
+                       "&location=Silicon%20Valley%2C%20California&f_AL=true&f_TPR=r604800")
+
+
+def _flag(value):
+    return str(value).lower() in ("1", "true", "yes")
+
+
+def _file_stamp(path):
+    try:
+        return path, os.path.getmtime(path)
+    except OSError:
+        return path, None
+
+
+class Settings:
+    """User configuration from config.json, or from environment variables without one."""
+
+    def __init__(self, config_path=None, config=None):
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        self.config_path = config_path or os.getenv("AUTOBOT_CONFIG", DEFAULT_CONFIG_PATH)
+        if config is None and os.path.exists(self.config_path):
+            log.info(f"Loading configuration from {self.config_path}")
+            with open(self.config_path, "r") as f:
+                config = json.load(f)
+        if config is not None:
+            self._from_config(config)
+        else:
+            log.info("No config.json found. Reading from environment variables and defaults.")
+            self._from_env()
+
+        # Target site and browser (overridable to run against local fixtures, see benchmarks/)
+        self.linkedin_base_url = os.getenv("LINKEDIN_BASE_URL", "https://www.linkedin.com").rstrip("/")
+        self.search_url = os.getenv("SEARCH_URL", f"{self.linkedin_base_url}{DEFAULT_SEARCH_PATH}")
+        self.headless = os.getenv("HEADLESS", "0") == "1"
+        self.max_pages = int(os.getenv("MAX_PAGES", 10))
+
+        # Groq's endpoint (GROQ_BASE_URL as for the Groq SDK); AUTOBOT_LLM_BACKEND forces one backend
+        self.groq_api_url = os.getenv("GROQ_BASE_URL", "https://api.groq.com").rstrip("/") + "/openai/v1"
+        self.llm_backend = os.getenv("AUTOBOT_LLM_BACKEND") or None
+
+    def _from_config(self, config):
+        self.email = config.get("linkedin_email", "")
+        self.password = config.get("linkedin_password", "")
+        self.cv_path = config.get("cv_path", "")
+        self.groq_api_key = config.get("groq_api_key", "")
+        self.preferences = {
+            "salary_expectation": config.get("salary_expectation", 0),
+            "location": config.get("location", ""),
+            "commuting": config.get("commuting", ""),
+            "veteran_status": config.get("veteran_status", "No"),
+            "disability": config.get("disability", "No"),
+            "ethnicity": config.get("ethnicity", ""),
+            "gender": config.get("gender", ""),
+            "address": config.get("address", ""),
+            "zip_code": config.get("zip_code", ""),
+            "middle_name": config.get("middle_name", ""),
+            "phone": config.get("phone", ""),
+        }
+        # Scale for the deliberate human-like pauses (1.0 = as tuned, 0 = disabled)
+        self.pacing_scale = float(os.getenv("PACING_SCALE", config.get("pacing_scale", 1.0)))
+        # Deliberate pause between applications, in seconds (scaled by pacing_scale)
+        self.application_delay_range = tuple(config.get("application_delay_range", (15, 45)))
+        # Extra keyword -> answer rules, checked before the built-in ones
+        self.question_rules = config.get("question_rules") or []
+        # Per-stage timing spans (JSONL trace + histograms for /metrics)
+        self.metrics_enabled = _flag(os.getenv("AUTOBOT_METRICS", config.get("metrics", False)))
+        # Jobs whose description scores below this against the CV are skipped (0 = score only)
+        self.relevance_threshold = float(os.getenv("RELEVANCE_THRESHOLD", config.get("relevance_threshold") or 0.0))
+        # LLM backends, per-question-type routes and client options, see autobot/llm_backends.py
+        self.llm = config.get("llm") or {}
+        # Confidence the local checkbox / yes-no classifier needs to answer without the LLM (1 = off)
+        self.classifier_threshold = float(
+            os.getenv("CLASSIFIER_THRESHOLD", config.get("classifier_threshold") or 0.9))
+
+    def values(self):
+        """Every setting, for comparing two loads of the config."""
+        return {k: v for k, v in vars(self).items() if k != "config_path"}
+
+    def _from_env(self):
+        self.email = os.getenv("LINKEDIN_EMAIL", "")
+        self.password = os.getenv("LINKEDIN_PASSWORD", "")
+        self.cv_path = os.getenv("CV_PATH", "")
+        self.groq_api_key = os.getenv("GROQ_API_KEY", "")
+        self.preferences = {
+            "salary_expectation": int(os.getenv("SALARY_EXPECTATION", 0)),
+            "location": os.getenv("LOCATION", ""),
+            "commuting": os.getenv("COMMUTING", ""),
+            "veteran_status": os.getenv("VETERAN_STATUS", "No"),
+            "disability": os.getenv("DISABILITY", "No"),
+            "ethnicity": os.getenv("ETHNICITY", ""),
+            "gender": os.getenv("GENDER", ""),
+            "address": os.getenv("ADDRESS", ""),
+            "zip_code": os.getenv("ZIP_CODE", ""),
+            "middle_name": os.getenv("MIDDLE_NAME", ""),
+            "phone": os.getenv("PHONE", ""),
+        }
+        self.pacing_scale = float(os.getenv("PACING_SCALE", 1.0))
+        self.application_delay_range = (15, 45)
+        self.question_rules = []
+        self.metrics_enabled = _flag(os.getenv("AUTOBOT_METRICS", "0"))
+        self.relevance_threshold = float(os.getenv("RELEVANCE_THRESHOLD", 0.0))
+        self.llm = {}
+        self.classifier_threshold = float(os.getenv("CLASSIFIER_THRESHOLD", 0.9))
+
+
+class AppContext:
+    """Shared objects of a run, each built from the settings on first access."""
+
+    WARM = ("question_rules", "cv_index", "prompts", "relevance", "answer_cache", "form_memory",
+            "binary_classifier", "llm_router", "ocr_engine", "job_ledger", "progress", "session")
+
+    # Settings each member is built from ("cv" is the CV file and its mtime);
+    # reconfigure() keeps the members whose inputs did not change
+    INPUTS = {
+        "question_rules": ("question_rules",),
+        "cv_artifacts": ("cv",),
+        "cv_years_of_experience": ("cv",),
+        "cv_index": ("cv",),
+        "relevance": ("cv",),
+        "prompts": ("cv", "preferences"),
+        "answer_cache": ("cv", "preferences"),
+        "form_memory": ("cv", "preferences"),
+        "binary_classifier": ("classifier_threshold",),
+        "llm_router": ("llm", "groq_api_key", "groq_api_url", "llm_backend"),
+        "ocr_engine": (),
+        "job_ledger": (),
+        "session": ("linkedin_base_url", "email"),
+    }
+
+    def __init__(self, settings=None, run_id=None):
+        if settings is not None:
+            self.settings = settings
+        self.run_id = run_id or os.getenv("AUTOBOT_RUN_ID")
+        self.cv_stamp = None
+
+    @cached_property
+    def settings(self):
+        return Settings()
+
+    @cached_property
+    def question_rules(self):
+        from autobot.question_rules import RuleEngine
+
+        return RuleEngine.from_config(self.settings.question_rules)
+
+    @cached_property
+    def cv_artifacts(self):
+        """Text, sections and skills of the CV (cached by file content hash)."""
+        from autobot.cv_artifacts import load_cv_artifacts
+
+        self.cv_stamp = _file_stamp(self.settings.cv_path)
+        artifacts = load_cv_artifacts(self.settings.cv_path, os.path.join(DATA_DIR, "cv"))
+        if not artifacts["text"]:
+            raise ValueError("CV text extraction failed. Please check the PDF path and content.")
+        return artifacts
+
+    @property
+    def cv_text(self):
+        return self.cv_artifacts["text"]
+
+    @cached_property
+    def cv_years_of_experience(self):
+        """Largest "N years of experience" stated in the CV, used for numeric questions."""
+        matches = re.findall(r"(\d+)\s*(?:year|years)\s*(?:of\s*experience|in\s*\w+)", self.cv_text.lower())
+        return max(int(match) for match in matches) if matches else None
+
+    @cached_property
+    def cv_index(self):
+        """Retrieval index used to pick the CV snippets relevant to each question."""
+        from autobot.cv_retrieval import CvIndex
+
+        return CvIndex.from_artifacts(self.cv_artifacts)
+
+    @cached_property
+    def prompts(self):
+        """Prompt templates per question type over a fixed profile prefix."""
+        from autobot.prompts import PromptCompiler
+
+        return PromptCompiler(self.cv_index, self.settings.preferences, self.cv_years_of_experience,
+                              self.cv_artifacts.get("skills") or [])
+
+    @cached_property
+    def relevance(self):
+        """TF-IDF scorer for the job relevance prefilter."""
+        from autobot.relevance import RelevanceScorer
+
+        return RelevanceScorer.from_artifacts(self.cv_artifacts)
+
+    @cached_property
+    def answer_cache(self):
+        """LLM answers shared across runs; a CV/preference change starts a fresh key space."""
+        from autobot.answer_cache import AnswerCache, profile_fingerprint
+
+        return AnswerCache(data_path("answer_cache.sqlite3"),
+                           fingerprint=profile_fingerprint(self.cv_text, self.settings.preferences))
+
+    @cached_property
+    def form_memory(self):
+        """Answers of step forms from submitted applications, replayed when a form comes back."""
+        from autobot.form_replay import FormMemory
+
+        return FormMemory(data_path("form_memory.sqlite3"), profile=self.answer_cache.fingerprint)
+
+    @cached_property
+    def binary_classifier(self):
+        """Checkbox and yes/no decisions learned from the LLM's earlier answers."""
+        from autobot.binary_classifier import BinaryClassifier
+
+        classifier = BinaryClassifier(data_path("binary_decisions.sqlite3"),
+                                      threshold=self.settings.classifier_threshold)
+        if not classifier.size():
+            classifier.seed((q, "checkbox" if kind == "checkbox" else "yes_no", yes)
+                            for q, kind, yes in self.answer_cache.yes_no_answers())
+        return classifier
+
+    @cached_property
+    def llm_router(self):
+        """LLM backends per question type."""
+        from autobot.llm_backends import LLMRouter
+
+        settings = self.settings
+        return LLMRouter.from_settings(settings.llm, settings.groq_api_url, settings.groq_api_key,
+                                       force=settings.llm_backend)
+
+    @cached_property
+    def ocr_engine(self):
+        from autobot.ocr import OcrEngine
+
+        return OcrEngine(data_path("ocr_cache.sqlite3"))
+
+    @cached_property
+    def job_ledger(self):
+        """Processed jobs across runs."""
+        from autobot.job_ledger import JobLedger
+
+        return JobLedger(data_path("jobs.sqlite3"))
+
+    @cached_property
+    def progress(self):
+        """Current page/job/step and session counters, read by the backend's /api/status."""
+        from autobot.progress import PROGRESS_FILENAME, Progress
+
+        return Progress(data_path(PROGRESS_FILENAME), run_id=self.run_id, counts=self.job_ledger.session_counts)
+
+    @cached_property
+    def session(self):
+        """Saved browser session (storage_state) of the configured account."""
+        from autobot.session import SessionStore
+
+        return SessionStore(os.path.join(DATA_DIR, "sessions"), self.settings.linkedin_base_url,
+                            self.settings.email)
+
+    def warm(self):
+        """Build every shared object now; returns the seconds it took."""
+        start = time.perf_counter()
+        for name in self.WARM:
+            getattr(self, name)
+        return time.perf_counter() - start
+
+    def new_run(self, run_id):
+        """Start another run in this process: new run id, progress record and zeroed counters."""
+        self.run_id = run_id
+        if "job_ledger" in self.__dict__:
+            self.job_ledger.session_counts = dict.fromkeys(self.job_ledger.session_counts, 0)
+        self.__dict__.pop("progress", None)
+        # Cache, classifier and LLM statistics are reported per run
+        for name in self.INPUTS:
+            member = self.__dict__.get(name)
+            if hasattr(member, "reset_stats"):
+                member.reset_stats()
+
+    def _input(self, name):
+        if name == "cv":
+            return self.cv_stamp or _file_stamp(self.settings.cv_path)
+        return getattr(self.settings, name)
+
+    def reconfigure(self, settings):
+        """Context for new settings that takes over the members they do not affect.
+
+        The members it does not take over are closed.
+        """
+        context = AppContext(settings, run_id=self.run_id)
+        for name, inputs in self.INPUTS.items():
+            if name in self.__dict__ and all(self._input(i) == context._input(i) for i in inputs):
+                context.__dict__[name] = self.__dict__[name]
+        if "cv_artifacts" in context.__dict__:
+            context.cv_stamp = self.cv_stamp
+        self.close(keep=context.__dict__.values())
+        return context
+
+    def close(self, keep=()):
+        """Close the stores, pools and clients built so far (except those in `keep`)."""
+        keep = {id(member) for member in keep}
+        for name in self.INPUTS:
+            member = self.__dict__.get(name)
+            if member is not None and id(member) not in keep and hasattr(member, "close"):
+                member.close()
+
+
+_context = None
+_context_lock = threading.Lock()
+
+
+def get_context():
+    """The process-wide AppContext, created on first use."""
+    global _context
+    if _context is None:
+        with _context_lock:
+            if _context is None:
+                _context = AppContext()
+    return _context
+
+
+def set_context(context):
+    """Install `context` as the process-wide AppContext (None resets it); returns it."""
+    global _context
+    with _context_lock:
+        _context = context
+    return context
+
+
+class _ContextProxy:
+    """Forwards attribute reads to whatever get_context() currently returns."""
+
+    def __getattr__(self, name):
+        return getattr(get_context(), name)
+
+
+CONTEXT = _ContextProxy()
@@ -0,0 +1,123 @@
+"""Parsed CV artifacts cached by PDF content hash.
+
+Parsing the PDF with pdfplumber is the slowest part of startup, and the
+backend starts a fresh process for every run. The extracted text, per-page
+texts, detected sections and skills are stored as gzipped JSON named after
+the SHA-256 of the PDF bytes, so later launches load them in milliseconds and
+only a changed PDF is parsed again.
+"""
+import gzip
+import hashlib
+import json
+import os
+import re
+
+from autobot.events import log
+
+CACHE_VERSION = 1
+
+SECTION_HEADINGS = [
+    "summary", "profile", "objective", "about me",
+    "experience", "work experience", "professional experience", "employment history", "internships",
+    "education", "skills", "technical skills", "core competencies", "tools",
+    "projects", "publications", "certifications", "awards", "achievements",
+    "languages", "interests", "volunteering", "leadership", "activities",
+]
+_HEADING_RE = re.compile(
+    r"^\s*(?:" + "|".join(re.escape(h) for h in SECTION_HEADINGS) + r")\s*:?\s*$",
+    re.IGNORECASE,
+)
+
+
+def file_hash(path):
+    """SHA-256 of the file contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def extract_pages(pdf_path):
+    """Text of every page of the PDF (pdfplumber is only imported here)."""
+    import pdfplumber
+
+    with pdfplumber.open(pdf_path) as pdf:
+        return [page.extract_text() or "" for page in pdf.pages]
+
+
+def split_sections(text):
+    """Split CV text on heading lines; text before the first heading is 'header'."""
+    sections = [{"title": "header", "text": ""}]
+    for line in text.splitlines():
+        if _HEADING_RE.match(line):
+            sections.append({"title": line.strip().rstrip(":").lower(), "text": ""})
+        else:
+            sections[-1]["text"] += line + "\n"
+    return [s for s in sections if s["text"].strip()]
+
+
+def extract_skills(sections):
+    """Skill phrases listed in skills-like sections."""
+    skills = []
+    for section in sections:
+        if not any(word in section["title"] for word in ("skill", "competenc", "tool")):
+            continue
+        body = re.sub(r"^[^:\n]{1,30}:", "", section["text"], flags=re.MULTILINE)
+        for item in re.split(r"[,;|•·\n]", body):
+            item = item.strip(" -*\t")
+            if item and len(item) <= 40 and item.lower() not in (s.lower() for s in skills):
+                skills.append(item)
+    return skills
+
+
+def build_artifacts(pdf_path):
+    pages = extract_pages(pdf_path)
+    # Pages are concatenated without separators, as extract_cv_text always did
+    text = "".join(pages)
+    sections = split_sections("\n".join(pages))
+    return {
+        "version": CACHE_VERSION,
+        "text": text,
+        "pages": pages,
+        "sections": sections,
+        "skills": extract_skills(sections),
+    }
+
+
+def load_cv_artifacts(pdf_path, cache_dir):
+    """Return CV artifacts, parsing the PDF only when its contents changed.
+
+    On any read/parse error the artifacts have empty text, matching the old
+    extract_cv_text behaviour so the caller's check still applies.
+    """
+    try:
+        content_hash = file_hash(pdf_path)
+    except OSError as e:
+        log.error(f"Error extracting CV text: {e}")
+        return {"hash": "", "text": "", "pages": [], "sections": [], "skills": []}
+
+    cache_file = os.path.join(cache_dir, f"cv_{content_hash[:32]}.json.gz")
+    try:
+        with gzip.open(cache_file, "rt", encoding="utf-8") as f:
+            artifacts = json.load(f)
+        if artifacts.get("version") == CACHE_VERSION:
+            artifacts["hash"] = content_hash
+            return artifacts
+    except (OSError, ValueError):
+        pass
+
+    try:
+        artifacts = build_artifacts(pdf_path)
+    except Exception as e:
+        log.error(f"Error extracting CV text: {e}")
+        return {"hash": content_hash, "text": "", "pages": [], "sections": [], "skills": []}
+
+    if artifacts["text"]:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_file = cache_file + ".tmp"
+        with gzip.open(tmp_file, "wt", encoding="utf-8") as f:
+            json.dump(artifacts, f, separators=(",", ":"))
+        os.replace(tmp_file, cache_file)
+    artifacts["hash"] = content_hash
+    return artifacts
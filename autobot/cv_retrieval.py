@@ -0,0 +1,99 @@
+"""BM25 retrieval over CV chunks to pick prompt context per question.
+
+The CV sections are split into small chunks once, and a term-frequency
+matrix is kept as a NumPy array. For each question the chunks are scored
+with BM25 and the best ones are packed into a token budget, so the prompt
+carries the part of the CV that is actually relevant instead of the first
+1000 characters.
+"""
+import re
+
+import numpy as np
+
+STOPWORDS = frozenset(
+    "a an and are as at be by do does for from have has how i in is it of on or "
+    "that the this to was were what when where which who will with you your".split()
+)
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*")
+
+
+def tokenize(text):
+    return [t for t in _TOKEN_RE.findall((text or "").lower()) if t not in STOPWORDS]
+
+
+def estimate_tokens(text):
+    """Rough LLM token count (about four characters per token)."""
+    return (len(text) + 3) // 4
+
+
+def chunk_sections(sections, max_words=80):
+    """Split sections into chunks of at most max_words, prefixed with the section title."""
+    chunks = []
+    for section in sections:
+        words = section["text"].split()
+        title = section["title"]
+        for start in range(0, len(words), max_words):
+            body = " ".join(words[start:start + max_words])
+            chunks.append(body if title == "header" else f"[{title}] {body}")
+    return chunks
+
+
+class CvIndex:
+    """BM25 index over CV chunks."""
+
+    def __init__(self, chunks, k1=1.5, b=0.75):
+        self.chunks = chunks
+        self.k1 = k1
+        self.b = b
+        tokenized = [tokenize(chunk) for chunk in chunks]
+        self.vocab = {}
+        for tokens in tokenized:
+            for token in tokens:
+                self.vocab.setdefault(token, len(self.vocab))
+
+        self.tf = np.zeros((len(chunks), max(1, len(self.vocab))), dtype=np.float32)
+        for row, tokens in enumerate(tokenized):
+            for token in tokens:
+                self.tf[row, self.vocab[token]] += 1
+        self.doc_len = self.tf.sum(axis=1)
+        self.avg_len = float(self.doc_len.mean()) if len(chunks) else 0.0
+        df = (self.tf > 0).sum(axis=0)
+        n = len(chunks)
+        self.idf = np.log(1 + (n - df + 0.5) / (df + 0.5)).astype(np.float32)
+
+    @classmethod
+    def from_artifacts(cls, artifacts, max_words=80):
+        sections = artifacts.get("sections") or [{"title": "header", "text": artifacts.get("text", "")}]
+        return cls(chunk_sections(sections, max_words))
+
+    def scores(self, query):
+        """BM25 score of every chunk for the query."""
+        columns = [self.vocab[t] for t in set(tokenize(query)) if t in self.vocab]
+        if not columns or not self.chunks:
+            return np.zeros(len(self.chunks), dtype=np.float32)
+        tf = self.tf[:, columns]
+        norm = self.k1 * (1 - self.b + self.b * self.doc_len / (self.avg_len or 1.0))
+        weights = tf * (self.k1 + 1) / (tf + norm[:, None])
+        return weights @ self.idf[columns]
+
+    def select_context(self, question, token_budget=250, k=3):
+        """Top-k relevant chunks that fit the token budget, joined for a prompt.
+
+        The header chunk (name, contact, summary) is used when nothing matches.
+        """
+        if not self.chunks:
+            return ""
+        scores = self.scores(question)
+        ranked = [int(i) for i in np.argsort(-scores, kind="stable") if scores[i] > 0][:k]
+        if not ranked:
+            ranked = [0]
+
+        picked, used = [], 0
+        for index in ranked:
+            cost = estimate_tokens(self.chunks[index])
+            if picked and used + cost > token_budget:
+                break
+            picked.append(index)
+            used += cost
+        # Keep CV order so the snippets read naturally
+        return "\n".join(self.chunks[i] for i in sorted(picked))[: token_budget * 4]
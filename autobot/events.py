@@ -0,0 +1,121 @@
+"""Structured, non-blocking event logging.
+
+Logging calls on the hot path only build a record and put it on a queue; a
+background QueueListener thread formats and writes it, so a slow terminal
+or pipe never stalls the browser loop. Every record is a typed event with
+fields and a level:
+
+    log.event("field_filled", f"Filled '{question}' with '{answer}'", kind="text", question=question)
+    log.info("Logged in successfully")            # event "log"
+    log.warning(...), log.error(...), log.debug(...), log.exception(...)
+
+Sinks, set up once per process by setup_logging():
+    <log_dir>/autobot.jsonl   rotating JSON lines, every level
+    console                   the message text, as the old print calls showed it (optional)
+    JSON console              one JSON object per line on stdout, parsed by the backend supervisor
+"""
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import traceback
+
+EVENT_TYPES = ("log", "run", "progress", "job_started", "job_done", "field_filled",
+               "llm_call", "ocr_call", "step_done")
+
+LOG_FILENAME = "autobot.jsonl"
+
+_logger = logging.getLogger("autobot")
+_listener = None
+
+
+class EventLogger:
+    """Thin facade over the "autobot" logger that attaches an event type and fields."""
+
+    def __init__(self, logger):
+        self._logger = logger
+
+    def event(self, event, msg=None, level=logging.INFO, **fields):
+        if self._logger.isEnabledFor(level):
+            self._logger.log(level, event if msg is None else msg,
+                             extra={"event": event, "fields": fields})
+
+    def debug(self, msg, **fields):
+        self.event("log", msg, logging.DEBUG, **fields)
+
+    def info(self, msg, **fields):
+        self.event("log", msg, logging.INFO, **fields)
+
+    def warning(self, msg, **fields):
+        self.event("log", msg, logging.WARNING, **fields)
+
+    def error(self, msg, **fields):
+        self.event("log", msg, logging.ERROR, **fields)
+
+    def exception(self, msg, **fields):
+        """Error with the current traceback as a field (formatted here, not on the writer thread)."""
+        self.event("log", msg, logging.ERROR, traceback=traceback.format_exc(), **fields)
+
+
+log = EventLogger(_logger)
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        payload = {
+            "ts": round(record.created, 3),
+            "level": record.levelname.lower(),
+            "event": getattr(record, "event", "log"),
+            "msg": record.getMessage(),
+        }
+        payload.update(getattr(record, "fields", None) or {})
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class ConsoleFormatter(logging.Formatter):
+    def format(self, record):
+        message = record.getMessage()
+        trace = (getattr(record, "fields", None) or {}).get("traceback")
+        return f"{message}\n{trace.rstrip()}" if trace else message
+
+
+def _human_readable(record):
+    # Progress records are for the backend and the JSONL file, not for people
+    return getattr(record, "event", "log") != "progress"
+
+
+def setup_logging(log_dir, console=True, json_console=False, console_level=logging.INFO,
+                  max_bytes=5 * 1024 * 1024, backup_count=5):
+    """Attach the queue handler and start the background writer (once per process)."""
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    os.makedirs(log_dir, exist_ok=True)
+    file_handler = logging.handlers.RotatingFileHandler(
+        os.path.join(log_dir, LOG_FILENAME), maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
+    )
+    file_handler.setFormatter(JsonFormatter())
+    handlers = [file_handler]
+
+    if json_console or console:
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setLevel(console_level)
+        if json_console:
+            console_handler.setFormatter(JsonFormatter())
+        else:
+            console_handler.setFormatter(ConsoleFormatter())
+            console_handler.addFilter(_human_readable)
+        handlers.append(console_handler)
+
+    records = queue.SimpleQueue()
+    _logger.addHandler(logging.handlers.QueueHandler(records))
+    _logger.setLevel(logging.DEBUG)
+    _logger.propagate = False
+    _listener = logging.handlers.QueueListener(records, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+    return _listener
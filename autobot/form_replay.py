@@ -0,0 +1,183 @@
+"""Replay of Easy Apply steps whose form was filled in an earlier application.
+
+Many companies reuse the same question sets, so the same step form shows up
+across jobs. A step is identified by a fingerprint of its form schema: the
+kind, normalized label and option set of every visible field, plus the
+profile fingerprint. Field values are left out.
+
+The answers a step was submitted with are read from a snapshot taken just
+before its button is clicked, and staged per application. They are stored
+only when the application is submitted. When a later step has a stored
+fingerprint, `plan` marks every field it covers as `replayed` and returns
+the ones that still need filling. Those are filled straight from the stored
+answers, with no OCR and no LLM call. The regular handlers then see only
+the fields the stored answers do not cover. A replayed step that shows
+validation errors is forgotten until an application is submitted with it
+again.
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+
+from autobot.answer_cache import normalize_question
+
+
+def _field_bases(snapshot):
+    """(field, base key) for the visible fields of a step, in DOM order."""
+    bases = []
+    for info in snapshot:
+        if not info["visible"]:
+            continue
+        if info["kind"] == "radio":
+            options = [opt["label"] for opt in info["options"]]
+        else:
+            options = info["options"]
+        option_set = "|".join(sorted(normalize_question(o) for o in options))
+        bases.append((info, f"{info['kind']}\x1f{normalize_question(info['label'])}\x1f{option_set}"))
+    return bases
+
+
+def field_keys(snapshot):
+    """(field, key) pairs; repeated fields (e.g. two unlabelled inputs) are numbered."""
+    seen = {}
+    keyed = []
+    for info, base in _field_bases(snapshot):
+        seen[base] = seen.get(base, 0) + 1
+        keyed.append((info, f"{base}#{seen[base]}"))
+    return keyed
+
+
+def capture_answers(snapshot):
+    """Current answer of every visible field: text, option label or checked state."""
+    answers = {}
+    for info, key in field_keys(snapshot):
+        kind = info["kind"]
+        if kind == "radio":
+            answers[key] = next((opt["label"] for opt in info["options"] if opt.get("checked")), None)
+        elif kind == "checkbox":
+            answers[key] = bool(info["checked"])
+        else:
+            answers[key] = info["value"] or None
+    return answers
+
+
+def _needs_replay(info, answer):
+    if not info["enabled"] or answer is None:
+        return False
+    kind = info["kind"]
+    if kind == "text":
+        return not info["value"].strip()
+    if kind == "select":
+        return not info["value"] or info["value"].lower() in ("select an option", "none")
+    if kind == "radio":
+        return not info["checked"]
+    return bool(answer) and not info["checked"]
+
+
+class FormMemory:
+    """SQLite store of step fingerprints -> answers from submitted applications."""
+
+    def __init__(self, path, profile=""):
+        self.path = path
+        self.profile = profile
+        self.hits = 0
+        self.misses = 0
+        self.replayed_fields = 0
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS forms ("
+            " fingerprint TEXT PRIMARY KEY,"
+            " answers TEXT NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " last_used REAL NOT NULL,"
+            " replays INTEGER NOT NULL DEFAULT 0)"
+        )
+        self._conn.commit()
+
+    def fingerprint(self, snapshot):
+        """Hash of the step's form schema (kinds, labels, option sets) and the profile."""
+        parts = [base for _, base in _field_bases(snapshot)] + [self.profile]
+        return hashlib.sha256("\x1e".join(parts).encode("utf-8")).hexdigest()
+
+    def plan(self, fingerprint, snapshot):
+        """Fields to fill from stored answers, as (field, answer) pairs.
+
+        Every field the stored answers cover is marked `replayed`, including
+        ones that need no action (e.g. a checkbox that was left unchecked).
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT answers FROM forms WHERE fingerprint = ?", (fingerprint,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return []
+            self._conn.execute(
+                "UPDATE forms SET last_used = ?, replays = replays + 1 WHERE fingerprint = ?",
+                (time.time(), fingerprint),
+            )
+            self._conn.commit()
+            self.hits += 1
+
+        stored = json.loads(row[0])
+        actions = []
+        for info, key in field_keys(snapshot):
+            if key not in stored:
+                continue
+            answer = stored[key]
+            if info["kind"] == "radio" and answer is not None:
+                labels = [opt["label"].strip().lower() for opt in info["options"]]
+                if answer.strip().lower() not in labels:
+                    continue
+            info["replayed"] = True
+            if _needs_replay(info, answer):
+                actions.append((info, answer))
+        self.replayed_fields += len(actions)
+        return actions
+
+    def stage(self, fingerprint, snapshot):
+        """Remember a step's answers until the application is committed or discarded."""
+        self._pending[fingerprint] = capture_answers(snapshot)
+
+    def commit(self):
+        """Store the staged steps of a submitted application."""
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO forms (fingerprint, answers, created_at, last_used) VALUES (?, ?, ?, ?)"
+                " ON CONFLICT(fingerprint) DO UPDATE SET answers = excluded.answers,"
+                " last_used = excluded.last_used",
+                [(fingerprint, json.dumps(answers), now, now) for fingerprint, answers in pending.items()],
+            )
+            self._conn.commit()
+
+    def discard(self):
+        """Drop the staged steps, e.g. when an application was not submitted."""
+        self._pending = {}
+
+    def forget(self, fingerprint):
+        """Stop replaying a step whose stored answers failed validation."""
+        self._pending.pop(fingerprint, None)
+        with self._lock:
+            self._conn.execute("DELETE FROM forms WHERE fingerprint = ?", (fingerprint,))
+            self._conn.commit()
+
+    def stats(self):
+        with self._lock:
+            size = self._conn.execute("SELECT COUNT(*) FROM forms").fetchone()[0]
+        return {"hits": self.hits, "misses": self.misses, "replayed_fields": self.replayed_fields,
+                "size": size}
+
+    def reset_stats(self):
+        self.hits = self.misses = self.replayed_fields = 0
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
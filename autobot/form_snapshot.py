@@ -0,0 +1,148 @@
+"""Single-round-trip snapshot of the fields in an Easy Apply modal step.
+
+Instead of one CDP round trip per `is_visible` / `input_value` / label
+lookup, `take_snapshot` runs one `evaluate` over the modal and returns a
+plain-dict model of every field. Each field (and each radio/checkbox label)
+is tagged with a `data-autobot-id` attribute so handlers can act on it
+later through `field_locator`.
+
+Field dicts have the keys:
+    id, kind ("text" | "select" | "radio" | "checkbox"), name, label,
+    value, options, visible, enabled, required, checked, constraints
+Radio fields describe a whole group; their `options` are dicts with
+`label`, `input` (handle of the <input>), `label_id` (handle of the
+<label>, may be None) and `checked`.
+"""
+
+SNAPSHOT_JS = r"""
+(root) => {
+  window.__autobotSeq = window.__autobotSeq || 0;
+  const handle = (el) => {
+    if (!el) return null;
+    if (!el.dataset.autobotId) el.dataset.autobotId = 'f' + (++window.__autobotSeq);
+    return el.dataset.autobotId;
+  };
+  const clean = (s) => (s || '').replace(/\s+/g, ' ').trim();
+  const text = (el) => el ? clean(el.innerText || el.textContent) : '';
+  const visible = (el) => {
+    if (!el || !el.isConnected) return false;
+    const style = getComputedStyle(el);
+    if (style.visibility === 'hidden' || style.display === 'none') return false;
+    const rect = el.getBoundingClientRect();
+    return rect.width > 0 || rect.height > 0;
+  };
+  const xpathFirst = (el, expr) => document.evaluate(
+    expr, el, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+  const labelled = (el) => {
+    const ids = (el.getAttribute('aria-labelledby') || '').split(/\s+/).filter(Boolean);
+    const byIds = clean(ids.map((id) => text(document.getElementById(id))).join(' '));
+    if (byIds) return byIds;
+    if (el.id) {
+      const lbl = root.querySelector('label[for="' + CSS.escape(el.id) + '"]');
+      if (lbl && visible(lbl) && text(lbl)) return text(lbl);
+    }
+    const wrap = el.closest('label');
+    if (wrap && text(wrap)) return text(wrap);
+    return clean(el.getAttribute('aria-label'));
+  };
+  // Mirrors the old xpath=./preceding::label[1] / legend[1] lookups
+  const precedingText = (el, tag) => {
+    const node = xpathFirst(el, './preceding::' + tag + '[1]');
+    return node && visible(node) ? text(node) : '';
+  };
+  const optionLabel = (input) => {
+    let lbl = input.id ? root.querySelector('label[for="' + CSS.escape(input.id) + '"]') : null;
+    if (!lbl) lbl = xpathFirst(input, 'following-sibling::label[1]');
+    if (!lbl) lbl = input.closest('label');
+    return lbl;
+  };
+  const constraints = (el) => ({
+    type: el.getAttribute('type') || el.tagName.toLowerCase(),
+    maxlength: el.maxLength > 0 ? el.maxLength : null,
+    min: el.getAttribute('min'),
+    max: el.getAttribute('max'),
+    pattern: el.getAttribute('pattern'),
+    inputmode: el.getAttribute('inputmode'),
+  });
+  const base = (el, kind) => ({
+    id: handle(el),
+    kind: kind,
+    name: el.getAttribute('name') || el.id || '',
+    visible: visible(el),
+    enabled: !el.disabled,
+    required: el.required || el.getAttribute('aria-required') === 'true',
+    constraints: constraints(el),
+  });
+
+  const fields = [];
+  root.querySelectorAll("input[type='text'], textarea").forEach((el) => {
+    fields.push(Object.assign(base(el, 'text'), {
+      label: labelled(el) || precedingText(el, 'label'),
+      value: el.value || '',
+      options: [],
+      checked: false,
+    }));
+  });
+  root.querySelectorAll('select').forEach((el) => {
+    fields.push(Object.assign(base(el, 'select'), {
+      label: labelled(el) || precedingText(el, 'label'),
+      value: el.value || '',
+      options: Array.from(el.options).map((o) => clean(o.innerText || o.text)),
+      checked: false,
+    }));
+  });
+  const groups = new Map();
+  root.querySelectorAll("input[type='radio']").forEach((el) => {
+    const name = el.getAttribute('name');
+    if (!name) return;
+    if (!groups.has(name)) groups.set(name, []);
+    groups.get(name).push(el);
+  });
+  groups.forEach((inputs, name) => {
+    const first = inputs[0];
+    const fieldset = first.closest('fieldset');
+    const legend = fieldset ? fieldset.querySelector('legend') : null;
+    const options = [];
+    inputs.forEach((input) => {
+      const lbl = optionLabel(input);
+      if (lbl && visible(lbl) && text(lbl)) {
+        options.push({label: text(lbl), input: handle(input), label_id: handle(lbl), checked: input.checked});
+      }
+    });
+    fields.push(Object.assign(base(first, 'radio'), {
+      name: name,
+      label: (legend && visible(legend) && text(legend)) || precedingText(first, 'legend'),
+      value: (inputs.find((i) => i.checked) || {}).value || '',
+      options: options,
+      checked: inputs.some((i) => i.checked),
+      visible: inputs.some(visible),
+    }));
+  });
+  root.querySelectorAll("input[type='checkbox']").forEach((el) => {
+    const lbl = optionLabel(el);
+    fields.push(Object.assign(base(el, 'checkbox'), {
+      label: lbl && visible(lbl) ? text(lbl) : '',
+      label_id: lbl ? handle(lbl) : null,
+      value: el.value || '',
+      options: [],
+      checked: el.checked,
+    }));
+  });
+  return fields;
+}
+"""
+
+
+def take_snapshot(modal):
+    """Return the list of field dicts for the current modal step (one round trip)."""
+    return modal.evaluate(SNAPSHOT_JS)
+
+
+def fields_of_kind(snapshot, kind):
+    """Fields of one kind, in document order."""
+    return [field for field in snapshot if field["kind"] == kind]
+
+
+def field_locator(modal, handle):
+    """Locator for an element tagged by the snapshot."""
+    return modal.locator(f"[data-autobot-id='{handle}']").first
@@ -0,0 +1,145 @@
+"""Incremental job-card harvesting with one `evaluate` per scan.
+
+The old card loop re-listed every `.job-card-container` after each scroll
+and made several round trips per card (link locator, href, inner text for
+the "Applied" badge), including cards it had already handled. Here a
+MutationObserver installed in the page queues job cards as they are added
+to the DOM, and `harvest` drains that queue in a single `evaluate` that
+returns a plain dict per new card:
+
+    handle, job_id, href, title, company, applied
+
+Cards LinkedIn has inserted but not filled in yet (no link) stay queued
+until a later scan. Each reported card is tagged with `data-autobot-card`
+so `card_link` can click it later. A full navigation drops the page state,
+and the next `harvest` reinstalls the observer and reports the new page's
+cards.
+
+`read_job_details` reads the title and description of the job open in the
+detail pane, for the relevance prefilter (autobot/relevance.py).
+"""
+from autobot.job_ledger import parse_job_id
+from autobot.waits import JOB_CARD_SELECTOR, wait_until, wait_until_async
+
+HARVEST_JS = r"""
+(selector) => {
+  let state = window.__autobotCards;
+  if (!state) {
+    state = window.__autobotCards = { seq: 0, pending: new Set() };
+    const enqueue = (node) => {
+      if (node.nodeType !== 1) return;
+      if (node.matches(selector)) state.pending.add(node);
+      node.querySelectorAll(selector).forEach((card) => state.pending.add(card));
+    };
+    new MutationObserver((mutations) => {
+      for (const m of mutations) m.addedNodes.forEach(enqueue);
+    }).observe(document.body, { childList: true, subtree: true });
+    document.querySelectorAll(selector).forEach((card) => state.pending.add(card));
+  }
+
+  const clean = (s) => (s || '').replace(/\s+/g, ' ').trim();
+  const text = (el) => el ? clean(el.innerText || el.textContent) : '';
+  const first = (card, selectors) => {
+    for (const sel of selectors) {
+      const el = card.querySelector(sel);
+      if (el && text(el)) return text(el);
+    }
+    return '';
+  };
+
+  const cards = [];
+  for (const card of Array.from(state.pending)) {
+    if (!card.isConnected || card.dataset.autobotCard) {
+      state.pending.delete(card);
+      continue;
+    }
+    const link = card.querySelector('a[href]');
+    if (!link) continue;  // not rendered yet, report on a later scan
+    state.pending.delete(card);
+    card.dataset.autobotCard = 'c' + (++state.seq);
+    const body = text(card).toLowerCase();
+    cards.push({
+      handle: card.dataset.autobotCard,
+      href: link.getAttribute('href'),
+      title: first(card, ['.job-card-list__title', '.job-card-container__link', 'a[href]']),
+      company: first(card, ['.artdeco-entity-lockup__subtitle', '.job-card-container__primary-description',
+                            '.job-card-container__company-name']),
+      // "Applied 3 days ago" / "Applied 2 weeks ago"
+      applied: body.includes('applied') && (body.includes('day') || body.includes('week')),
+    });
+  }
+  return cards;
+}
+"""
+
+
+class CardHarvester:
+    """Reports job cards not seen before on the current page."""
+
+    def __init__(self, selector=JOB_CARD_SELECTOR):
+        self.selector = selector
+        self.total = 0
+
+    def _with_ids(self, cards):
+        for card in cards:
+            card["job_id"] = parse_job_id(card["href"])
+        self.total += len(cards)
+        return cards
+
+    def harvest(self, page):
+        return self._with_ids(page.evaluate(HARVEST_JS, self.selector))
+
+    async def harvest_async(self, page):
+        return self._with_ids(await page.evaluate(HARVEST_JS, self.selector))
+
+
+def card_link(page, card):
+    """Locator for the link of a harvested card."""
+    return page.locator(f"[data-autobot-card='{card['handle']}'] a[href]").first
+
+
+JOB_DETAILS_JS = r"""
+() => {
+  const text = (selectors) => {
+    for (const sel of selectors) {
+      const el = document.querySelector(sel);
+      if (el && (el.innerText || el.textContent).trim()) return (el.innerText || el.textContent).trim();
+    }
+    return '';
+  };
+  return {
+    title: text(['.job-details-jobs-unified-top-card__job-title', '.jobs-unified-top-card__job-title']),
+    description: text(['.jobs-description', '#job-details', '.jobs-description-content__text']),
+  };
+}
+"""
+
+
+def _same_job(card, details):
+    # The pane updates after the URL does; until then it still shows the previous job
+    if not details.get("description"):
+        return False
+    card_title = " ".join((card.get("title") or "").lower().split())
+    pane_title = " ".join((details.get("title") or "").lower().split())
+    return not card_title or not pane_title or card_title in pane_title or pane_title in card_title
+
+
+def read_job_details(page, card, timeout=5):
+    """{"title", "description"} of the job open in the detail pane, or None if it did not load."""
+    details = {}
+
+    def loaded():
+        details.update(page.evaluate(JOB_DETAILS_JS))
+        return _same_job(card, details)
+
+    return details if wait_until(loaded, timeout=timeout, name="job description") else None
+
+
+async def read_job_details_async(page, card, timeout=5):
+    details = {}
+
+    async def loaded():
+        details.update(await page.evaluate(JOB_DETAILS_JS))
+        return _same_job(card, details)
+
+    return details if await wait_until_async(loaded, timeout=timeout, name="job description") else None
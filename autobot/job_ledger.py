@@ -0,0 +1,138 @@
+"""Durable record of every job card the bot has handled.
+
+Jobs are stored under the numeric LinkedIn job id parsed from the card href,
+with a status, timestamps, the number of modal steps, an error reason and
+the CV relevance score of the job description.
+All known ids are loaded into memory at startup so the card loop can skip a
+job with an O(1) check before clicking anything. Only final statuses are
+skipped: a job left "seen" by a stopped or crashed run, or "failed" (e.g.
+with the LLM unavailable), is tried again, up to MAX_ATTEMPTS times.
+"""
+import re
+import sqlite3
+import threading
+import time
+
+STATUSES = ("seen", "skipped", "applied", "failed")
+FINAL_STATUSES = ("skipped", "applied")
+MAX_ATTEMPTS = 3
+
+_JOB_ID_PATTERNS = [
+    re.compile(r"/jobs/view/(?:[^/?#]*?-)?(\d+)"),
+    re.compile(r"[?&](?:currentJobId|jobId)=(\d+)"),
+]
+
+
+def parse_job_id(href):
+    """Integer job id from a job card href, or None if there is none."""
+    if not href:
+        return None
+    for pattern in _JOB_ID_PATTERNS:
+        match = pattern.search(href)
+        if match:
+            return int(match.group(1))
+    return None
+
+
+class JobLedger:
+    """SQLite (WAL) job ledger with an in-memory id -> status index."""
+
+    def __init__(self, path, max_attempts=MAX_ATTEMPTS):
+        self.path = path
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " job_id INTEGER PRIMARY KEY,"
+            " status TEXT NOT NULL,"
+            " first_seen REAL NOT NULL,"
+            " updated_at REAL NOT NULL,"
+            " steps INTEGER NOT NULL DEFAULT 0,"
+            " error TEXT,"
+            " relevance REAL,"
+            " attempts INTEGER NOT NULL DEFAULT 0)"
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+        if "relevance" not in columns:
+            # Ledgers created before the relevance prefilter
+            self._conn.execute("ALTER TABLE jobs ADD COLUMN relevance REAL")
+        if "attempts" not in columns:
+            # Ledgers created before retries; every known job counts as one attempt
+            self._conn.execute("ALTER TABLE jobs ADD COLUMN attempts INTEGER NOT NULL DEFAULT 1")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs(status)")
+        self._conn.commit()
+        # Status index per id keeps the in-memory map to two small ints per job
+        self._status = {}
+        self._attempts = {}
+        for job_id, status, attempts in self._conn.execute("SELECT job_id, status, attempts FROM jobs"):
+            self._status[job_id] = STATUSES.index(status)
+            if status not in FINAL_STATUSES:
+                self._attempts[job_id] = attempts
+        self.session_counts = dict.fromkeys(STATUSES, 0)
+
+    def __contains__(self, job_id):
+        return job_id in self._status
+
+    def __len__(self):
+        return len(self._status)
+
+    def done(self, job_id):
+        """True if the card loop should skip the job: final status, or out of attempts."""
+        index = self._status.get(job_id)
+        if index is None:
+            return False
+        return STATUSES[index] in FINAL_STATUSES or self._attempts.get(job_id, 0) >= self.max_attempts
+
+    def status(self, job_id):
+        index = self._status.get(job_id)
+        return None if index is None else STATUSES[index]
+
+    def record(self, job_id, status, steps=None, error=None, relevance=None):
+        """Insert or update a job; steps/error/relevance are kept when not given.
+
+        Recording a job as "seen" starts an attempt.
+        """
+        if status not in STATUSES:
+            raise ValueError(f"Unknown job status: {status}")
+        now = time.time()
+        attempt = 1 if status == "seen" else 0
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs (job_id, status, first_seen, updated_at, steps, error, relevance, attempts)"
+                " VALUES (?, ?, ?, ?, COALESCE(?, 0), ?, ?, ?)"
+                " ON CONFLICT(job_id) DO UPDATE SET status = excluded.status,"
+                " updated_at = excluded.updated_at,"
+                " steps = COALESCE(?, jobs.steps),"
+                " error = COALESCE(?, jobs.error),"
+                " relevance = COALESCE(?, jobs.relevance),"
+                " attempts = jobs.attempts + ?",
+                (job_id, status, now, now, steps, error, relevance, attempt, steps, error, relevance, attempt),
+            )
+            self._conn.commit()
+            self._status[job_id] = STATUSES.index(status)
+            if status in FINAL_STATUSES:
+                self._attempts.pop(job_id, None)
+            else:
+                self._attempts[job_id] = self._attempts.get(job_id, 0) + attempt
+            self.session_counts[status] += 1
+
+    def set_relevance(self, job_id, score):
+        """Store the relevance score of a recorded job without touching its status or counts."""
+        with self._lock:
+            self._conn.execute("UPDATE jobs SET relevance = ?, updated_at = ? WHERE job_id = ?",
+                               (score, time.time(), job_id))
+            self._conn.commit()
+
+    def counts(self):
+        """All-time number of jobs per status."""
+        totals = dict.fromkeys(STATUSES, 0)
+        for index in self._status.values():
+            totals[STATUSES[index]] += 1
+        return totals
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,192 @@
+"""Pluggable LLM backends, routed per question type.
+
+Backends:
+    groq    Groq's OpenAI-compatible API (GROQ_API_KEY)
+    openai  any OpenAI-compatible server, e.g. a local llama.cpp, vLLM or
+            Ollama endpoint ({"base_url": "http://localhost:11434/v1"})
+    mock    deterministic rule-based answers, no network (tests, benchmarks)
+
+Each call is tagged with a question type (see `question_type`) and routed
+to a named backend. Every type goes to "groq" unless configured otherwise;
+cheap questions can be sent to a small fast model, e.g. "groq-fast"
+(llama-3.1-8b-instant) or a local one:
+
+    "llm": {
+      "backends": {"local": {"type": "openai", "base_url": "http://localhost:8080/v1",
+                             "model": "qwen2.5-3b-instruct"}},
+      "routes": {"default": "groq", "yes_no": "local", "checkbox": "local"}
+    }
+
+User backends and routes are merged over DEFAULT_BACKENDS / DEFAULT_ROUTES.
+Other keys of the "llm" object (timeout, max_retries, ...) are LLMClient
+options shared by every HTTP backend; a backend's own keys override them.
+AUTOBOT_LLM_BACKEND=<name> sends every question type to one backend.
+"""
+import json
+import re
+
+from autobot.llm_client import LLMClient
+from autobot.question_rules import default_engine
+
+QUESTION_TYPES = ("yes_no", "numeric", "text", "select", "checkbox", "batch")
+
+DEFAULT_BACKENDS = {
+    "groq": {"type": "groq", "model": "llama-3.3-70b-versatile"},
+    "groq-fast": {"type": "groq", "model": "llama-3.1-8b-instant"},
+    "mock": {"type": "mock"},
+}
+
+# Sponsorship, work authorization and consent answers must not change model
+# unless the user routes them elsewhere
+DEFAULT_ROUTES = {"default": "groq"}
+
+
+def question_type(question, kind="text", options=None, rules=None):
+    """Routing type of a form question: yes_no, numeric, text, select or checkbox.
+
+    Only a select / radio group whose options are Yes and No is "yes_no"; a
+    free-text input can be "Is there anything else...?" just as well. A text
+    question is "numeric" when a "numeric" rule of `rules` (the run's
+    RuleEngine, else the default rules) matches it, "text" otherwise.
+    """
+    if kind == "checkbox":
+        return "checkbox"
+    if kind in ("select", "radio"):
+        labels = {o.strip().lower() for o in options or []}
+        return "yes_no" if labels and labels <= {"yes", "no"} else "select"
+    qtype = (rules or default_engine()).question_type(question or "")
+    return qtype if qtype in ("numeric", "text") else "text"
+
+
+class OpenAICompatibleBackend:
+    """Chat completions from an OpenAI-compatible endpoint (Groq, local servers)."""
+
+    def __init__(self, name, base_url, model, api_key="", **client_options):
+        self.name = name
+        self.model = model
+        self.client = LLMClient(base_url, api_key, **client_options)
+
+    def complete(self, messages, qtype="text", max_tokens=100, response_format=None, stop=None):
+        return self.client.chat(messages, self.model, max_tokens=max_tokens,
+                                response_format=response_format, stop=stop)
+
+    def summary(self):
+        return f"{self.name} ({self.model}): {self.client.summary()}"
+
+    def reset_stats(self):
+        self.client.reset_stats()
+
+    def close(self):
+        self.client.close()
+
+
+class MockBackend:
+    """Deterministic offline answers: Yes for yes/no, the first option, a fixed number or sentence."""
+
+    def __init__(self, name="mock"):
+        self.name = name
+        self.calls = 0
+
+    def complete(self, messages, qtype="text", max_tokens=100, response_format=None, stop=None):
+        self.calls += 1
+        prompt = messages[-1]["content"] if messages else ""
+        if response_format:
+            return json.dumps(self._batch(prompt))
+        if qtype in ("yes_no", "select"):
+            match = re.search(r"Options: (.+)", prompt)
+            options = [o.strip() for o in match.group(1).split(" | ")] if match else []
+            if "Yes" in options or not options:
+                return "Yes"
+            return options[0]
+        return self._answer(qtype)
+
+    @staticmethod
+    def _answer(qtype):
+        if qtype == "checkbox":
+            return "No"
+        if qtype == "yes_no":
+            return "Yes"
+        if qtype == "numeric":
+            return "2"
+        return "Happy to discuss this in an interview."
+
+    def _batch(self, prompt):
+        start = prompt.rfind('{"type": "object"')
+        try:
+            schema = json.loads(prompt[start:]) if start >= 0 else {}
+        except ValueError:
+            schema = {}
+        questions = dict(re.findall(r'^- "([^"]+)": (.*)$', prompt, re.MULTILINE))
+        answers = {}
+        for key, prop in schema.get("properties", {}).items():
+            enum = prop.get("enum")
+            if enum:
+                answers[key] = "Yes" if "Yes" in enum else enum[0]
+            else:
+                answers[key] = self._answer(question_type(questions.get(key, "")))
+        return answers
+
+    def summary(self):
+        return f"{self.name}: {self.calls} calls"
+
+    def reset_stats(self):
+        self.calls = 0
+
+    def close(self):
+        pass
+
+
+def build_backend(name, spec, groq_url, groq_key, client_options):
+    kind = spec.get("type", "openai")
+    options = {k: v for k, v in spec.items() if k not in ("type", "model", "base_url", "api_key")}
+    options = {**client_options, **options}
+    if kind == "mock":
+        return MockBackend(name)
+    if kind == "groq":
+        return OpenAICompatibleBackend(name, spec.get("base_url", groq_url), spec["model"],
+                                       spec.get("api_key", groq_key), **options)
+    if kind == "openai":
+        return OpenAICompatibleBackend(name, spec["base_url"], spec.get("model", "local"),
+                                       spec.get("api_key", ""), **options)
+    raise ValueError(f"Unknown LLM backend type for '{name}': {kind}")
+
+
+class LLMRouter:
+    """Sends each question type to its configured backend."""
+
+    def __init__(self, backends, routes):
+        self.backends = backends
+        self.routes = routes
+
+    @classmethod
+    def from_settings(cls, settings, groq_url, groq_key, force=None):
+        """Router for the "llm" config object; `force` routes everything to one backend."""
+        settings = dict(settings or {})
+        specs = {**DEFAULT_BACKENDS, **(settings.pop("backends", None) or {})}
+        routes = {**DEFAULT_ROUTES, **(settings.pop("routes", None) or {})}
+        if force:
+            routes = {"default": force}
+        # Only backends something is routed to get a client (and a connection pool)
+        used = set(routes.values())
+        if not used <= set(specs):
+            missing = ", ".join(sorted(used - set(specs)))
+            raise ValueError(f"LLM routes point to unknown backends: {missing}")
+        backends = {name: build_backend(name, specs[name], groq_url, groq_key, settings) for name in sorted(used)}
+        return cls(backends, routes)
+
+    def backend_for(self, qtype):
+        return self.backends[self.routes.get(qtype, self.routes["default"])]
+
+    def complete(self, qtype, messages, **kwargs):
+        return self.backend_for(qtype).complete(messages, qtype=qtype, **kwargs)
+
+    def summary(self):
+        return [backend.summary() for backend in self.backends.values()]
+
+    def reset_stats(self):
+        for backend in self.backends.values():
+            backend.reset_stats()
+
+    def close(self):
+        for backend in self.backends.values():
+            backend.close()
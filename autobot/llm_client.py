@@ -0,0 +1,259 @@
+"""Pooled, rate-limit aware client for OpenAI-compatible chat completion APIs.
+
+One `LLMClient` is shared by every caller (including the async engine's
+worker threads):
+
+    client = LLMClient("https://api.groq.com/openai/v1", api_key)
+    text = client.chat(messages, model="llama-3.3-70b-versatile", max_tokens=100)
+
+- one keep-alive httpx connection pool and explicit connect/read timeouts
+- at most `max_concurrency` requests in flight
+- a request bucket and a token bucket, resized from the provider's
+  x-ratelimit-* headers, so calls wait for budget instead of running into 429s
+- retries on timeouts, connection errors, 429 and 5xx with exponential
+  backoff and full jitter, honouring Retry-After
+- latency, retry, throttling and token counters for the final statistics
+
+When no answer can be had within the retry budget, `chat` raises
+LLMUnavailable. Callers should not guess a fallback answer in that case.
+"""
+import logging
+import random
+import re
+import threading
+import time
+
+import httpx
+
+from autobot.cv_retrieval import estimate_tokens
+from autobot.events import log
+
+RETRY_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
+_DURATION_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_UNIT_SECONDS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+class LLMUnavailable(Exception):
+    """The provider gave no usable answer within the retry budget."""
+
+
+def parse_duration(value):
+    """Seconds in a rate-limit header value: "7.66s", "2m59.56s", "120ms" or plain seconds."""
+    if value is None:
+        return None
+    value = str(value).strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = _DURATION_RE.findall(value)
+    if not parts:
+        return None
+    return sum(float(number) * _UNIT_SECONDS[unit] for number, unit in parts)
+
+
+class TokenBucket:
+    """Budget that refills continuously; unlimited until the provider reports a limit."""
+
+    def __init__(self):
+        self.capacity = None
+        self.level = 0.0
+        self.rate = 0.0
+        self.updated = time.monotonic()
+
+    def _refill(self, now):
+        if self.capacity is not None:
+            self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount, now):
+        """Seconds until `amount` is available (0 if it is now)."""
+        if self.capacity is None:
+            return 0.0
+        self._refill(now)
+        amount = min(amount, self.capacity)
+        if self.level >= amount:
+            return 0.0
+        return (amount - self.level) / self.rate if self.rate > 0 else 1.0
+
+    def take(self, amount):
+        if self.capacity is not None:
+            self.level -= min(amount, self.capacity)
+
+    def update(self, limit, remaining, reset, now):
+        """Resize from response headers: the bucket is full again after `reset` seconds."""
+        if limit is None or remaining is None:
+            return
+        self.capacity = float(limit)
+        self.level = float(remaining)
+        self.updated = now
+        if reset:
+            self.rate = max(self.capacity - self.level, 1.0) / reset
+        elif self.rate <= 0:
+            self.rate = self.capacity / 60.0
+
+
+class RateLimiter:
+    """Request and token buckets shared by all threads, plus a global Retry-After pause."""
+
+    def __init__(self):
+        self.requests = TokenBucket()
+        self.tokens = TokenBucket()
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens):
+        """Block until one request and `tokens` tokens fit; returns the seconds waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                wait = max(self.blocked_until - now,
+                           self.requests.wait_time(1, now),
+                           self.tokens.wait_time(tokens, now))
+                if wait <= 0:
+                    self.requests.take(1)
+                    self.tokens.take(tokens)
+                    return waited
+            wait = min(wait, 5.0)
+            time.sleep(wait)
+            waited += wait
+
+    def pause(self, seconds):
+        with self._lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+    def update(self, headers):
+        def number(name):
+            try:
+                return float(headers[name])
+            except (KeyError, TypeError, ValueError):
+                return None
+
+        with self._lock:
+            now = time.monotonic()
+            self.requests.update(number("x-ratelimit-limit-requests"), number("x-ratelimit-remaining-requests"),
+                                 parse_duration(headers.get("x-ratelimit-reset-requests")), now)
+            self.tokens.update(number("x-ratelimit-limit-tokens"), number("x-ratelimit-remaining-tokens"),
+                               parse_duration(headers.get("x-ratelimit-reset-tokens")), now)
+
+
+class LLMClient:
+    """Chat completions over a shared connection pool with retries and rate limiting."""
+
+    def __init__(self, base_url, api_key="", timeout=30.0, connect_timeout=5.0, max_retries=4,
+                 max_concurrency=4, backoff_base=0.5, backoff_max=20.0):
+        self.base_url = base_url.rstrip("/")
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+        self._http = httpx.Client(
+            base_url=self.base_url,
+            headers=headers,
+            timeout=httpx.Timeout(timeout, connect=connect_timeout),
+            limits=httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency),
+        )
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self.limiter = RateLimiter()
+        self._lock = threading.Lock()
+        self.counters = dict.fromkeys(
+            ("calls", "attempts", "retries", "failures", "prompt_tokens", "completion_tokens"), 0)
+        self.latency = 0.0
+        self.throttled = 0.0
+
+    def _count(self, **amounts):
+        with self._lock:
+            for name, amount in amounts.items():
+                self.counters[name] += amount or 0
+
+    def _backoff(self, attempt, retry_after=None):
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+        return max(delay, retry_after or 0.0)
+
+    def chat(self, messages, model, max_tokens=100, temperature=0.1, response_format=None, stop=None):
+        """Content of the first choice; raises LLMUnavailable after the retry budget."""
+        payload = {"model": model, "messages": messages, "temperature": temperature, "max_tokens": max_tokens}
+        if response_format:
+            payload["response_format"] = response_format
+        if stop:
+            payload["stop"] = stop
+        budget_text = "".join(m["content"] for m in messages)
+        budget = estimate_tokens(budget_text) + max_tokens
+
+        start = time.perf_counter()
+        throttled = 0.0
+        error = None
+        for attempt in range(self.max_retries + 1):
+            throttled += self.limiter.acquire(budget)
+            self._count(attempts=1, retries=1 if attempt else 0)
+            retry_after = None
+            try:
+                with self._slots:
+                    response = self._http.post("/chat/completions", json=payload)
+                self.limiter.update(response.headers)
+                if response.status_code == 200:
+                    body = response.json()
+                    content = body["choices"][0]["message"]["content"] or ""
+                    usage = body.get("usage") or {}
+                    return self._finish(start, throttled, attempt, usage, content, len(budget_text))
+                error = f"HTTP {response.status_code}: {response.text[:200]}"
+                if response.status_code not in RETRY_STATUSES:
+                    break
+                retry_after = parse_duration(response.headers.get("retry-after"))
+                if response.status_code == 429 and attempt < self.max_retries:
+                    # Every caller waits out the limit, not just this one; acquire() sleeps
+                    pause = self._backoff(attempt, retry_after)
+                    log.warning(f"⚠️ LLM rate limited, pausing calls for {pause:.1f}s")
+                    self.limiter.pause(pause)
+                    continue
+            except (httpx.TimeoutException, httpx.TransportError) as e:
+                error = f"{type(e).__name__}: {e}"
+            except (ValueError, KeyError, IndexError, TypeError) as e:
+                error = f"Malformed response: {e}"
+                break
+
+            if attempt < self.max_retries:
+                delay = self._backoff(attempt, retry_after)
+                log.warning(f"⚠️ LLM call failed ({error}), retrying in {delay:.1f}s")
+                time.sleep(delay)
+                throttled += delay
+
+        self._count(calls=1, failures=1)
+        with self._lock:
+            self.latency += time.perf_counter() - start
+            self.throttled += throttled
+        raise LLMUnavailable(error)
+
+    def _finish(self, start, throttled, attempt, usage, content, prompt_chars):
+        elapsed = time.perf_counter() - start
+        self._count(calls=1, prompt_tokens=usage.get("prompt_tokens"),
+                    completion_tokens=usage.get("completion_tokens"))
+        with self._lock:
+            self.latency += elapsed
+            self.throttled += throttled
+        log.event("llm_call", level=logging.DEBUG, ms=round(elapsed * 1000, 1), waited_ms=round(throttled * 1000, 1),
+                  retries=attempt, prompt_chars=prompt_chars, prompt_tokens=usage.get("prompt_tokens"),
+                  completion_tokens=usage.get("completion_tokens"))
+        return content.strip()
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self.counters, latency=self.latency, throttled=self.throttled)
+        stats["avg_ms"] = 1000 * stats["latency"] / stats["calls"] if stats["calls"] else 0.0
+        return stats
+
+    def summary(self):
+        s = self.stats()
+        return (f"{s['calls']} calls, avg {s['avg_ms']:.0f} ms, {s['retries']} retries, "
+                f"{s['failures']} failed, {s['throttled']:.1f}s throttled, "
+                f"{s['prompt_tokens']} prompt / {s['completion_tokens']} completion tokens")
+
+    def reset_stats(self):
+        with self._lock:
+            self.counters = dict.fromkeys(self.counters, 0)
+            self.latency = self.throttled = 0.0
+
+    def close(self):
+        self._http.close()
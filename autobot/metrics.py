@@ -0,0 +1,241 @@
+"""Timing spans, per-stage histograms and a Prometheus text export.
+
+Spans wrap the stages a run spends its time in (login, card scan, modal
+step, field handlers, LLM calls, OCR, pagination):
+
+    with span("modal_step", job_id=job_id):
+        ...
+
+    @timed("llm_call")
+    def call_local_llm(...): ...
+
+When enabled, every finished span is observed into a fixed-bucket histogram
+and appended as one JSON line to a trace file, and the histograms are
+written in Prometheus text format to a file that backend/server.py serves at
+/metrics. Both files are flushed every few seconds and at exit. When
+disabled (the default) span() returns a shared no-op object, so the cost is
+one attribute check per call.
+"""
+import atexit
+import bisect
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+
+from autobot.events import log
+
+# Upper bounds in seconds, Prometheus style (+Inf is implicit)
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+METRICS_FILENAME = "metrics.prom"
+
+
+class Histogram:
+    __slots__ = ("counts", "total", "count", "errors", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.total = 0.0
+        self.count = 0
+        self.errors = 0
+        self.max = 0.0
+
+    def observe(self, seconds, ok=True):
+        self.counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.total += seconds
+        self.count += 1
+        self.max = max(self.max, seconds)
+        if not ok:
+            self.errors += 1
+
+    def quantile(self, q):
+        """Upper bucket bound holding the q-quantile (max for the +Inf bucket)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return BUCKETS[index] if index < len(BUCKETS) else self.max
+        return self.max
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set(self, **attrs):
+        pass
+
+
+NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("recorder", "name", "attrs", "start")
+
+    def __init__(self, recorder, name, attrs):
+        self.recorder = recorder
+        self.name = name
+        self.attrs = attrs
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.recorder.observe(self.name, time.perf_counter() - self.start, exc_type is None, self.attrs)
+        return False
+
+    def set(self, **attrs):
+        """Attach attributes known only inside the span (e.g. the chosen answer source)."""
+        self.attrs.update(attrs)
+
+
+class Recorder:
+    """Collects span timings; thread-safe, usable from the sync and async engines."""
+
+    def __init__(self, enabled=False, trace_path=None, metrics_path=None, flush_interval=5.0):
+        self.enabled = enabled
+        self.trace_path = trace_path
+        self.metrics_path = metrics_path
+        self.flush_interval = flush_interval
+        self.histograms = {}
+        self._pending = []
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+
+    def span(self, name, **attrs):
+        if not self.enabled:
+            return NULL_SPAN
+        return _Span(self, name, attrs)
+
+    def observe(self, name, seconds, ok=True, attrs=None):
+        record = {"ts": round(time.time(), 3), "span": name, "ms": round(seconds * 1000, 2), "ok": ok}
+        if attrs:
+            record.update(attrs)
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.observe(seconds, ok)
+            if self.trace_path:
+                self._pending.append(record)
+            due = time.monotonic() - self._last_flush >= self.flush_interval
+        if due:
+            self.flush()
+
+    def render_prometheus(self):
+        """Histograms in the Prometheus text exposition format."""
+        lines = [
+            "# HELP autobot_stage_seconds Time spent per automation stage.",
+            "# TYPE autobot_stage_seconds histogram",
+        ]
+        errors = []
+        with self._lock:
+            for name, h in sorted(self.histograms.items()):
+                cumulative = 0
+                for bound, n in zip(BUCKETS + ("+Inf",), h.counts):
+                    cumulative += n
+                    lines.append(f'autobot_stage_seconds_bucket{{stage="{name}",le="{bound}"}} {cumulative}')
+                lines.append(f'autobot_stage_seconds_sum{{stage="{name}"}} {h.total:.6f}')
+                lines.append(f'autobot_stage_seconds_count{{stage="{name}"}} {h.count}')
+                errors.append(f'autobot_stage_errors_total{{stage="{name}"}} {h.errors}')
+        lines += ["# HELP autobot_stage_errors_total Stages that ended with an exception.",
+                  "# TYPE autobot_stage_errors_total counter"] + errors
+        return "\n".join(lines) + "\n"
+
+    def summary(self):
+        """One line per stage: count, mean, p95 bucket, max and errors."""
+        with self._lock:
+            items = sorted(self.histograms.items(), key=lambda item: -item[1].total)
+            return [
+                f"{name}: {h.count}x, total {h.total:.1f}s, avg {h.total / h.count:.2f}s, "
+                f"p95 <= {h.quantile(0.95):.2f}s, max {h.max:.2f}s, {h.errors} errors"
+                for name, h in items
+            ]
+
+    def reset(self, trace_path=None):
+        """Drop the histograms and continue in another trace file (a new run in the same process)."""
+        self.flush()
+        with self._lock:
+            self.histograms = {}
+            self.trace_path = trace_path
+
+    def flush(self):
+        with self._lock:
+            pending, self._pending = self._pending, []
+            self._last_flush = time.monotonic()
+        try:
+            if pending:
+                with open(self.trace_path, "a", encoding="utf-8") as f:
+                    f.write("".join(json.dumps(r, separators=(",", ":")) + "\n" for r in pending))
+            if self.metrics_path:
+                tmp_path = self.metrics_path + ".tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    f.write(self.render_prometheus())
+                os.replace(tmp_path, self.metrics_path)
+        except OSError as e:
+            log.error(f"Error writing metrics: {e}")
+
+
+RECORDER = Recorder()
+
+
+def configure(enabled, trace_path=None, metrics_path=None, flush_interval=5.0):
+    """Switch the module-level recorder on or off and set its output files."""
+    RECORDER.enabled = bool(enabled)
+    RECORDER.trace_path = trace_path
+    RECORDER.metrics_path = metrics_path
+    RECORDER.flush_interval = flush_interval
+    return RECORDER
+
+
+def span(name, **attrs):
+    return RECORDER.span(name, **attrs)
+
+
+def timed(name):
+    """Decorator form of span() for plain and async functions."""
+    def decorate(func):
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if not RECORDER.enabled:
+                    return await func(*args, **kwargs)
+                with _Span(RECORDER, name, {}):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not RECORDER.enabled:
+                return func(*args, **kwargs)
+            with _Span(RECORDER, name, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def read_exported(metrics_path):
+    """Contents of an exported metrics file, or "" if the bot has not written one."""
+    try:
+        with open(metrics_path, encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        return ""
+
+
+@atexit.register
+def _flush_at_exit():
+    if RECORDER.enabled:
+        RECORDER.flush()
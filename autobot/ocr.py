@@ -0,0 +1,169 @@
+"""OCR with preprocessing, a content-addressed result cache and a worker pool.
+
+Screenshots of the same label (or pagination bar) recur constantly, so
+results are cached under a digest of the decoded pixels: the same rendering
+hits the same entry whatever the PNG encoder did, and labels that differ by
+a single word never share one. Cache misses are preprocessed
+(grayscale, downscale, binarize) and recognised by tesseract in a worker pool
+so the thread driving the browser only waits when it needs the text.
+
+Modes pick the tesseract page segmentation:
+    label - single text line (--psm 7), for field labels
+    block - single uniform block (--psm 6), for pagination bars
+    page  - automatic layout (--psm 3), for full screenshots
+"""
+import hashlib
+import io
+import multiprocessing
+import sqlite3
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+
+PSM_BY_MODE = {"label": 7, "block": 6, "page": 3}
+MAX_WIDTH = {"label": 800, "block": 1200, "page": 1600}
+
+
+def pixel_digest(image, mode="label"):
+    """Exact cache key: OCR mode, size and sha256 of the decoded RGBA pixels."""
+    width, height = image.size
+    digest = hashlib.sha256(image.convert("RGBA").tobytes()).hexdigest()
+    return f"{mode}:{width}x{height}:sha256:{digest}"
+
+
+def preprocess(image, mode="label"):
+    """Grayscale, downscale oversized captures and binarize for tesseract."""
+    from PIL import Image, ImageOps
+
+    gray = ImageOps.grayscale(image)
+    max_width = MAX_WIDTH.get(mode, 1200)
+    if gray.width > max_width:
+        ratio = max_width / gray.width
+        gray = gray.resize((max_width, max(1, int(gray.height * ratio))), Image.LANCZOS)
+    gray = ImageOps.autocontrast(gray)
+
+    histogram = gray.histogram()
+    total = sum(histogram)
+    mean = sum(i * count for i, count in enumerate(histogram)) / total if total else 128
+    binary = gray.point(lambda value: 255 if value > mean else 0, "1")
+    # Tesseract expects dark text on a light background
+    if sum(binary.convert("L").histogram()[:128]) > total / 2:
+        binary = ImageOps.invert(binary.convert("L"))
+    return binary
+
+
+def recognize(png_bytes, mode="label"):
+    """Preprocess and OCR PNG bytes. Top-level so it can run in a process pool."""
+    import pytesseract
+    from PIL import Image
+
+    image = Image.open(io.BytesIO(png_bytes))
+    config = f"--psm {PSM_BY_MODE.get(mode, 3)}"
+    return pytesseract.image_to_string(preprocess(image, mode), config=config).strip()
+
+
+def _default_use_processes():
+    # With "spawn" every worker would re-import the calling script; tesseract runs
+    # out-of-process anyway, so threads are an equivalent fallback there.
+    return multiprocessing.get_start_method(allow_none=False) == "fork"
+
+
+class OcrEngine:
+    """Cached, pooled OCR. `text()` blocks; `submit()` returns a Future."""
+
+    def __init__(self, cache_path=None, workers=2, memory_entries=512, use_processes=None):
+        self.hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()
+        self._memory_entries = memory_entries
+        self._lock = threading.Lock()
+        self._workers = workers
+        self._use_processes = _default_use_processes() if use_processes is None else use_processes
+        self._pool = None
+        self._conn = None
+        if cache_path:
+            self._conn = sqlite3.connect(cache_path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS ocr (hash TEXT PRIMARY KEY, text TEXT NOT NULL)"
+            )
+            # Entries keyed by the old perceptual hash can belong to another label
+            self._conn.execute("DELETE FROM ocr WHERE hash NOT LIKE '%:sha256:%'")
+            self._conn.commit()
+
+    def _executor(self):
+        if self._pool is None:
+            pool_class = ProcessPoolExecutor if self._use_processes else ThreadPoolExecutor
+            self._pool = pool_class(max_workers=self._workers)
+        return self._pool
+
+    def _lookup(self, key):
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+            if self._conn is not None:
+                row = self._conn.execute("SELECT text FROM ocr WHERE hash = ?", (key,)).fetchone()
+                if row:
+                    self._remember(key, row[0])
+                    return row[0]
+        return None
+
+    def _remember(self, key, text):
+        self._memory[key] = text
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._memory_entries:
+            self._memory.popitem(last=False)
+
+    def _store(self, key, future):
+        if future.cancelled() or future.exception() is not None:
+            return
+        with self._lock:
+            self._remember(key, future.result())
+            if self._conn is not None:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO ocr (hash, text) VALUES (?, ?)", (key, future.result())
+                )
+                self._conn.commit()
+
+    def submit(self, png_bytes, mode="label"):
+        """Future resolving to the OCR text; already resolved on a cache hit."""
+        from PIL import Image
+
+        key = pixel_digest(Image.open(io.BytesIO(png_bytes)), mode)
+        cached = self._lookup(key)
+        if cached is not None:
+            self.hits += 1
+            future = Future()
+            future.set_result(cached)
+            return future
+
+        self.misses += 1
+        future = self._executor().submit(recognize, png_bytes, mode)
+        future.add_done_callback(lambda done: self._store(key, done))
+        return future
+
+    def text(self, png_bytes, mode="label", timeout=30):
+        """OCR text for PNG bytes, from cache when possible."""
+        return self.submit(png_bytes, mode).result(timeout=timeout)
+
+    def text_image(self, image, mode="block", timeout=30):
+        """Same as text() for an in-memory PIL image (e.g. a cropped screenshot)."""
+        buffer = io.BytesIO()
+        image.save(buffer, format="PNG")
+        return self.text(buffer.getvalue(), mode, timeout)
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0}
+
+    def reset_stats(self):
+        self.hits = self.misses = 0
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -0,0 +1,61 @@
+"""Run progress shared between the automation process and the backend.
+
+The automation process keeps its current page / job / step and the
+session's job counters in a small JSON file, rewritten atomically at most
+every `interval` seconds (or immediately with force=True). The backend's run
+supervisor reads it for /api/status; the run id it passed in through
+AUTOBOT_RUN_ID tells it whether the file belongs to the current run.
+
+Every written record is also logged as a "progress" event, which reaches
+the supervisor through the JSON console and is streamed to the frontend.
+"""
+import json
+import os
+import threading
+import time
+
+from autobot.events import log
+
+PROGRESS_FILENAME = "progress.json"
+
+
+class Progress:
+    """Current position of a run plus live references to the ledger counters."""
+
+    def __init__(self, path, run_id=None, counts=None, interval=0.5):
+        self.path = path
+        self.interval = interval
+        # `counts` is the ledger's session_counts dict, read at write time
+        self.counts = counts if counts is not None else {}
+        self.state = {"run_id": run_id, "pid": os.getpid(), "page": None, "job_id": None, "step": None}
+        self._lock = threading.Lock()
+        self._last_write = 0.0
+
+    def update(self, force=False, **fields):
+        with self._lock:
+            self.state.update(fields)
+            now = time.monotonic()
+            if not force and now - self._last_write < self.interval:
+                return
+            self._last_write = now
+            record = dict(self.state, **self.counts, updated_at=time.time())
+        log.event("progress", **record)
+        try:
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(record, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            log.error(f"Error writing progress: {e}")
+
+
+def read_progress(path, run_id=None):
+    """Progress written by the automation process, or {} (also when it is from another run)."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            record = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if run_id is not None and record.get("run_id") != run_id:
+        return {}
+    return record
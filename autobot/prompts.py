@@ -0,0 +1,113 @@
+"""Prompt compiler: per-question-type templates over a fixed profile prefix.
+
+Every prompt is two messages:
+
+    system  instructions + candidate profile, built once per run and
+            byte-identical for every call, so providers that cache prompt
+            prefixes (Groq, OpenAI, vLLM/llama.cpp prefix caching) reuse it
+    user    the CV excerpts relevant to this question (BM25, with a budget
+            per type), then the question in the template for its type
+
+Each type also has its own `max_tokens` and stop sequences. A Yes/No answer
+gets 3 tokens and stops at the first newline instead of a flat 100.
+Prompt sizes are estimated before sending and added up per type for the
+final statistics.
+"""
+import threading
+from collections import namedtuple
+
+from autobot.batch_answers import build_batch_prompt
+from autobot.cv_retrieval import estimate_tokens
+
+CompiledPrompt = namedtuple("CompiledPrompt", "qtype messages max_tokens stop response_format prompt_tokens")
+
+SYSTEM_INSTRUCTIONS = (
+    "You fill in job application forms on behalf of the candidate below. "
+    "Answer as the candidate, truthfully from the profile and CV excerpts, and prefer answers "
+    "that keep the application going. Reply with the answer only: no explanation, no quotes."
+)
+
+# type -> (instruction after the question, CV excerpt token budget, max_tokens, stop)
+TEMPLATES = {
+    "yes_no": ("Answer Yes or No.", 120, 3, ["\n"]),
+    "numeric": ("Answer with a single whole number.", 120, 6, ["\n"]),
+    "text": ("Answer in one short line.", 250, 80, ["\n"]),
+    "select": ("Reply with exactly one of the options, copied verbatim.", 150, None, ["\n"]),
+    "checkbox": ("Should the candidate tick this box? Answer Yes or No.", 0, 3, ["\n"]),
+}
+BATCH_CONTEXT_TOKENS = 500
+# Per answer in a batch: the answer itself plus its JSON key and quoting
+BATCH_TOKENS_PER_ANSWER = {"yes_no": 8, "numeric": 8, "select": 20, "checkbox": 8, "text": 90}
+
+
+def profile_block(preferences, years_of_experience=None, skills=()):
+    """Candidate facts in a fixed order (the same bytes on every call)."""
+    lines = [
+        f"Location: {preferences.get('location', '')}",
+        f"Willing to commute to: {preferences.get('commuting', '')}",
+        f"Salary expectation (USD): {preferences.get('salary_expectation', '')}",
+    ]
+    if years_of_experience is not None:
+        lines.append(f"Years of experience: {years_of_experience}")
+    if skills:
+        lines.append(f"Skills: {', '.join(skills)}")
+    return "Candidate profile:\n" + "\n".join(lines)
+
+
+class PromptCompiler:
+    """Builds the messages, token budget and stop sequences for each question type."""
+
+    def __init__(self, cv_index, preferences, years_of_experience=None, skills=(), max_skills=30):
+        self.cv_index = cv_index
+        profile = profile_block(preferences, years_of_experience, list(skills)[:max_skills])
+        self.system = f"{SYSTEM_INSTRUCTIONS}\n\n{profile}"
+        self.system_tokens = estimate_tokens(self.system)
+        self.counts = {}
+        self._lock = threading.Lock()
+
+    def _excerpts(self, question, budget):
+        if not budget:
+            return ""
+        context = self.cv_index.select_context(question, budget)
+        return f"CV excerpts:\n{context}\n\n" if context else ""
+
+    def _compiled(self, qtype, user, max_tokens, stop, response_format=None):
+        prompt_tokens = self.system_tokens + estimate_tokens(user)
+        with self._lock:
+            calls, tokens, budget = self.counts.get(qtype, (0, 0, 0))
+            self.counts[qtype] = (calls + 1, tokens + prompt_tokens, budget + max_tokens)
+        messages = [{"role": "system", "content": self.system}, {"role": "user", "content": user}]
+        return CompiledPrompt(qtype, messages, max_tokens, stop, response_format, prompt_tokens)
+
+    def compile(self, qtype, question, options=None, previous=None, error=None):
+        """Prompt for one question of the given type (see llm_backends.question_type)."""
+        instruction, context_budget, max_tokens, stop = TEMPLATES[qtype]
+        user = self._excerpts(question, context_budget) + f"Question: {question}\n"
+        if options:
+            user += f"Options: {' | '.join(options)}\n"
+            if max_tokens is None:
+                max_tokens = max(estimate_tokens(o) for o in options) + 4
+        if previous and error:
+            user += f"The previous answer '{previous}' was rejected with: '{error}'. Give a corrected answer.\n"
+        return self._compiled(qtype, user + instruction, max_tokens or 20, stop)
+
+    def compile_batch(self, questions):
+        """One JSON-mode prompt for several questions (see batch_answers)."""
+        text = " ".join(q["question"] for q in questions)
+        user = build_batch_prompt(questions, self._excerpts(text, BATCH_CONTEXT_TOKENS).rstrip())
+        max_tokens = 10 + sum(BATCH_TOKENS_PER_ANSWER.get(q.get("qtype", q["kind"]), 20) for q in questions)
+        return self._compiled("batch", user, max_tokens, None, {"type": "json_object"})
+
+    def reset_stats(self):
+        with self._lock:
+            self.counts = {}
+
+    def summary(self):
+        """One line per question type: calls, average prompt tokens and output budget."""
+        with self._lock:
+            counts = sorted(self.counts.items())
+        return [
+            f"{qtype}: {calls}x, ~{tokens // calls} prompt tokens ({self.system_tokens} shared prefix), "
+            f"max_tokens {budget // calls}"
+            for qtype, (calls, tokens, budget) in counts
+        ]
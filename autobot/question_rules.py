@@ -0,0 +1,157 @@
+"""Compiled keyword rules that answer form questions without the LLM.
+
+Each rule maps question keywords to one of:
+    field  - a key of USER_PREFERENCES ("phone", "zip_code", ...)
+    answer - a fixed answer ("Yes", "No", "Immediately", ...)
+    type   - a question type: "numeric" questions are answered from the CV by
+             the caller, and the type routes the question to an LLM backend
+             and prompt template (see llm_backends.question_type)
+and may be limited to field kinds ("text", "select", "checkbox"). Rules are
+matched in priority order, but the keywords of all of them are compiled into
+one regex per kind, so a question is scanned once however many rules there
+are; only "pattern" rules are searched on their own.
+
+Extra rules can be added under "question_rules" in backend/config.json; they
+take priority over the defaults, e.g.
+    {"keywords": ["sponsorship", "visa"], "answer": "No", "kinds": ["select", "text"]}
+    {"pattern": "notice period|start date", "answer": "2 weeks"}
+Keywords are case-insensitive substrings; "pattern" is a regular expression.
+"""
+import re
+from functools import lru_cache
+
+KINDS = ("text", "select", "checkbox")
+
+DEFAULT_RULES = [
+    {"name": "veteran", "keywords": ["veteran", "military"], "field": "veteran_status", "kinds": ["text", "select"]},
+    {"name": "disability", "keywords": ["disability", "disabled"], "field": "disability", "kinds": ["text", "select"]},
+    {"name": "ethnicity", "keywords": ["ethnicity", "race"], "field": "ethnicity", "kinds": ["text", "select"]},
+    {"name": "gender", "keywords": ["gender"], "field": "gender", "kinds": ["text", "select"]},
+    {"name": "address", "keywords": ["location", "commute", "relocate", "address"], "field": "address",
+     "kinds": ["text", "select"]},
+    {"name": "phone", "keywords": ["phone", "mobile", "contact number"], "field": "phone", "kinds": ["text", "select"]},
+    {"name": "zip", "keywords": ["zip", "postal"], "field": "zip_code", "kinds": ["text", "select"]},
+    {"name": "numeric", "keywords": ["year", "years", "experience", "how many", "number of"], "type": "numeric",
+     "kinds": ["text"]},
+    {"name": "consent", "keywords": ["consent", "agree", "accept", "yes", "confirm"], "answer": "Yes",
+     "kinds": ["checkbox"]},
+]
+
+
+class RuleEngine:
+    """Priority-ordered rules compiled into one keyword scan per field kind.
+
+    Raises ValueError for a rule without keywords or pattern, without a
+    field / answer / type, with an empty keyword, with a pattern that is not a
+    valid regex or matches the empty string, or with a type that has no
+    prompt template.
+    """
+
+    def __init__(self, rules):
+        from autobot.prompts import TEMPLATES
+
+        self.rules = []
+        for rule in rules:
+            if not (rule.get("keywords") or rule.get("pattern")):
+                raise ValueError(f"Question rule needs keywords or a pattern: {rule}")
+            if not any(key in rule for key in ("field", "answer", "type")):
+                raise ValueError(f"Question rule needs a field, answer or type: {rule}")
+            if any(not str(k).strip() for k in rule.get("keywords", [])):
+                # An empty keyword would match every question
+                raise ValueError(f"Question rule has an empty keyword: {rule}")
+            if "type" in rule and rule["type"] not in TEMPLATES:
+                raise ValueError(f"Question rule type must be one of {', '.join(TEMPLATES)}: {rule}")
+            if rule.get("pattern"):
+                try:
+                    pattern = re.compile(rule["pattern"])
+                except re.error as e:
+                    raise ValueError(f"Question rule pattern is not a valid regex ({e}): {rule}") from None
+                if pattern.search(""):
+                    raise ValueError(f"Question rule pattern matches every question: {rule}")
+            self.rules.append(rule)
+
+        self._compiled = {kind: self._compile(kind) for kind in KINDS}
+
+    def _compile(self, kind):
+        """(keyword scan, rules per matched keyword, pattern rules) for one field kind.
+
+        The keywords of the kind's rules form one trie-shaped regex, so a scan
+        costs about the same with 10 or 2000 of them. At each position it finds
+        the longest keyword; every other keyword matching there is a prefix of
+        it, so the matched text maps straight to all the rules it triggers.
+        """
+        trie = {}
+        pattern_rules = []
+        for index, rule in enumerate(self.rules):
+            if kind not in rule.get("kinds", ("text", "select")):
+                continue
+            for keyword in rule.get("keywords", []):
+                node = trie
+                for char in keyword.lower():
+                    node = node.setdefault(char, {})
+                node.setdefault("", set()).add(index)
+            if rule.get("pattern"):
+                pattern_rules.append((index, re.compile(rule["pattern"], re.IGNORECASE)))
+
+        rules_by_keyword = {}
+
+        def walk(node, prefix, inherited):
+            # Returns the regex of the subtrie and records the rules of every keyword below it
+            rules = inherited | node.get("", set())
+            if "" in node:
+                rules_by_keyword[prefix] = frozenset(rules)
+            branches = [re.escape(char) + walk(child, prefix + char, rules)
+                        for char, child in sorted(node.items()) if char]
+            if not branches:
+                return ""
+            body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+            return f"(?:{body})?" if "" in node else body
+
+        scan = re.compile(f"(?=({walk(trie, '', frozenset())}))", re.IGNORECASE) if trie else None
+        return scan, rules_by_keyword, pattern_rules
+
+    @classmethod
+    def from_config(cls, user_rules=None):
+        """User rules from config first, then the defaults."""
+        return cls(list(user_rules or []) + DEFAULT_RULES)
+
+    def matches(self, question, kind="text"):
+        """Rules matching the question for this kind, highest priority first."""
+        if kind not in self._compiled or not question:
+            return []
+        scan, rules_by_keyword, pattern_rules = self._compiled[kind]
+        found = set()
+        if scan is not None:
+            for match in scan.finditer(question):
+                found |= rules_by_keyword.get(match.group(1).lower(), frozenset())
+        # Only "pattern" rules (user regexes) need a search of their own
+        found.update(index for index, pattern in pattern_rules if pattern.search(question))
+        return [self.rules[index] for index in sorted(found)]
+
+    def question_type(self, question, kind="text"):
+        """"type" of the first matching type rule (e.g. "numeric"), or None."""
+        return next((rule["type"] for rule in self.matches(question, kind) if "type" in rule), None)
+
+    def resolve(self, question, kind, preferences):
+        """(rule, answer) for the first matching rule that yields an answer or a type.
+
+        Profile rules whose preference is empty are skipped, so a later rule
+        can still apply. Returns (None, None) when no rule applies and
+        (rule, None) for type-only rules such as "numeric".
+        """
+        for rule in self.matches(question, kind):
+            if "field" in rule:
+                value = preferences.get(rule["field"])
+                if value:
+                    return rule, str(value)
+            elif "answer" in rule:
+                return rule, rule["answer"]
+            else:
+                return rule, None
+        return None, None
+
+
+@lru_cache(maxsize=1)
+def default_engine():
+    """RuleEngine of the default rules, for callers without a configured one."""
+    return RuleEngine(DEFAULT_RULES)
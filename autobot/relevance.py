@@ -0,0 +1,76 @@
+"""Local TF-IDF relevance of a job to the CV, scored before Easy Apply.
+
+Every job that reaches the modal costs several steps and usually a few LLM
+calls, even when the posting has nothing to do with the CV. The job title
+and description from the detail pane are scored here against the CV with
+TF-IDF cosine similarity (NumPy, no network), and jobs under the configured
+threshold are skipped before the apply button is clicked.
+
+The IDF weights come from the CV chunks, so terms that run through the whole
+CV ("experience", "project") count less than specific skills. Description
+terms the CV never mentions still count towards the description's norm:
+a posting mostly about other things scores low even if it shares a few
+words with the CV.
+"""
+from collections import Counter
+
+import numpy as np
+
+from autobot.cv_retrieval import chunk_sections, tokenize
+
+
+def _sublinear(counts):
+    return 1.0 + np.log(np.asarray(counts, dtype=np.float32))
+
+
+class RelevanceScorer:
+    """Cosine similarity between TF-IDF vectors of a job text and the CV."""
+
+    def __init__(self, documents):
+        tokenized = [tokenize(doc) for doc in documents]
+        self.vocab = {}
+        for tokens in tokenized:
+            for token in tokens:
+                self.vocab.setdefault(token, len(self.vocab))
+
+        n = len(tokenized)
+        df = np.zeros(len(self.vocab), dtype=np.float32)
+        tf = np.zeros(len(self.vocab), dtype=np.float32)
+        for tokens in tokenized:
+            for token, count in Counter(tokens).items():
+                df[self.vocab[token]] += 1
+                tf[self.vocab[token]] += count
+        # Smoothed IDF; a term outside the CV gets the weight of the rarest CV term
+        self.idf = np.log((1 + n) / (1 + df)) + 1
+        self.unseen_idf = float(np.log(1 + n) + 1)
+
+        cv_vector = np.zeros(len(self.vocab), dtype=np.float32)
+        present = tf > 0
+        cv_vector[present] = _sublinear(tf[present]) * self.idf[present]
+        norm = float(np.linalg.norm(cv_vector))
+        self.cv_vector = cv_vector / norm if norm else cv_vector
+
+    @classmethod
+    def from_artifacts(cls, artifacts, max_words=80):
+        sections = artifacts.get("sections") or [{"title": "header", "text": artifacts.get("text", "")}]
+        documents = chunk_sections(sections, max_words)
+        if artifacts.get("skills"):
+            documents.append(" ".join(artifacts["skills"]))
+        return cls(documents)
+
+    def score(self, text):
+        """Similarity in [0, 1]; 0 for empty text or an empty CV."""
+        counts = Counter(tokenize(text))
+        if not counts or not self.vocab:
+            return 0.0
+        known = [(self.vocab[t], c) for t, c in counts.items() if t in self.vocab]
+        unseen = [c for t, c in counts.items() if t not in self.vocab]
+
+        norm_sq = float(np.sum((_sublinear(unseen) * self.unseen_idf) ** 2)) if unseen else 0.0
+        dot = 0.0
+        if known:
+            columns = np.fromiter((i for i, _ in known), dtype=np.int64, count=len(known))
+            weights = _sublinear([c for _, c in known]) * self.idf[columns]
+            norm_sq += float(weights @ weights)
+            dot = float(weights @ self.cv_vector[columns])
+        return dot / np.sqrt(norm_sq) if norm_sq else 0.0
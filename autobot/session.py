@@ -0,0 +1,65 @@
+"""Saved LinkedIn sessions, so that a run can skip the login form.
+
+After a login, and again at the end of every run, the browser context's
+Playwright storage_state (cookies and local storage) is written to
+data/sessions/<account>.json. Each account (site URL and email) gets its own
+file, and only the owner can read it.
+
+The next run creates its context from that file, if the `li_at` session
+cookie in it has not expired (a check with no network). It then goes
+straight to the job search. The only online check is whether that page
+redirects to a login or authwall URL. If it does, the file is dropped and
+the run logs in as before. A valid session costs no extra page load at all.
+"""
+import hashlib
+import json
+import os
+import time
+
+SESSION_COOKIE = "li_at"
+LOGIN_URL_MARKERS = ("/login", "/uas/login", "/authwall", "/checkpoint/", "login-submit")
+
+
+def is_login_url(url):
+    """True if the browser landed on a login / authwall page instead of the one it asked for."""
+    return any(marker in (url or "") for marker in LOGIN_URL_MARKERS)
+
+
+class SessionStore:
+    """storage_state file of one account."""
+
+    def __init__(self, directory, base_url, account):
+        key = hashlib.sha256(f"{base_url}\n{(account or '').strip().lower()}".encode("utf-8")).hexdigest()[:16]
+        self.path = os.path.join(directory, f"{key}.json")
+
+    def state(self):
+        """Path to create the browser context with, or None when there is no usable session."""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                cookies = json.load(f).get("cookies") or []
+        except (OSError, ValueError, AttributeError):
+            return None
+        now = time.time()
+        for cookie in cookies:
+            if cookie.get("name") == SESSION_COOKIE:
+                expires = cookie.get("expires", -1)
+                # -1 is a browser-session cookie, valid until the server says otherwise
+                return self.path if expires < 0 or expires > now else None
+        return None
+
+    def save(self, storage_state):
+        """Write a context's storage_state (the dict from context.storage_state())."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        # Session cookies are credentials: readable by the owner only
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(storage_state, f)
+        os.replace(tmp_path, self.path)
+
+    def forget(self):
+        """Drop an expired or rejected session."""
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
@@ -0,0 +1,148 @@
+"""Readiness-based waits that replace fixed sleeps around page loads.
+
+Each wait returns as soon as its condition holds (selector attached, job
+card count stable, URL / `start=` changed) and gives up after an upper
+bound. There is no network-idle wait: LinkedIn keeps long-polling
+connections open, so it would mostly run into its timeout. Every wait is timed into WAIT_TIMINGS so `wait_summary()`
+can show where load time went. Deliberate human-like pacing is not a load
+wait and stays in human_delay / the application delay setting.
+
+Sync helpers take a sync Playwright page; the `_async` variants take an
+async page.
+"""
+import asyncio
+import re
+import time
+from collections import defaultdict
+
+from autobot.events import log
+
+JOB_CARD_SELECTOR = ".job-card-container"
+
+# name -> [count, total_seconds, max_seconds, timeouts]
+WAIT_TIMINGS = defaultdict(lambda: [0, 0.0, 0.0, 0])
+
+
+def _record(name, elapsed, ok):
+    stats = WAIT_TIMINGS[name]
+    stats[0] += 1
+    stats[1] += elapsed
+    stats[2] = max(stats[2], elapsed)
+    if not ok:
+        stats[3] += 1
+        log.warning(f"⏱️ Wait '{name}' timed out after {elapsed:.1f}s, continuing", wait=name)
+
+
+def wait_summary():
+    """One line per wait name: count, mean, max and timeouts."""
+    return [
+        f"{name}: {count}x, avg {total / count:.2f}s, max {worst:.2f}s, {timeouts} timeouts"
+        for name, (count, total, worst, timeouts) in sorted(WAIT_TIMINGS.items())
+    ]
+
+
+def reset_wait_timings():
+    """Start the wait statistics of another run from zero."""
+    WAIT_TIMINGS.clear()
+
+
+def start_param(url):
+    match = re.search(r'[?&]start=(\d+)', url or "")
+    return int(match.group(1)) if match else 0
+
+
+def wait_until(condition, timeout=10, poll=0.1, name="condition"):
+    """Poll condition() until it is truthy or timeout seconds pass."""
+    start = time.monotonic()
+    ok = False
+    while True:
+        try:
+            ok = bool(condition())
+        except Exception:
+            ok = False
+        if ok or time.monotonic() - start >= timeout:
+            break
+        time.sleep(poll)
+    _record(name, time.monotonic() - start, ok)
+    return ok
+
+
+def wait_for_selector(page, selector, timeout=10, state="attached", name=None):
+    start = time.monotonic()
+    try:
+        page.locator(selector).first.wait_for(state=state, timeout=timeout * 1000)
+        ok = True
+    except Exception:
+        ok = False
+    _record(name or f"selector {selector}", time.monotonic() - start, ok)
+    return ok
+
+
+def wait_for_url_change(page, old_url, timeout=10, name="url change"):
+    return wait_until(lambda: page.url != old_url, timeout, name=name)
+
+
+def wait_for_start_change(page, old_url, timeout=10, name="start= change"):
+    """Wait until the results offset (&start=) in the URL differs from old_url's."""
+    old_start = start_param(old_url)
+    return wait_until(lambda: start_param(page.url) != old_start, timeout, name=name)
+
+
+def wait_for_cards_stable(page, timeout=10, settle=0.5, selector=JOB_CARD_SELECTOR, name="job cards stable"):
+    """Wait until at least one job card exists and the count stops changing for `settle` seconds."""
+    state = {"count": -1, "since": time.monotonic()}
+
+    def stable():
+        count = page.locator(selector).count()
+        now = time.monotonic()
+        if count != state["count"]:
+            state["count"], state["since"] = count, now
+            return False
+        return count > 0 and now - state["since"] >= settle
+
+    return wait_until(stable, timeout, poll=0.15, name=name)
+
+
+async def wait_until_async(condition, timeout=10, poll=0.1, name="condition"):
+    """Async wait_until; condition may be a coroutine function."""
+    start = time.monotonic()
+    ok = False
+    while True:
+        try:
+            result = condition()
+            if asyncio.iscoroutine(result):
+                result = await result
+            ok = bool(result)
+        except Exception:
+            ok = False
+        if ok or time.monotonic() - start >= timeout:
+            break
+        await asyncio.sleep(poll)
+    _record(name, time.monotonic() - start, ok)
+    return ok
+
+
+async def wait_for_selector_async(page, selector, timeout=10, state="attached", name=None):
+    start = time.monotonic()
+    try:
+        await page.locator(selector).first.wait_for(state=state, timeout=timeout * 1000)
+        ok = True
+    except Exception:
+        ok = False
+    _record(name or f"selector {selector}", time.monotonic() - start, ok)
+    return ok
+
+
+async def wait_for_cards_stable_async(page, timeout=10, settle=0.5, selector=JOB_CARD_SELECTOR,
+                                      name="job cards stable"):
+    state = {"count": -1, "since": time.monotonic()}
+
+    async def stable():
+        count = await page.locator(selector).count()
+        now = time.monotonic()
+        if count != state["count"]:
+            state["count"], state["since"] = count, now
+            return False
+        return count > 0 and now - state["since"] >= settle
+
+    return await wait_until_async(stable, timeout, poll=0.15, name=name)
@@ -0,0 +1,186 @@
+"""Long-lived automation worker, driven by the backend over stdin/stdout.
+
+`python app-groq.py --worker` imports Playwright once, builds the shared
+objects (CV artifacts, LLM router, caches; see autobot/context.py) and
+launches Chromium, then waits for commands. A run then costs a new browser
+context instead of a new interpreter, CV parse and browser launch.
+
+Commands are JSON lines on stdin:
+
+    {"cmd": "run", "run_id": "...", "engine": "sync"}   start a run
+    {"cmd": "stop"}                                     interrupt the active run, like Ctrl+C
+    {"cmd": "ping", "id": "..."}                        health check, answered with the same id
+    {"cmd": "exit"}                                     shut down (so does the end of stdin)
+
+Output is the usual event stream on stdout (AUTOBOT_EVENTS=stdout), plus:
+
+    {"event": "worker", "state": "ready" | "busy" | "exiting", "pid": ..., "runs": ..., ...}
+        after start-up, around every run and in reply to a ping (with "ping": <id>)
+    {"event": "run", "run_id": ..., "state": "finished" | "failed" | "stopped", "exit_code": 0 | 1}
+        when a run ends
+
+The config is read again before every run. If it changed, the context is
+reconfigured and only the objects built from changed settings are rebuilt.
+Chromium is relaunched only when `headless` changed. The sync engine runs in
+the warm browser. The async engine needs the thread's event loop to itself,
+so the warm browser is shut down for it and the engine launches its own.
+"""
+import _thread
+import json
+import os
+import queue
+import signal
+import sys
+import threading
+import time
+
+from autobot.context import Settings, get_context, set_context
+from autobot.events import log
+
+
+class Worker:
+    """Runs one automation at a time in this process, keeping everything warm between runs."""
+
+    def __init__(self, bot, stdin=None):
+        self.bot = bot
+        self.stdin = stdin or sys.stdin
+        self.default_engine = os.getenv("AUTOBOT_ENGINE", "sync")
+        self.commands = queue.Queue()
+        self.started = time.time()
+        self.runs = 0
+        self.run_id = None
+        self.stopping = False
+        self._playwright = None
+        self._browser = None
+        self._headless = None
+
+    def emit(self, state=None, ping=None):
+        """Report the worker's state; a ping gets the current one, tagged with the ping's id."""
+        state = state or ("busy" if self.run_id else "ready")
+        extra = {"ping": ping} if ping else {}
+        log.event("worker", f"Worker {state}", state=state, pid=os.getpid(), runs=self.runs,
+                  run_id=self.run_id, uptime=round(time.time() - self.started, 1),
+                  browser=self._browser is not None, **extra)
+
+    def _read_commands(self):
+        for line in self.stdin:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                command = json.loads(line)
+            except ValueError:
+                log.warning(f"⚠️ Worker ignored a malformed command: {line[:200]}")
+                continue
+            cmd = command.get("cmd")
+            if cmd == "ping":
+                self.emit(ping=command.get("id"))
+            elif cmd == "stop":
+                self.stop()
+            else:
+                self.commands.put(command)
+        self.commands.put({"cmd": "exit"})
+
+    def stop(self):
+        """Interrupt the active run the way Ctrl+C interrupts the standalone script."""
+        if self.run_id is None or self.stopping:
+            return
+        self.stopping = True
+        if os.name == "nt":
+            _thread.interrupt_main()
+        else:
+            os.kill(os.getpid(), signal.SIGINT)
+
+    def _launch_browser(self):
+        headless = get_context().settings.headless
+        if self._browser is not None and (self._headless != headless or not self._browser.is_connected()):
+            self._close_browser()
+        if self._browser is None:
+            from playwright.sync_api import sync_playwright
+
+            if self._playwright is None:
+                self._playwright = sync_playwright().start()
+            self._browser = self._playwright.chromium.launch(headless=headless)
+            self._headless = headless
+        return self._browser
+
+    def _close_browser(self):
+        for close in (self._browser and self._browser.close, self._playwright and self._playwright.stop):
+            if close:
+                try:
+                    close()
+                except Exception as e:
+                    log.debug(f"Closing the warm browser failed: {e}")
+        self._browser = self._playwright = None
+
+    def _apply_config(self):
+        """Reload the config; rebuild what depends on changed settings."""
+        settings = Settings()
+        context = get_context()
+        if settings.values() != context.settings.values():
+            log.info("⚙️ Config changed, applying it without a restart")
+            set_context(context.reconfigure(settings))
+
+    def warm_up(self):
+        start = time.perf_counter()
+        try:
+            self.bot.start_run()
+            if self.default_engine == "sync":
+                self._launch_browser()
+        except Exception as e:
+            # Not fatal: the next run reloads the config and tries again
+            log.exception(f"❌ Worker warm-up failed: {e}")
+        log.event("worker_warm", f"🔥 Worker warm in {time.perf_counter() - start:.1f}s",
+                  seconds=round(time.perf_counter() - start, 3))
+
+    def run(self, command):
+        self.run_id = command.get("run_id")
+        self.stopping = False
+        self.runs += 1
+        self.emit("busy")
+        engine = command.get("engine") or self.default_engine
+        exit_code = 0
+        try:
+            self._apply_config()
+            get_context().new_run(self.run_id)
+            if engine == "sync":
+                self.bot.run_automation(browser=self._launch_browser())
+            else:
+                self._close_browser()
+                self.bot.ENGINES[engine]()
+        except KeyboardInterrupt:
+            self.stopping = True
+        except Exception as e:
+            exit_code = 1
+            log.exception(f"❌ Run {self.run_id} failed: {e}")
+        state = "stopped" if self.stopping else ("finished" if exit_code == 0 else "failed")
+        log.event("run", f"Run {self.run_id} {state}", run_id=self.run_id, state=state, exit_code=exit_code)
+        self.run_id = None
+        self.stopping = False
+        self.emit("ready")
+
+    def serve(self):
+        self.warm_up()
+        threading.Thread(target=self._read_commands, daemon=True).start()
+        self.emit("ready")
+        try:
+            while True:
+                try:
+                    command = self.commands.get()
+                except KeyboardInterrupt:
+                    continue  # A stop that arrived just after its run ended
+                if command.get("cmd") == "exit":
+                    break
+                if command.get("cmd") == "run":
+                    self.run(command)
+                else:
+                    log.warning(f"⚠️ Unknown worker command: {command.get('cmd')}")
+        finally:
+            self.emit("exiting")
+            self._close_browser()
+            get_context().close()
+
+
+def serve(bot):
+    """Entry point of `app-groq.py --worker`."""
+    Worker(bot).serve()
@@ -1,10 +1,24 @@
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Header, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from pydantic import BaseModel
+from typing import Optional
+from collections import deque
+from itertools import islice
+import asyncio
 import json
 import os
+import signal
 import subprocess
+import sys
 import threading
+import time
+import uuid
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from autobot import DATA_DIR
+from autobot.metrics import METRICS_FILENAME, read_exported
+from autobot.progress import PROGRESS_FILENAME, read_progress
 
 app = FastAPI()
 
@@ -33,40 +47,360 @@ class UserConfig(BaseModel):
     zip_code: str
     middle_name: str
     phone: str
+    question_rules: Optional[list] = None
+    relevance_threshold: Optional[float] = None
+    classifier_threshold: Optional[float] = None
+    llm: Optional[dict] = None
 
 CONFIG_FILE_PATH = os.path.join(os.path.dirname(__file__), 'config.json')
 SCRIPT_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'app-groq.py'))
 
-def run_script():
-    try:
-        # Run the automation script as a subprocess
-        print(f"Starting automation script: {SCRIPT_PATH}")
-        subprocess.run(["python", SCRIPT_PATH], check=True)
-        print("Automation script finished successfully.")
-    except subprocess.CalledProcessError as e:
-        print(f"Error running automation script: {e}")
-    except Exception as e:
-         print(f"Unexpected error: {e}")
+# Seconds a stopping run gets to close the browser and print its statistics
+STOP_GRACE_SECONDS = 15
+
+# Seconds /api/worker waits for the worker to answer a ping
+PING_TIMEOUT_SECONDS = 2
+
+# Events kept for streaming/resume; older ones are dropped, so memory stays flat on long runs
+EVENT_BUFFER_SIZE = 5000
+MAX_LINE_LENGTH = 2000
+
+class EventBuffer:
+    """Bounded ring buffer of run events with monotonically increasing offsets."""
+
+    def __init__(self, maxlen=EVENT_BUFFER_SIZE):
+        self._events = deque(maxlen=maxlen)
+        self._next_offset = 0
+        self._lock = threading.Lock()
+
+    def append(self, event):
+        with self._lock:
+            event["offset"] = self._next_offset
+            self._next_offset += 1
+            self._events.append(event)
+
+    def since(self, offset):
+        """Events with offset >= offset (from the oldest kept one if those were dropped)."""
+        with self._lock:
+            if not self._events or offset >= self._next_offset:
+                return []
+            start = max(0, offset - self._events[0]["offset"])
+            return list(islice(self._events, start, None))
+
+    @property
+    def next_offset(self):
+        return self._next_offset
+
+def parse_output_line(line):
+    """A JSON line with an "event" key is a structured event; anything else is plain log text."""
+    if line.startswith("{"):
+        try:
+            event = json.loads(line)
+            if isinstance(event, dict) and "event" in event:
+                return event
+        except ValueError:
+            pass
+    return {"event": "log", "level": "info", "msg": line[:MAX_LINE_LENGTH]}
+
+class RunSupervisor:
+    """Owns the warm automation worker and its runs: one run at a time, with real state and exit codes.
+
+    The worker (`app-groq.py --worker`, see autobot/worker.py) is started with
+    the backend and kept alive between runs, with the CV, LLM clients, caches
+    and Chromium already loaded. Runs are started and stopped by commands on
+    its stdin. Its stdout is captured line by line into `events` (and echoed
+    to this console). The latest progress event is kept for /api/status, and
+    the latest worker state for /api/worker.
+
+    Run states: idle -> running -> finished | failed | stopped (stopping while
+    a stop is in progress). A worker that exits takes its active run with it
+    and is started again. It runs in its own process group, so killing it also
+    takes down the Playwright driver and Chromium it spawned.
+    """
+
+    def __init__(self, script_path, config_path):
+        self.script_path = script_path
+        self.config_path = config_path
+        self.events = EventBuffer()
+        self._lock = threading.Lock()
+        self._stdin_lock = threading.Lock()
+        self._worker = None
+        self._worker_status = {"state": "down"}
+        self._pings = {}  # ping id -> Event set when the worker echoes that id
+        self._closing = False
+        self._progress = {}
+        self._run_done = threading.Event()
+        self._run = {"run_id": None, "state": "idle", "pid": None, "exit_code": None,
+                     "started_at": None, "ended_at": None}
+
+    def _is_active(self):
+        return self._run["state"] in ("running", "stopping")
+
+    def _write_config(self, updates):
+        # Keep hand-edited keys the UI does not send (e.g. question_rules, pacing_scale)
+        config_dict = {}
+        if os.path.exists(self.config_path):
+            with open(self.config_path, 'r') as f:
+                config_dict = json.load(f)
+        config_dict.update(updates)
+        with open(self.config_path, 'w') as f:
+            json.dump(config_dict, f, indent=4)
+
+    def ensure_worker(self):
+        """Start the worker unless it is already up; returns its process."""
+        with self._lock:
+            return self._ensure_worker()
+
+    def _ensure_worker(self):
+        if self._worker is not None and self._worker.poll() is None:
+            return self._worker
+        env = dict(os.environ, AUTOBOT_EVENTS="stdout", PYTHONUNBUFFERED="1", PYTHONIOENCODING="utf-8")
+        kwargs = {}
+        if os.name == "nt":
+            kwargs["creationflags"] = subprocess.CREATE_NEW_PROCESS_GROUP
+        else:
+            kwargs["start_new_session"] = True
+        print(f"Starting automation worker: {self.script_path} --worker")
+        process = subprocess.Popen([sys.executable, self.script_path, "--worker"], env=env,
+                                   stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                   text=True, encoding="utf-8", errors="replace", bufsize=1, **kwargs)
+        self._worker = process
+        self._worker_status = {"state": "starting", "pid": process.pid, "started_at": time.time()}
+        threading.Thread(target=self._watch, args=(process,), daemon=True).start()
+        return process
+
+    def _send(self, process, command):
+        try:
+            with self._stdin_lock:
+                process.stdin.write(json.dumps(command) + "\n")
+                process.stdin.flush()
+            return True
+        except (OSError, ValueError):
+            return False
+
+    def start(self, config_updates, engine=None):
+        """Write the config and hand a run to the worker; raises RuntimeError if one is active."""
+        with self._lock:
+            if self._is_active():
+                raise RuntimeError(f"Run {self._run['run_id']} is already {self._run['state']}")
+            self._write_config(config_updates)
+            process = self._ensure_worker()
+
+            run_id = uuid.uuid4().hex[:12]
+            if not self._send(process, {"cmd": "run", "run_id": run_id, "engine": engine}):
+                raise RuntimeError("The automation worker is not accepting commands")
+            print(f"Starting automation run {run_id} in worker {process.pid}")
+            self._run = {"run_id": run_id, "state": "running", "pid": process.pid, "exit_code": None,
+                         "started_at": time.time(), "ended_at": None}
+            self._progress = {}
+            self._run_done = threading.Event()
+            self.events.append({"event": "run", "run_id": run_id, "state": "running", "ts": time.time()})
+            return dict(self._run)
+
+    def _finish_run(self, run_id, state, exit_code):
+        with self._lock:
+            if self._run["run_id"] != run_id or not self._is_active():
+                return
+            if self._run["state"] == "stopping":
+                state = "stopped"
+            self._run.update(state=state, exit_code=exit_code, ended_at=time.time())
+            self._run_done.set()
+        self.events.append({"event": "run", "run_id": run_id, "state": state, "exit_code": exit_code,
+                            "ts": time.time()})
+        print(f"Automation run {run_id} ended: {state} (exit code {exit_code})")
+
+    def _read_output(self, process):
+        for line in process.stdout:
+            line = line.rstrip("\n")
+            event = parse_output_line(line)
+            if event["event"] == "worker":
+                if event.get("state") == "ready" and self._worker_status.get("state") == "starting":
+                    print(f"Automation worker {process.pid} is ready")
+                self._worker_status = dict(event, last_seen=time.time())
+                # Only the reply to a ping proves the command loop is alive, not any worker line
+                answered = self._pings.get(event.get("ping"))
+                if answered is not None:
+                    answered.set()
+                continue
+            if event["event"] == "run":
+                self._finish_run(event.get("run_id"), event.get("state", "finished"), event.get("exit_code", 0))
+                continue
+            if event["event"] == "progress":
+                self._progress = event
+            elif "msg" in event:
+                # Echo the human-readable message to the backend console
+                print(event["msg"])
+            event.setdefault("run_id", self._run["run_id"] if self._is_active() else None)
+            event.setdefault("ts", time.time())
+            self.events.append(event)
+
+    def _watch(self, process):
+        reader = threading.Thread(target=self._read_output, args=(process,), daemon=True)
+        reader.start()
+        exit_code = process.wait()
+        # Leftover driver/Chromium processes in the worker's group go with it (and release the pipe)
+        self._kill_group(process)
+        reader.join(timeout=5)
+        with self._lock:
+            if self._worker is not process:
+                return
+            # A worker that never got ready would most likely fail again; the next start retries
+            respawn = not self._closing and self._worker_status.get("state") != "starting"
+            self._worker = None
+            self._worker_status = {"state": "down", "pid": process.pid, "exit_code": exit_code}
+            run_id = self._run["run_id"] if self._is_active() else None
+        print(f"Automation worker {process.pid} exited with code {exit_code}")
+        if run_id:
+            self._finish_run(run_id, "failed", exit_code)
+        if respawn:
+            self.ensure_worker()
+
+    def _kill_group(self, process):
+        try:
+            if os.name == "nt":
+                subprocess.run(["taskkill", "/PID", str(process.pid), "/T", "/F"],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            else:
+                os.killpg(process.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError, OSError):
+            pass
+
+    def stop(self):
+        """Interrupt the active run; restart the worker if the run does not end within the grace period."""
+        with self._lock:
+            if not self._is_active():
+                return dict(self._run)
+            process, done = self._worker, self._run_done
+            self._run["state"] = "stopping"
+        # The worker interrupts the run like Ctrl+C: it closes its browser context and prints its statistics
+        if process is not None and self._send(process, {"cmd": "stop"}) and done.wait(STOP_GRACE_SECONDS):
+            with self._lock:
+                return dict(self._run)
+        print(f"Run did not stop within {STOP_GRACE_SECONDS}s, restarting the worker")
+        if process is not None:
+            self._kill_group(process)
+        # The watcher ends the run when the worker exits
+        done.wait(5)
+        with self._lock:
+            return dict(self._run)
+
+    def health(self, timeout=PING_TIMEOUT_SECONDS):
+        """Ping the worker; its last reported state, and whether it answered within `timeout`."""
+        with self._lock:
+            process = self._worker
+        if process is None or process.poll() is not None:
+            return dict(self._worker_status, ok=False)
+        ping_id = uuid.uuid4().hex[:12]
+        pong = self._pings[ping_id] = threading.Event()
+        try:
+            answered = self._send(process, {"cmd": "ping", "id": ping_id}) and pong.wait(timeout)
+        finally:
+            self._pings.pop(ping_id, None)
+        return dict(self._worker_status, ok=bool(answered))
+
+    def shutdown(self):
+        """Ask the worker to exit (closing its browser), killing it after the grace period."""
+        with self._lock:
+            self._closing = True
+            process = self._worker
+        if process is None:
+            return
+        if self._is_active():
+            self.stop()
+        self._send(process, {"cmd": "exit"})
+        try:
+            process.wait(timeout=STOP_GRACE_SECONDS)
+        except subprocess.TimeoutExpired:
+            pass
+        self._kill_group(process)
+
+    def status(self):
+        with self._lock:
+            run = dict(self._run)
+        if run["run_id"]:
+            run["progress"] = (self._progress
+                               or read_progress(os.path.join(DATA_DIR, PROGRESS_FILENAME), run["run_id"]))
+        run["worker"] = dict(self._worker_status)
+        run["next_offset"] = self.events.next_offset
+        return run
+
+SUPERVISOR = RunSupervisor(SCRIPT_PATH, CONFIG_FILE_PATH)
+
+@app.on_event("startup")
+def start_worker():
+    # Warm up (imports, CV, LLM clients, Chromium) before the first "Start" click
+    SUPERVISOR.ensure_worker()
+
+@app.on_event("shutdown")
+def stop_worker():
+    SUPERVISOR.shutdown()
 
 @app.post("/api/start")
-async def start_automation(config: UserConfig, background_tasks: BackgroundTasks):
+def start_automation(config: UserConfig, engine: Optional[str] = None):
+    # Sync endpoint: spawning the worker and writing the config happen in a worker thread
+    if engine not in (None, "sync", "async"):
+        raise HTTPException(status_code=400, detail=f"Unknown engine: {engine}")
     try:
-        # Write config to JSON file
-        config_dict = config.dict()
-        with open(CONFIG_FILE_PATH, 'w') as f:
-            json.dump(config_dict, f, indent=4)
-        
-        # Start script in background
-        background_tasks.add_task(run_script)
-        
-        return {"status": "success", "message": "Automation started in the background."}
+        run = SUPERVISOR.start(config.dict(exclude_none=True), engine=engine)
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    return {"status": "success", "message": "Automation started in the background.", "run_id": run["run_id"]}
+
+@app.post("/api/stop")
+def stop_automation():
+    # Sync endpoint: FastAPI runs it in a worker thread while the run shuts down
+    run = SUPERVISOR.stop()
+    return {"status": run["state"], "run_id": run["run_id"], "exit_code": run["exit_code"]}
 
 @app.get("/api/status")
 async def get_status():
-    # Basic status check
-    return {"status": "running"}
+    return SUPERVISOR.status()
+
+@app.get("/api/worker")
+def worker_health():
+    # Sync endpoint: waiting for the ping reply happens in a worker thread
+    health = SUPERVISOR.health()
+    if not health["ok"]:
+        raise HTTPException(status_code=503, detail=health)
+    return health
+
+@app.get("/api/events")
+async def stream_events(request: Request, offset: Optional[int] = None,
+                        last_event_id: Optional[str] = Header(None)):
+    # Server-Sent Events from ?offset=N; on reconnect the browser's Last-Event-ID takes over
+    if last_event_id and last_event_id.isdigit():
+        offset = int(last_event_id) + 1
+    elif offset is None:
+        offset = 0
+
+    async def generate(offset):
+        idle = 0.0
+        while not await request.is_disconnected():
+            events = SUPERVISOR.events.since(offset)
+            for event in events:
+                # Typed log events (job_started, field_filled, ...) are all "log" to the client
+                kind = event["event"] if event["event"] in ("progress", "run") else "log"
+                yield f"id: {event['offset']}\nevent: {kind}\ndata: {json.dumps(event)}\n\n"
+                offset = event["offset"] + 1
+            if events:
+                idle = 0.0
+                continue
+            await asyncio.sleep(0.25)
+            idle += 0.25
+            if idle >= 15:
+                idle = 0.0
+                yield ": keep-alive\n\n"
+
+    return StreamingResponse(generate(offset), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache"})
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    # Stage histograms exported by the automation process (set "metrics": true in config.json)
+    return PlainTextResponse(read_exported(os.path.join(DATA_DIR, METRICS_FILENAME)),
+                             media_type="text/plain; version=0.0.4")
 
 if __name__ == "__main__":
     import uvicorn
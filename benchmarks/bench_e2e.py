@@ -0,0 +1,172 @@
+"""End-to-end throughput benchmark against the local LinkedIn stand-in.
+
+Starts benchmarks/fake_linkedin.py on a free port, points app-groq.py at it
+(search URL, login, Groq base URL -> mock chat completions endpoint) with
+human pacing disabled and a throwaway data directory, runs one engine and
+reports:
+    applications/min      submitted applications per minute of wall time
+    round trips/step      Playwright protocol messages per Easy Apply step
+    LLM calls/application requests that reached the mock LLM endpoint
+    relevance prefilter   jobs skipped as unrelated to the CV, and the modal
+                          steps and LLM calls that saves per page (estimated
+                          from the per-application averages of this run)
+
+Nothing here talks to linkedin.com or Groq. With --llm-backend mock the
+answers come from the in-process mock backend instead of the mock endpoint.
+
+Usage:
+    python benchmarks/bench_e2e.py [--engine sync|async] [--pages 2] [--llm-latency 0.3]
+                                   [--relevance-threshold 0.1] [--llm-backend mock]
+"""
+import argparse
+import gzip
+import hashlib
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(__file__))
+
+from fake_linkedin import FakeLinkedIn
+
+CV_TEXT = """Jane Doe
+jane@example.com
+Summary
+Machine learning student with 2 years of experience in Python and deep learning.
+Experience
+ML intern at Example Corp: built PyTorch models, data pipelines and dashboards.
+Skills
+Python, PyTorch, SQL, pandas, Docker
+Education
+B.Sc. Computer Science
+"""
+
+
+def write_fixtures(workdir):
+    """Config, dummy CV and a pre-seeded CV cache so no PDF parsing is needed."""
+    cv_path = os.path.join(workdir, "cv.pdf")
+    cv_bytes = b"%PDF-1.4 benchmark placeholder\n"
+    with open(cv_path, "wb") as f:
+        f.write(cv_bytes)
+
+    from autobot.cv_artifacts import CACHE_VERSION, extract_skills, split_sections
+    sections = split_sections(CV_TEXT)
+    artifacts = {"version": CACHE_VERSION, "text": CV_TEXT, "pages": [CV_TEXT],
+                 "sections": sections, "skills": extract_skills(sections)}
+    cache_dir = os.path.join(workdir, "data", "cv")
+    os.makedirs(cache_dir, exist_ok=True)
+    digest = hashlib.sha256(cv_bytes).hexdigest()
+    with gzip.open(os.path.join(cache_dir, f"cv_{digest[:32]}.json.gz"), "wt", encoding="utf-8") as f:
+        json.dump(artifacts, f)
+
+    config_path = os.path.join(workdir, "config.json")
+    with open(config_path, "w") as f:
+        json.dump({
+            "linkedin_email": "bench@example.com",
+            "linkedin_password": "bench",
+            "cv_path": cv_path,
+            "groq_api_key": "bench-key",
+            "phone": "5550100",
+            "zip_code": "94016",
+            "address": "San Francisco, CA",
+            "gender": "Prefer not to say",
+            "pacing_scale": 0,
+            "application_delay_range": [0, 0],
+        }, f)
+    return config_path
+
+
+def count_round_trips():
+    """Count Playwright protocol messages by wrapping Channel.send."""
+    from playwright._impl import _connection
+
+    counter = {"round_trips": 0}
+    original = _connection.Channel.send
+
+    def send(self, *args, **kwargs):
+        counter["round_trips"] += 1
+        return original(self, *args, **kwargs)
+
+    _connection.Channel.send = send
+    return counter
+
+
+def load_app():
+    spec = importlib.util.spec_from_file_location("app_groq", os.path.join(ROOT, "app-groq.py"))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["app_groq"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--engine", choices=["sync", "async"], default="sync")
+    parser.add_argument("--pages", type=int, default=2)
+    parser.add_argument("--llm-latency", type=float, default=0.0,
+                        help="seconds the mock LLM sleeps per call, to mimic a real API")
+    parser.add_argument("--relevance-threshold", type=float, default=0.1,
+                        help="skip jobs scoring below this against the CV (0 = score only)")
+    parser.add_argument("--llm-backend", default="",
+                        help="route every LLM call to this backend (e.g. mock) instead of the mock endpoint")
+    args = parser.parse_args()
+
+    server = FakeLinkedIn(pages=args.pages, llm_latency=args.llm_latency).start()
+    workdir = tempfile.mkdtemp(prefix="autobot-bench-")
+    # Before write_fixtures imports autobot, which reads AUTOBOT_DATA_DIR once
+    os.environ["AUTOBOT_DATA_DIR"] = os.path.join(workdir, "data")
+    os.environ.update({
+        "AUTOBOT_CONFIG": write_fixtures(workdir),
+        "LINKEDIN_BASE_URL": server.base_url,
+        "SEARCH_URL": server.search_url,
+        "GROQ_BASE_URL": server.base_url,
+        "HEADLESS": "1",
+        "PACING_SCALE": "0",
+        "MAX_PAGES": str(args.pages),
+        "RELEVANCE_THRESHOLD": str(args.relevance_threshold),
+        "AUTOBOT_LLM_BACKEND": args.llm_backend,
+    })
+
+    counter = count_round_trips()
+    app = load_app()
+    start = time.perf_counter()
+    app.ENGINES[args.engine]()
+    elapsed = time.perf_counter() - start
+
+    import sqlite3
+    ledger = sqlite3.connect(os.path.join(workdir, "data", "jobs.sqlite3"))
+    applied, steps = ledger.execute(
+        "SELECT COUNT(*), COALESCE(SUM(steps), 0) FROM jobs WHERE status = 'applied'").fetchone()
+    all_steps = ledger.execute("SELECT COALESCE(SUM(steps), 0) FROM jobs").fetchone()[0]
+    low_relevance = ledger.execute("SELECT COUNT(*) FROM jobs WHERE error = 'low relevance'").fetchone()[0]
+    ledger.close()
+    server.stop()
+
+    stats = server.stats
+    # Calls answered in-process never reach the endpoint's counter
+    stats["llm_calls"] += sum(getattr(b, "calls", 0) for b in app.CONTEXT.llm_router.backends.values())
+    print(f"\nEngine: {args.engine}, pages: {args.pages}, mock LLM latency: {args.llm_latency}s"
+          f"{', LLM backend: ' + args.llm_backend if args.llm_backend else ''}")
+    print(f"Wall time:              {elapsed:.1f}s")
+    print(f"Applications submitted: {stats['applications']} (ledger: {applied})")
+    print(f"Applications/min:       {stats['applications'] / (elapsed / 60):.2f}")
+    print(f"Round trips/step:       {counter['round_trips'] / max(1, all_steps):.1f} "
+          f"({counter['round_trips']} over {all_steps} steps)")
+    print(f"LLM calls/application:  {stats['llm_calls'] / max(1, stats['applications']):.2f} "
+          f"({stats['llm_calls']} calls)")
+
+    # A skipped job would otherwise have gone through an average application
+    steps_per_job = steps / max(1, applied)
+    llm_per_job = stats['llm_calls'] / max(1, stats['applications'])
+    print(f"Relevance prefilter:    {low_relevance} jobs below {args.relevance_threshold}, saving about "
+          f"{low_relevance * steps_per_job / args.pages:.1f} modal steps and "
+          f"{low_relevance * llm_per_job / args.pages:.1f} LLM calls per page")
+
+
+if __name__ == "__main__":
+    main()
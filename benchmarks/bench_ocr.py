@@ -0,0 +1,95 @@
+"""Benchmark OCR-based label resolution before and after the OCR engine.
+
+Renders synthetic field-label screenshots (LinkedIn questions repeat a lot,
+so the set has duplicates) and times:
+    baseline - raw pytesseract.image_to_string on every screenshot (old path)
+    cold     - OcrEngine with an empty cache (preprocessing + --psm 7 + pool)
+    warm     - the same screenshots again, served from the pixel-digest cache
+
+Usage:
+    python benchmarks/bench_ocr.py [--labels 40] [--repeat 3]
+"""
+import argparse
+import io
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytesseract
+from PIL import Image, ImageDraw, ImageFont
+
+from autobot.ocr import OcrEngine
+
+QUESTIONS = [
+    "Are you legally authorized to work in the United States?",
+    "Will you now or in the future require sponsorship?",
+    "How many years of experience do you have with Python?",
+    "What is your desired salary?",
+    "Are you comfortable commuting to this job's location?",
+    "Mobile phone number",
+    "Have you completed the following level of education: Bachelor's Degree?",
+    "How many years of work experience do you have with Machine Learning?",
+]
+
+
+def render_label(text, scale=2):
+    """Roughly what element.screenshot() returns for a label on a retina display."""
+    font = ImageFont.load_default()
+    width = 12 + 7 * len(text)
+    image = Image.new("RGB", (width, 24), (255, 255, 255))
+    ImageDraw.Draw(image).text((6, 6), text, fill=(40, 40, 40), font=font)
+    image = image.resize((width * scale, 24 * scale), Image.NEAREST)
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def timed(fn, items):
+    samples = []
+    for item in items:
+        start = time.perf_counter()
+        fn(item)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def report(name, samples):
+    print(f"{name:<10} n={len(samples):<4} mean={statistics.mean(samples):8.2f} ms  "
+          f"p50={statistics.median(samples):8.2f} ms  max={max(samples):8.2f} ms  "
+          f"total={sum(samples) / 1000:6.2f} s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--labels", type=int, default=40, help="screenshots per pass")
+    parser.add_argument("--repeat", type=int, default=3, help="warm passes")
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    screenshots = [render_label(rng.choice(QUESTIONS)) for _ in range(args.labels)]
+
+    baseline = timed(lambda png: pytesseract.image_to_string(Image.open(io.BytesIO(png))).strip(),
+                     screenshots)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = OcrEngine(os.path.join(tmp, "ocr.sqlite3"))
+        cold = timed(lambda png: engine.text(png, "label"), screenshots)
+        warm = []
+        for _ in range(args.repeat):
+            warm += timed(lambda png: engine.text(png, "label"), screenshots)
+        stats = engine.stats()
+        engine.close()
+
+    report("baseline", baseline)
+    report("cold", cold)
+    report("warm", warm)
+    print(f"cache: {stats['hits']} hits / {stats['misses']} misses ({stats['hit_rate']:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Cold-start benchmark for app-groq.py.
+
+Each run is a fresh interpreter that
+    import   - loads app-groq.py (must not read config, parse the CV or open stores)
+    context  - builds the shared objects with CONTEXT.warm(), as start_run() does
+
+First with an empty data directory (SQLite stores created from scratch), then
+again against the directory the first run left behind. Heavy modules that the
+import pulled in are listed, so a new top-level import of PIL, pdfplumber,
+pytesseract or Playwright shows up here. Uses the CV fixture of bench_e2e.py;
+nothing talks to the network.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 5]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+HEAVY_MODULES = ("PIL", "pdfplumber", "pytesseract", "playwright", "numpy", "httpx")
+
+CHILD = """
+import importlib.util, json, sys, time
+start = time.perf_counter()
+spec = importlib.util.spec_from_file_location("app_groq", {app!r})
+app = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(app)
+imported = time.perf_counter() - start
+heavy = [name for name in {heavy!r} if name in sys.modules]
+context = app.CONTEXT.warm()
+print(json.dumps({{"import": imported, "context": context, "heavy": heavy}}))
+"""
+
+
+def run_once(env):
+    code = CHILD.format(app=os.path.join(ROOT, "app-groq.py"), heavy=HEAVY_MODULES)
+    out = subprocess.run([sys.executable, "-c", code], env=env, cwd=ROOT, check=True,
+                         capture_output=True, text=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="autobot-startup-")
+    data_dir = os.path.join(workdir, "data")
+    os.environ["AUTOBOT_DATA_DIR"] = data_dir
+    from bench_e2e import write_fixtures
+
+    env = dict(os.environ, PYTHONPATH=ROOT, AUTOBOT_CONFIG=write_fixtures(workdir),
+               AUTOBOT_LLM_BACKEND="mock", AUTOBOT_LOG_CONSOLE="0")
+
+    first = run_once(env)
+    warm = [run_once(env) for _ in range(args.runs)]
+
+    def ms(values):
+        return f"{1000 * statistics.median(values):7.1f} ms"
+
+    print(f"Runs: 1 empty data dir, {args.runs} warm (medians)")
+    print(f"Import, empty data dir:  {ms([first['import']])}")
+    print(f"Context, empty data dir: {ms([first['context']])}")
+    print(f"Import:                  {ms([r['import'] for r in warm])}")
+    print(f"Context:                 {ms([r['context'] for r in warm])}")
+    print(f"Loaded by the import:    {', '.join(first['heavy']) or 'none of ' + ', '.join(HEAVY_MODULES)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,458 @@
+"""Local stand-in for the LinkedIn pages the bot drives, plus a mock LLM endpoint.
+
+Only the DOM contracts app-groq.py relies on are reproduced:
+    /login                 #username, #password, button[type=submit] -> /feed/,
+                           setting the li_at session cookie
+    /jobs/search/?start=N  redirect to /authwall without that cookie, else
+                           .job-card-container cards (lazy-loaded on scroll),
+                           a detail pane with .jobs-apply-button / .jobs-description,
+                           .artdeco-pagination with a Next button
+    Easy Apply             multi-step .artdeco-modal forms with text, textarea,
+                           select, radio and checkbox fields, required/numeric
+                           validation shown as .artdeco-inline-feedback__message,
+                           Next / Review / Submit application / Done buttons
+    /openai/v1/chat/completions
+                           OpenAI/Groq-compatible mock that answers deterministically
+    /stats                 JSON counters (LLM calls, submitted applications)
+
+Run standalone:  python benchmarks/fake_linkedin.py --port 8765 --pages 2
+"""
+import argparse
+import json
+import re
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+JOBS_PER_PAGE = 25
+
+RELEVANT_TITLES = [
+    ("Machine Learning Intern", "Train and evaluate machine learning models in Python with PyTorch. "
+                                "Work with data pipelines, SQL and model deployment."),
+    ("Data Science Intern", "Analyse datasets with Python, pandas and SQL; build statistical and "
+                            "machine learning models and dashboards."),
+    ("AI Research Intern", "Prototype deep learning models, read papers, run experiments on GPUs "
+                           "with PyTorch and report results."),
+    ("MLOps Engineering Intern", "Build training and deployment pipelines for machine learning models "
+                                 "with Docker, Kubernetes and Python."),
+]
+IRRELEVANT_TITLES = [
+    ("Forklift Operator", "Operate forklifts in a busy warehouse, load trucks and keep inventory "
+                          "areas safe. Night shifts, lifting up to 50 lbs."),
+    ("Registered Nurse", "Provide patient care on a hospital ward, administer medication and "
+                         "coordinate with physicians. RN licence required."),
+]
+COMPANIES = ["Acme AI", "Globex", "Initech", "Umbrella Labs", "Hooli", "Stark Industries"]
+
+# Reused question sets: companies on LinkedIn often share the same forms
+FORMS = [
+    [
+        [{"kind": "text", "id": "phoneNumber", "label": "Mobile phone number", "required": True},
+         {"kind": "text", "label": "How many years of experience do you have with Python?",
+          "numeric": True, "required": True},
+         {"kind": "select", "label": "Are you legally authorized to work in the United States?",
+          "options": ["Select an option", "Yes", "No"], "required": True}],
+        [{"kind": "radio", "label": "Will you now or in the future require sponsorship?",
+          "options": ["Yes", "No"], "required": True},
+         {"kind": "textarea", "label": "Why are you interested in this role?", "required": True},
+         {"kind": "checkbox", "label": "I agree to the terms of the application"}],
+        [],
+    ],
+    [
+        [{"kind": "text", "id": "postalCode-zip", "label": "ZIP code", "required": True},
+         {"kind": "select", "label": "What is your highest level of education?",
+          "options": ["Select an option", "High school", "Bachelor's Degree", "Master's Degree"],
+          "required": True},
+         {"kind": "checkbox", "label": "Follow the company page to stay up to date"}],
+        [],
+    ],
+    [
+        [{"kind": "text", "label": "How many years of work experience do you have with Machine Learning?",
+          "numeric": True, "required": True},
+         {"kind": "radio", "label": "Are you comfortable commuting to this job's location?",
+          "options": ["Yes", "No"], "required": True},
+         {"kind": "radio", "label": "Have you completed the following level of education: Bachelor's Degree?",
+          "options": ["Yes", "No"], "required": True}],
+        [{"kind": "text", "label": "What is your desired salary?", "required": True},
+         {"kind": "select", "label": "Gender", "options": ["Select an option", "Male", "Female",
+                                                            "Non-binary", "Prefer not to say"]}],
+        [],
+    ],
+]
+
+
+def make_jobs(pages, irrelevant_every=5):
+    """Deterministic job list per page."""
+    all_pages = []
+    for page in range(pages):
+        jobs = []
+        for index in range(JOBS_PER_PAGE):
+            n = page * JOBS_PER_PAGE + index
+            if irrelevant_every and n % irrelevant_every == irrelevant_every - 1:
+                title, description = IRRELEVANT_TITLES[n % len(IRRELEVANT_TITLES)]
+            else:
+                title, description = RELEVANT_TITLES[n % len(RELEVANT_TITLES)]
+            jobs.append({
+                "id": 4100000000 + n,
+                "title": title,
+                "company": COMPANIES[n % len(COMPANIES)],
+                "description": description,
+                "applied": n % 11 == 10,
+                "form": n % len(FORMS),
+            })
+        all_pages.append(jobs)
+    return all_pages
+
+
+LOGIN_HTML = """<!doctype html><html><head><title>LinkedIn Login</title></head><body>
+<form method="post" action="/login">
+  <input id="username" name="session_key" type="text">
+  <input id="password" name="session_password" type="password">
+  <button type="submit">Sign in</button>
+</form></body></html>"""
+
+FEED_HTML = """<!doctype html><html><head><title>Feed</title></head><body>
+<nav class="global-nav">Home</nav><main>Feed</main></body></html>"""
+
+SEARCH_HTML = r"""<!doctype html><html><head><title>Jobs</title><style>
+body { font-family: sans-serif; margin: 0; }
+.layout { display: flex; }
+.jobs-search-results-list { width: 40%; list-style: none; margin: 0; padding: 0; }
+.job-card-container { height: 120px; border-bottom: 1px solid #ccc; padding: 8px; }
+.detail { position: fixed; right: 0; top: 0; width: 55%; }
+.artdeco-pagination { padding: 24px; }
+.artdeco-modal { position: fixed; top: 5%; left: 15%; width: 60%; background: #fff;
+                 border: 1px solid #333; padding: 16px; z-index: 10; }
+.fb-field { margin: 8px 0; }
+.artdeco-inline-feedback__message { color: #b00; }
+</style></head><body>
+<div class="layout">
+  <ul class="jobs-search-results-list" id="results"></ul>
+  <div class="detail" id="detail"></div>
+</div>
+<div class="artdeco-pagination" id="pagination"></div>
+<script>
+const JOBS = __JOBS__;
+const FORMS = __FORMS__;
+const PAGE = __PAGE__;
+const PAGES = __PAGES__;
+const BATCH = 7;
+let rendered = 0;
+let loading = false;
+
+function el(tag, attrs, text) {
+  const node = document.createElement(tag);
+  Object.entries(attrs || {}).forEach(([k, v]) => node.setAttribute(k, v));
+  if (text !== undefined) node.textContent = text;
+  return node;
+}
+
+function renderMore() {
+  const list = document.getElementById('results');
+  JOBS.slice(rendered, rendered + BATCH).forEach((job) => {
+    const card = el('li', {'class': 'job-card-container', 'data-job-id': job.id});
+    const link = el('a', {'href': '/jobs/view/' + job.id + '/?trk=fake'}, job.title);
+    link.addEventListener('click', (e) => { e.preventDefault(); selectJob(job); });
+    card.appendChild(link);
+    card.appendChild(el('div', {'class': 'artdeco-entity-lockup__subtitle'}, job.company));
+    if (job.applied) card.appendChild(el('span', {'class': 'job-card-container__footer-item'}, 'Applied 3 days ago'));
+    list.appendChild(card);
+  });
+  rendered = Math.min(JOBS.length, rendered + BATCH);
+  if (rendered >= JOBS.length) renderPagination();
+}
+
+function renderPagination() {
+  const nav = document.getElementById('pagination');
+  if (nav.childElementCount || PAGE + 1 >= PAGES) return;
+  const next = el('button', {'class': 'artdeco-pagination__button--next', 'aria-label': 'View next page'}, 'Next');
+  next.addEventListener('click', () => {
+    const url = new URL(location.href);
+    url.searchParams.set('start', (PAGE + 1) * 25);
+    url.searchParams.delete('currentJobId');
+    location.href = url.toString();
+  });
+  nav.appendChild(next);
+}
+
+window.addEventListener('scroll', () => {
+  if (loading || rendered >= JOBS.length) return;
+  if (window.innerHeight + window.scrollY < document.body.scrollHeight - 50) return;
+  loading = true;
+  setTimeout(() => { renderMore(); loading = false; }, 150);
+});
+
+function selectJob(job) {
+  const url = new URL(location.href);
+  url.searchParams.set('currentJobId', job.id);
+  history.replaceState(null, '', url.toString());
+  const pane = document.getElementById('detail');
+  pane.innerHTML = '';
+  pane.appendChild(el('h2', {'class': 'job-details-jobs-unified-top-card__job-title'}, job.title));
+  pane.appendChild(el('div', {'class': 'job-details-jobs-unified-top-card__company-name'}, job.company));
+  const apply = el('button', {'class': 'jobs-apply-button'}, 'Easy Apply');
+  apply.addEventListener('click', () => openModal(job));
+  pane.appendChild(apply);
+  pane.appendChild(el('div', {'class': 'jobs-description', 'id': 'job-details'}, job.description));
+}
+
+function closeModal() {
+  const modal = document.querySelector('.artdeco-modal');
+  if (modal) modal.remove();
+}
+
+document.addEventListener('keydown', (e) => { if (e.key === 'Escape') closeModal(); });
+
+function openModal(job) {
+  closeModal();
+  const modal = el('div', {'class': 'artdeco-modal', 'role': 'dialog'});
+  document.body.appendChild(modal);
+  renderStep(modal, job, FORMS[job.form], 0);
+}
+
+function fieldError(wrapper, message) {
+  let error = wrapper.querySelector('.artdeco-inline-feedback__message');
+  if (!message) { if (error) error.remove(); return; }
+  if (!error) { error = el('div', {'class': 'artdeco-inline-feedback__message'}); wrapper.appendChild(error); }
+  error.textContent = message;
+}
+
+function validate(wrapper, spec) {
+  let value = '';
+  if (spec.kind === 'radio') {
+    const checked = wrapper.querySelector('input:checked');
+    value = checked ? checked.value : '';
+  } else if (spec.kind === 'checkbox') {
+    value = 'ok';
+  } else {
+    value = wrapper.querySelector('input, textarea, select').value.trim();
+    if (spec.kind === 'select' && value === 'Select an option') value = '';
+  }
+  if (spec.required && !value) { fieldError(wrapper, 'Please make a selection'); return false; }
+  if (spec.numeric && value && !/^\d+$/.test(value)) {
+    fieldError(wrapper, 'Enter a whole number between 0 and 99');
+    return false;
+  }
+  fieldError(wrapper, '');
+  return true;
+}
+
+function renderField(spec, key) {
+  const wrapper = el('div', {'class': 'fb-field'});
+  const id = (spec.id || 'field') + '-' + key;
+  if (spec.kind === 'text' || spec.kind === 'textarea') {
+    wrapper.appendChild(el('label', {'for': id}, spec.label));
+    const input = spec.kind === 'text' ? el('input', {'type': 'text', 'id': id}) : el('textarea', {'id': id});
+    if (spec.required) input.required = true;
+    input.addEventListener('input', () => { if (spec.numeric) validate(wrapper, spec); });
+    wrapper.appendChild(input);
+  } else if (spec.kind === 'select') {
+    wrapper.appendChild(el('label', {'for': id}, spec.label));
+    const select = el('select', {'id': id});
+    spec.options.forEach((o) => select.appendChild(el('option', {'value': o}, o)));
+    wrapper.appendChild(select);
+  } else if (spec.kind === 'radio') {
+    const fieldset = el('fieldset');
+    fieldset.appendChild(el('legend', {}, spec.label));
+    spec.options.forEach((o, i) => {
+      fieldset.appendChild(el('input', {'type': 'radio', 'name': id, 'id': id + '-' + i, 'value': o}));
+      fieldset.appendChild(el('label', {'for': id + '-' + i}, o));
+    });
+    wrapper.appendChild(fieldset);
+  } else if (spec.kind === 'checkbox') {
+    wrapper.appendChild(el('input', {'type': 'checkbox', 'id': id}));
+    wrapper.appendChild(el('label', {'for': id}, spec.label));
+  }
+  return wrapper;
+}
+
+function renderStep(modal, job, steps, index) {
+  modal.innerHTML = '';
+  modal.appendChild(el('h2', {}, 'Apply to ' + job.company));
+  const wrappers = steps[index].map((spec, i) => {
+    const wrapper = renderField(spec, job.id + '-' + index + '-' + i);
+    modal.appendChild(wrapper);
+    return wrapper;
+  });
+  const last = index === steps.length - 1;
+  const label = last ? 'Submit application' : (index === steps.length - 2 ? 'Review' : 'Next');
+  const button = el('button', {'type': 'button'}, label);
+  button.addEventListener('click', () => {
+    const ok = steps[index].map((spec, i) => validate(wrappers[i], spec)).every(Boolean);
+    if (!ok) return;
+    if (!last) { renderStep(modal, job, steps, index + 1); return; }
+    fetch('/api/applied?job=' + job.id, {method: 'POST'});
+    modal.innerHTML = '';
+    modal.appendChild(el('p', {}, 'Your application was sent to ' + job.company));
+    const done = el('button', {'type': 'button'}, 'Done');
+    done.addEventListener('click', closeModal);
+    modal.appendChild(done);
+  });
+  modal.appendChild(button);
+}
+
+renderMore();
+</script></body></html>"""
+
+
+def _schema_from_prompt(prompt):
+    start = prompt.rfind('{"type": "object"')
+    if start < 0:
+        return None
+    try:
+        return json.loads(prompt[start:])
+    except ValueError:
+        return None
+
+
+def mock_llm_answer(messages):
+    """Deterministic answer for the prompts app-groq.py sends."""
+    prompt = messages[-1]["content"] if messages else ""
+    schema = _schema_from_prompt(prompt)
+    if schema:
+        answers = {}
+        for key, prop in schema.get("properties", {}).items():
+            enum = prop.get("enum")
+            if enum:
+                answers[key] = "Yes" if "Yes" in enum else enum[min(1, len(enum) - 1)]
+            else:
+                answers[key] = "3"
+        return json.dumps(answers)
+    match = re.search(r"Options: (.+)", prompt)
+    if match:
+        options = [o.strip() for o in match.group(1).split(" | ")]
+        return "Yes" if "Yes" in options else options[-1]
+    if "tick this box" in prompt:
+        return "no"
+    if re.search(r"salary|years|how many", prompt, re.IGNORECASE):
+        return "3"
+    return "I am excited to apply my machine learning skills to this role."
+
+
+class FakeLinkedIn:
+    """Threaded HTTP server with request counters."""
+
+    def __init__(self, host="127.0.0.1", port=0, pages=2, irrelevant_every=5, llm_latency=0.0):
+        self.pages = make_jobs(pages, irrelevant_every)
+        self.llm_latency = llm_latency
+        self.stats = {"llm_calls": 0, "llm_prompt_chars": 0, "applications": 0, "page_loads": 0,
+                      "logins": 0}
+        self._lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer((host, port), self._handler())
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def search_url(self):
+        return f"{self.base_url}/jobs/search/?keywords=machine%20learning%20intern&f_AL=true"
+
+    def count(self, key, amount=1):
+        with self._lock:
+            self.stats[key] += amount
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send(self, body, status=200, content_type="text/html; charset=utf-8", headers=None):
+                data = body.encode("utf-8") if isinstance(body, str) else body
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                url = urllib.parse.urlparse(self.path)
+                query = urllib.parse.parse_qs(url.query)
+                if url.path in ("/login", "/authwall"):
+                    self._send(LOGIN_HTML)
+                elif url.path.startswith("/feed"):
+                    self._send(FEED_HTML)
+                elif url.path.startswith("/jobs/search") and "li_at=" not in (self.headers.get("Cookie") or ""):
+                    self._send("", status=302, headers={"Location": "/authwall?sessionRedirect="
+                                                                    + urllib.parse.quote(self.path)})
+                elif url.path.startswith("/jobs/search"):
+                    server.count("page_loads")
+                    index = int(query.get("start", ["0"])[0]) // JOBS_PER_PAGE
+                    jobs = server.pages[index] if index < len(server.pages) else []
+                    html = (SEARCH_HTML.replace("__JOBS__", json.dumps(jobs))
+                            .replace("__FORMS__", json.dumps(FORMS))
+                            .replace("__PAGE__", str(index))
+                            .replace("__PAGES__", str(len(server.pages))))
+                    self._send(html)
+                elif url.path == "/stats":
+                    self._send(json.dumps(server.stats), content_type="application/json")
+                else:
+                    self._send("Not found", status=404)
+
+            def do_POST(self):
+                url = urllib.parse.urlparse(self.path)
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                if url.path == "/login":
+                    server.count("logins")
+                    self._send("", status=303, headers={"Location": "/feed/",
+                                                        "Set-Cookie": "li_at=fake-session; Path=/"})
+                elif url.path == "/api/applied":
+                    server.count("applications")
+                    self._send("{}", content_type="application/json")
+                elif url.path.endswith("/chat/completions"):
+                    request = json.loads(body or b"{}")
+                    messages = request.get("messages", [])
+                    server.count("llm_calls")
+                    server.count("llm_prompt_chars", sum(len(m.get("content", "")) for m in messages))
+                    if server.llm_latency:
+                        time.sleep(server.llm_latency)
+                    content = mock_llm_answer(messages)
+                    self._send(json.dumps({
+                        "id": "chatcmpl-fake",
+                        "object": "chat.completion",
+                        "created": int(time.time()),
+                        "model": request.get("model", "mock"),
+                        "choices": [{"index": 0, "finish_reason": "stop",
+                                     "message": {"role": "assistant", "content": content}}],
+                        "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+                    }), content_type="application/json")
+                else:
+                    self._send("Not found", status=404)
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local LinkedIn stand-in for tests and benchmarks")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--pages", type=int, default=2)
+    args = parser.parse_args()
+    server = FakeLinkedIn(port=args.port, pages=args.pages).start()
+    print(f"Fake LinkedIn at {server.base_url}  (search: {server.search_url})")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,12 @@
 import React, { useState } from 'react';
 import axios from 'axios';
 import { Play, Loader2 } from 'lucide-react';
+import RunProgress from './RunProgress';
 
 function App() {
   const [loading, setLoading] = useState(false);
   const [status, setStatus] = useState({ type: '', message: '' });
+  const [runId, setRunId] = useState(null);
 
   const [formData, setFormData] = useState({
     groq_api_key: '',
@@ -37,9 +39,14 @@ function App() {
     setLoading(true);
     setStatus({ type: '', message: '' });
     try {
-      await axios.post('http://localhost:8000/api/start', formData);
-      setStatus({ type: 'success', message: 'Agent started — watch your terminal for live logs.' });
+      const { data } = await axios.post('http://localhost:8000/api/start', formData);
+      setRunId(data.run_id);
+      setStatus({ type: 'success', message: 'Agent started — live progress below.' });
     } catch (err) {
+      if (err.response?.status === 409) {
+        setStatus({ type: 'error', message: 'A run is already in progress — stop it before starting another.' });
+        return;
+      }
       setStatus({ type: 'error', message: 'Could not reach backend. Is server.py running?' });
     } finally {
       setLoading(false);
@@ -177,6 +184,8 @@ function App() {
         )}
       </form>
 
+      <RunProgress runId={runId} />
+
       <div className="footer">
         ⚠️ For educational &amp; research purposes only.<br />
         Automated job applications violate LinkedIn's Terms of Service.
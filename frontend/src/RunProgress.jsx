@@ -0,0 +1,94 @@
+import React, { useEffect, useRef, useState } from 'react';
+import axios from 'axios';
+import { Square } from 'lucide-react';
+
+const API = 'http://localhost:8000';
+// Recent events replayed when the page opens, and log lines kept on screen
+const REPLAY_EVENTS = 200;
+const MAX_LOG_LINES = 300;
+
+function RunProgress({ runId }) {
+  const [run, setRun] = useState({ state: 'idle' });
+  const [progress, setProgress] = useState({});
+  const [logs, setLogs] = useState([]);
+  const [stopping, setStopping] = useState(false);
+  const logRef = useRef(null);
+
+  useEffect(() => {
+    let source;
+    let cancelled = false;
+
+    axios.get(`${API}/api/status`).then(({ data }) => {
+      if (cancelled) return;
+      setRun(data);
+      setProgress(data.progress || {});
+      const offset = Math.max(0, (data.next_offset || 0) - REPLAY_EVENTS);
+      // EventSource reconnects by itself and resumes from Last-Event-ID
+      source = new EventSource(`${API}/api/events?offset=${offset}`);
+      source.addEventListener('log', (e) => {
+        const { msg } = JSON.parse(e.data);
+        setLogs(prev => [...prev.slice(-(MAX_LOG_LINES - 1)), msg]);
+      });
+      source.addEventListener('progress', (e) => setProgress(JSON.parse(e.data)));
+      source.addEventListener('run', (e) => {
+        const event = JSON.parse(e.data);
+        setRun(prev => ({ ...prev, ...event }));
+        if (event.state === 'running') setLogs([]);
+      });
+    }).catch(() => setRun({ state: 'unreachable' }));
+
+    return () => {
+      cancelled = true;
+      if (source) source.close();
+    };
+  }, [runId]);
+
+  useEffect(() => {
+    if (logRef.current) logRef.current.scrollTop = logRef.current.scrollHeight;
+  }, [logs]);
+
+  const handleStop = async () => {
+    setStopping(true);
+    try {
+      await axios.post(`${API}/api/stop`);
+    } finally {
+      setStopping(false);
+    }
+  };
+
+  if (run.state === 'idle' || run.state === 'unreachable') return null;
+
+  const active = run.state === 'running' || run.state === 'stopping';
+  const stats = [
+    ['Page', progress.page ?? '–'],
+    ['Job', progress.job_id ?? '–'],
+    ['Step', progress.step ?? '–'],
+    ['Applied', progress.applied ?? 0],
+    ['Skipped', progress.skipped ?? 0],
+    ['Failed', progress.failed ?? 0],
+  ];
+
+  return (
+    <div className="section">
+      <div className="section-label">
+        Run {run.run_id} · {run.state}{run.exit_code != null && ` (exit ${run.exit_code})`}
+      </div>
+      <div className="progress-grid">
+        {stats.map(([label, value]) => (
+          <div className="progress-stat" key={label}>
+            <span className="progress-value">{value}</span>
+            <span className="progress-label">{label}</span>
+          </div>
+        ))}
+      </div>
+      <pre className="log-view" ref={logRef}>{logs.join('\n')}</pre>
+      {active && (
+        <button type="button" className="submit-btn stop-btn" onClick={handleStop} disabled={stopping}>
+          <Square size={14} /> {stopping || run.state === 'stopping' ? 'Stopping…' : 'Stop Automation'}
+        </button>
+      )}
+    </div>
+  );
+}
+
+export default RunProgress;
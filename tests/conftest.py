@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The autobot package lives at the repo root, which has no packaging setup
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,62 @@
+import threading
+import time
+
+from autobot.answer_cache import AnswerCache, normalize_question
+
+
+def test_answer_is_cached_and_reused(tmp_path):
+    cache = AnswerCache(str(tmp_path / "answers.db"))
+    calls = []
+    compute = lambda: calls.append(1) or "5"
+
+    assert cache.get_or_compute("How many years of Python?", "text", compute) == "5"
+    assert cache.get_or_compute("how many  years of python", "text", compute) == "5"
+    assert len(calls) == 1
+    assert cache.stats()["hits"] == 1
+
+
+def test_empty_answer_is_not_cached(tmp_path):
+    cache = AnswerCache(str(tmp_path / "answers.db"))
+
+    assert cache.get_or_compute("Website?", "text", lambda: "") == ""
+    assert cache.get_or_compute("Website?", "text", lambda: None) is None
+    assert cache.stats()["size"] == 0
+    assert cache.get_or_compute("Website?", "text", lambda: "https://example.com") == "https://example.com"
+
+
+def test_options_are_part_of_the_key(tmp_path):
+    cache = AnswerCache(str(tmp_path / "answers.db"))
+    cache.get_or_compute("Degree?", "select", lambda: "Bachelor's", options=["Bachelor's", "Master's"])
+
+    assert cache.contains(cache.make_key("Degree?", "select", ["Master's", "Bachelor's"]))
+    assert not cache.contains(cache.make_key("Degree?", "select", ["Bachelor's", "PhD"]))
+
+
+def test_concurrent_callers_share_one_compute(tmp_path):
+    cache = AnswerCache(str(tmp_path / "answers.db"))
+    release = threading.Event()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        release.wait(5)
+        return "Yes"
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_compute("Relocate?", "text", compute)))
+               for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    # Every caller is either computing or waiting for that computation
+    while cache.deduped + len(calls) < 4:
+        time.sleep(0.01)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["Yes"] * 4
+    assert len(calls) == 1
+
+
+def test_normalize_question():
+    assert normalize_question("  What's your PHONE number?* ") == normalize_question("what's your phone number")
@@ -0,0 +1,31 @@
+import json
+
+from autobot.batch_answers import batch_schema, build_batch_prompt, parse_batch_response
+
+QUESTIONS = [
+    {"id": "q1", "kind": "text", "question": "Years of Python?"},
+    {"id": "q2", "kind": "select", "question": "Degree?", "options": ["Bachelor's", "Master's"]},
+    {"id": "q3", "kind": "checkbox", "question": "I agree to the terms"},
+]
+
+
+def test_prompt_lists_every_question_and_the_schema():
+    prompt = build_batch_prompt(QUESTIONS, "CV: ...")
+
+    assert prompt.startswith("CV: ...\n")
+    assert all(f'"{q["id"]}"' in prompt for q in QUESTIONS)
+    assert json.dumps(batch_schema(QUESTIONS)) in prompt
+
+
+def test_answers_are_validated_against_the_questions():
+    response = 'Sure! {"q1": 5, "q2": "master\'s", "q3": "yes", "q9": "extra"}'
+
+    assert parse_batch_response(response, QUESTIONS) == {"q1": "5", "q2": "Master's", "q3": "Yes"}
+
+
+def test_unusable_answers_are_left_for_per_field_calls():
+    response = '{"q1": "", "q2": "PhD", "q3": ["Yes"]}'
+
+    assert parse_batch_response(response, QUESTIONS) == {}
+    assert parse_batch_response("not json {", QUESTIONS) == {}
+    assert parse_batch_response(None, QUESTIONS) == {}
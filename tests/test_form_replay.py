@@ -0,0 +1,59 @@
+from autobot.form_replay import FormMemory
+
+
+def step(phone="", relocate=None, agree=False, label="Mobile phone number"):
+    return [
+        {"kind": "text", "label": label, "options": [], "value": phone,
+         "visible": True, "enabled": True, "checked": False},
+        {"kind": "radio", "label": "Willing to relocate?", "value": "", "visible": True, "enabled": True,
+         "checked": relocate is not None,
+         "options": [{"label": "Yes", "checked": relocate == "Yes"}, {"label": "No", "checked": relocate == "No"}]},
+        {"kind": "checkbox", "label": "I agree to the terms", "options": [], "value": "",
+         "visible": True, "enabled": True, "checked": agree},
+    ]
+
+
+def test_submitted_step_is_replayed(tmp_path):
+    memory = FormMemory(str(tmp_path / "forms.db"), profile="p1")
+    filled = step("555-0100", "Yes", True)
+    memory.stage(memory.fingerprint(filled), filled)
+    memory.commit()
+
+    blank = step()
+    actions = memory.plan(memory.fingerprint(blank), blank)
+    assert [(info["kind"], answer) for info, answer in actions] == [
+        ("text", "555-0100"), ("radio", "Yes"), ("checkbox", True)]
+    assert all(info.get("replayed") for info in blank)
+    assert memory.stats()["hits"] == 1
+
+
+def test_fingerprint_ignores_values_but_not_labels_or_profile(tmp_path):
+    memory = FormMemory(str(tmp_path / "forms.db"), profile="p1")
+    other_profile = FormMemory(str(tmp_path / "other.db"), profile="p2")
+
+    assert memory.fingerprint(step()) == memory.fingerprint(step("555-0100", "No", True))
+    assert memory.fingerprint(step()) != memory.fingerprint(step(label="Home phone"))
+    assert memory.fingerprint(step()) != other_profile.fingerprint(step())
+
+
+def test_only_submitted_applications_are_stored(tmp_path):
+    memory = FormMemory(str(tmp_path / "forms.db"))
+    filled = step("555-0100")
+    fingerprint = memory.fingerprint(filled)
+    memory.stage(fingerprint, filled)
+    memory.discard()
+    memory.commit()
+
+    assert memory.plan(fingerprint, step()) == []
+    assert memory.stats() == {"hits": 0, "misses": 1, "replayed_fields": 0, "size": 0}
+
+
+def test_forgotten_step_is_not_replayed(tmp_path):
+    memory = FormMemory(str(tmp_path / "forms.db"))
+    filled = step("555-0100")
+    fingerprint = memory.fingerprint(filled)
+    memory.stage(fingerprint, filled)
+    memory.commit()
+    memory.forget(fingerprint)
+
+    assert memory.plan(fingerprint, step()) == []
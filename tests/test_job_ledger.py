@@ -0,0 +1,72 @@
+import sqlite3
+
+from autobot.job_ledger import JobLedger, parse_job_id
+
+
+def test_failed_job_is_retried_up_to_three_attempts(tmp_path):
+    ledger = JobLedger(str(tmp_path / "jobs.db"))
+    for _ in range(2):
+        ledger.record(101, "seen")
+        ledger.record(101, "failed", error="LLM unavailable")
+        assert not ledger.done(101)
+
+    ledger.record(101, "seen")
+    ledger.record(101, "failed")
+    assert ledger.done(101)
+
+
+def test_attempts_survive_a_restart(tmp_path):
+    path = str(tmp_path / "jobs.db")
+    ledger = JobLedger(path)
+    for _ in range(3):
+        ledger.record(7, "seen")
+    ledger.close()
+
+    reopened = JobLedger(path)
+    assert reopened.status(7) == "seen"
+    assert reopened.done(7)
+
+
+def test_final_statuses_are_skipped_at_once(tmp_path):
+    ledger = JobLedger(str(tmp_path / "jobs.db"))
+    ledger.record(1, "seen")
+    ledger.record(1, "applied", steps=4)
+    ledger.record(2, "skipped", relevance=0.1)
+
+    assert ledger.done(1) and ledger.done(2)
+    assert not ledger.done(3)
+    assert ledger.counts() == {"seen": 0, "skipped": 1, "applied": 1, "failed": 0}
+
+
+def test_set_relevance_does_not_count_a_status(tmp_path):
+    path = str(tmp_path / "jobs.db")
+    ledger = JobLedger(path)
+    ledger.record(5, "seen")
+    ledger.set_relevance(5, 0.8)
+
+    assert ledger.session_counts["seen"] == 1
+    assert ledger.status(5) == "seen"
+    ledger.close()
+    with sqlite3.connect(path) as conn:
+        assert conn.execute("SELECT relevance, attempts FROM jobs WHERE job_id = 5").fetchone() == (0.8, 1)
+
+
+def test_old_ledger_counts_one_attempt_per_job(tmp_path):
+    path = str(tmp_path / "jobs.db")
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE jobs (job_id INTEGER PRIMARY KEY, status TEXT NOT NULL,"
+                     " first_seen REAL NOT NULL, updated_at REAL NOT NULL,"
+                     " steps INTEGER NOT NULL DEFAULT 0, error TEXT)")
+        conn.execute("INSERT INTO jobs VALUES (9, 'failed', 0, 0, 0, 'timeout')")
+
+    ledger = JobLedger(path, max_attempts=2)
+    assert not ledger.done(9)
+    ledger.record(9, "seen")
+    assert ledger.done(9)
+
+
+def test_parse_job_id():
+    assert parse_job_id("/jobs/view/senior-engineer-at-acme-3912345678/?refId=x") == 3912345678
+    assert parse_job_id("https://www.linkedin.com/jobs/search/?currentJobId=42&keywords=python") == 42
+    assert parse_job_id("/company/acme/") is None
+    assert parse_job_id(None) is None
@@ -0,0 +1,36 @@
+import pytest
+
+from autobot.llm_backends import LLMRouter, MockBackend, question_type
+from autobot.question_rules import RuleEngine
+
+
+def test_only_yes_no_choices_are_yes_no():
+    assert question_type("Are you authorized to work?", "select", ["Yes", "No"]) == "yes_no"
+    assert question_type("Are you authorized to work?", "radio", ["yes", " No "]) == "yes_no"
+    assert question_type("Is there anything else we should know?", "text") == "text"
+    assert question_type("Degree?", "select", ["Bachelor's", "Master's"]) == "select"
+    assert question_type("I agree", "checkbox") == "checkbox"
+
+
+def test_text_questions_are_typed_by_the_rules():
+    assert question_type("How many years of experience with Go?") == "numeric"
+
+    rules = RuleEngine.from_config([{"keywords": ["salary"], "type": "numeric", "kinds": ["text"]}])
+    assert question_type("Expected salary?") == "text"
+    assert question_type("Expected salary?", rules=rules) == "numeric"
+
+
+def test_every_type_goes_to_groq_unless_routed():
+    router = LLMRouter.from_settings({"backends": {"offline": {"type": "mock"}},
+                                      "routes": {"yes_no": "offline"}}, "http://groq.invalid", "")
+    try:
+        assert isinstance(router.backend_for("yes_no"), MockBackend)
+        assert router.backend_for("text").name == "groq"
+        assert router.backend_for("numeric").name == "groq"
+    finally:
+        router.close()
+
+
+def test_route_to_an_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        LLMRouter.from_settings({"routes": {"text": "nowhere"}}, "http://groq.invalid", "")
@@ -0,0 +1,60 @@
+import pytest
+
+from autobot.question_rules import RuleEngine
+
+
+def test_user_rules_take_priority_over_defaults():
+    engine = RuleEngine.from_config([{"keywords": ["sponsorship", "visa"], "answer": "No", "kinds": ["select"]}])
+
+    assert engine.resolve("Do you require visa sponsorship?", "select", {}) == (engine.rules[0], "No")
+    assert engine.resolve("Do you require visa sponsorship?", "checkbox", {}) == (None, None)
+
+
+def test_empty_preference_falls_through_to_the_next_rule():
+    engine = RuleEngine.from_config([{"keywords": ["address"], "field": "middle_name"}])
+
+    rule, answer = engine.resolve("What is your address?", "text", {"address": "1 Main St", "middle_name": ""})
+    assert rule["name"] == "address"
+    assert answer == "1 Main St"
+
+
+def test_type_rule_yields_no_answer():
+    engine = RuleEngine.from_config()
+
+    rule, answer = engine.resolve("How many years of experience with Django?", "text", {})
+    assert rule["type"] == "numeric"
+    assert answer is None
+    assert engine.question_type("How many years of experience with Django?") == "numeric"
+
+
+def test_overlapping_keywords_match_every_rule():
+    engine = RuleEngine([
+        {"keywords": ["year"], "answer": "a"},
+        {"keywords": ["years of"], "answer": "b"},
+        {"keywords": ["ears"], "answer": "c"},
+        {"pattern": r"\bdjango\b", "answer": "d"},
+        {"keywords": ["golang"], "answer": "e"},
+    ])
+
+    matched = engine.matches("Years of Django?", "text")
+    assert [rule["answer"] for rule in matched] == ["a", "b", "c", "d"]
+
+
+def test_many_rules_match_like_one():
+    rules = [{"keywords": [f"skill{i}x"], "answer": str(i)} for i in range(1000)]
+    engine = RuleEngine(rules)
+
+    assert [rule["answer"] for rule in engine.matches("Do you know skill998x or skill3x?")] == ["3", "998"]
+
+
+@pytest.mark.parametrize("rule", [
+    {"answer": "Yes"},
+    {"keywords": ["visa"]},
+    {"keywords": ["visa", " "], "answer": "No"},
+    {"keywords": ["salary"], "type": "salary"},
+    {"pattern": "notice (period", "answer": "2 weeks"},
+    {"pattern": "x*", "answer": "2 weeks"},
+])
+def test_invalid_rules_are_rejected(rule):
+    with pytest.raises(ValueError):
+        RuleEngine([rule])